@@ -3,7 +3,7 @@ import os
 # import argparse
 import json
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from whisper.utils import str2bool, optional_float, optional_int
 import whisper_timestamped as whisper
@@ -175,7 +175,10 @@ def write_results(result, output_dir: Path, base_name: str, output_formats = ['j
     return output_files
 
 
-def process_recordings(recordings_dir: Path, output_dir=None, video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.m4v'], model_path_root: Path = Path(r'F:\AITEMP\whisper_models')):
+def process_recordings(recordings_dir: Path, output_dir=None, video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.m4v'], model_path_root: Path = Path(r'F:\AITEMP\whisper_models'), only_files: Optional[List[Path]] = None):
+    """ Transcribes the videos in recordings_dir with one of the video_extensions (or only the given only_files, e.g. those the watcher has seen
+    appear, skipping the directory scan), loading the model once for all of them.
+    """
     # Define the recordings directory
     if isinstance(recordings_dir, str):
         recordings_dir = Path(recordings_dir).resolve()
@@ -190,6 +193,19 @@ def process_recordings(recordings_dir: Path, output_dir=None, video_extensions =
     output_dir.mkdir(exist_ok=True)
     print(f'\t transcriptions will output to output_dir: "{output_dir.as_posix()}"')
     
+    # Get all video files in the recordings directory
+    if only_files is not None:
+        video_files = [Path(a_file) for a_file in only_files]
+    else:
+        video_files = []
+        for ext in video_extensions:
+            video_files.extend(recordings_dir.glob(f"*{ext}"))
+            video_files.extend(recordings_dir.glob(f"*{ext.upper()}"))
+
+    if not video_files:
+        print(f"No video files found in {recordings_dir}")
+        return
+
     # Load the model once
     print(f"Loading Whisper model at model_path_root: '{model_path_root.as_posix()}'...")
     model_path_root = model_path_root.resolve()
@@ -200,13 +216,6 @@ def process_recordings(recordings_dir: Path, output_dir=None, video_extensions =
     model = whisper.load_model(model_name, download_root=model_path_root) # , backend='transformers', device='cuda'
     # model = whisper.load_model("medium.en", backend='transformers') # , download_root=model_path_root.as_posix()
     
-    # Get all video files in the recordings directory
-    
-    video_files = []
-    for ext in video_extensions:
-        video_files.extend(recordings_dir.glob(f"*{ext}"))
-        video_files.extend(recordings_dir.glob(f"*{ext.upper()}"))
-    
 
     progress_files = []
     output_dir
@@ -215,10 +224,6 @@ def process_recordings(recordings_dir: Path, output_dir=None, video_extensions =
     alias_dir = recordings_dir.parent / "edf_video_aliases"
     alias_dir.mkdir(exist_ok=True)
 
-    if not video_files:
-        print(f"No video files found in {recordings_dir}")
-        return
-    
     print(f"Found {len(video_files)} video files to process")
     
     output_files = {'json': {}, 'srt': {}, 'csv': {}}
@@ -6,13 +6,110 @@ with absolute timestamps and multi-modal analysis support.
 import pandas as pd
 import numpy as np
 import mne
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 import json
+import os
+import sys
 from parse_video_filename import parse_video_filename
 from typing import List, Dict, Tuple, Optional, Union
 from process_recordings import find_extant_output_files, write_results, process_recordings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow.csv as pac
+except ImportError:
+    pac = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# memoized wrapper (the imported function itself is left untouched) so repeated basenames skip the regex/strptime work
+_cached_parse_video_filename = lru_cache(maxsize=4096)(parse_video_filename)
+
+_LARGE_TRANSCRIPT_BYTES: int = 32 * 1024 * 1024 # transcripts at least this big are checked for segments with a streaming parser before being fully loaded
+_TRANSCRIPT_CSV_COLUMNS: List[str] = ['text', 'start', 'end'] # as written by `whisper_timestamped.transcribe.write_csv`
+
+
+@dataclass(slots=True)
+class _LSLSample:
+    """ A single transcript marker sample of an LSL stream. Kept as one slotted record (instead of a nested pair of dicts) to keep per-segment allocations small. """
+    timestamp: float
+    text: str
+    duration: float
+    start_offset: float
+    end_offset: float
+    confidence: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """ Returns the nested `{"timestamp": ..., "data": {...}}` layout used in the serialized LSL JSON. """
+        return {
+            "timestamp": self.timestamp,
+            "data": {
+                "text": self.text,
+                "duration": self.duration,
+                "start_offset": self.start_offset,
+                "end_offset": self.end_offset,
+                "confidence": self.confidence,
+            }
+        }
+
+
+class _LSLStreamData(dict):
+    """ Columnar LSL stream data: one list (or array) per sample field instead of one record per sample.
+
+    `samples` rebuilds the legacy per-sample `_LSLSample` records on demand for consumers that still want them.
+    """
+    @property
+    def samples(self) -> List[_LSLSample]:
+        columns = [(self[k].tolist() if isinstance(self[k], np.ndarray) else self[k]) for k in ('timestamps', 'text', 'duration', 'start_offset', 'end_offset', 'confidence')]
+        return [_LSLSample(*fields) for fields in zip(*columns)]
+
+
+def _json_default(obj):
+    """ `default=` hook for JSON serialization of LSL stream data """
+    if isinstance(obj, _LSLSample):
+        return obj.to_dict()
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _dumps(obj) -> bytes:
+    """ Serializes `obj` to indented UTF-8 JSON bytes, using `orjson` when it is available """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """ Parses UTF-8 JSON bytes, using `orjson` when it is available """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _has_segments(a_file: Path) -> bool:
+    """ Cheaply checks whether a transcript JSON file has any segments, without materializing the whole document when it is large """
+    file_size: int = a_file.stat().st_size
+    if file_size == 0:
+        return False
+    if (file_size < _LARGE_TRANSCRIPT_BYTES) or (ijson is None):
+        return True # small enough that a full parse is cheap, so just let the caller load it
+    with open(a_file, 'rb') as f:
+        return next(ijson.items(f, 'segments.item'), None) is not None
+
+
 class VideoTranscriptToLabStreamingLayer:
     """
     Convert whisper transcript CSV to LSL (Lab Streaming Layer) compatible format
@@ -20,17 +117,35 @@ class VideoTranscriptToLabStreamingLayer:
     """
 
     @classmethod
-    def add_absolute_timestamps(cls, segments: List, file_basename: Union[datetime, Path, str]) -> List:
+    def read_transcript_csv(cls, csv_path: Union[str, Path]) -> pd.DataFrame:
+        """ Reads a whisper transcript CSV (columns: text, start, end) into a DataFrame.
+
+        Handles both the headerless CSVs written by the `whisper_timestamped` CLI and the ones with a "text,start,end" header row written by `process_recordings`.
+        Uses the multi-threaded `pyarrow` CSV reader (with Arrow-backed columns) when available, falling back to `pd.read_csv` otherwise.
+        """
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            has_header: bool = (f.readline().strip() == ','.join(_TRANSCRIPT_CSV_COLUMNS))
+        if pac is not None:
+            table = pac.read_csv(Path(csv_path).as_posix(), read_options=pac.ReadOptions(column_names=_TRANSCRIPT_CSV_COLUMNS, skip_rows=(1 if has_header else 0)), parse_options=pac.ParseOptions(newlines_in_values=False))
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return pd.read_csv(csv_path, header=(0 if has_header else None), names=_TRANSCRIPT_CSV_COLUMNS)
+
+
+    @classmethod
+    def add_absolute_timestamps(cls, segments: Union[List, str, Path], file_basename: Union[datetime, Path, str]) -> List:
         """
         Parse transcript CSV and add absolute datetime timestamps.
 
         Args:
-            csv_path: Path to the whisper transcript CSV file
-            video_filename: Video filename to parse date from. If None, inferred from csv_path.
+            segments: list of transcript segment dicts, or the path to a whisper transcript CSV file
+            file_basename: Video filename to parse date from (or the recording start datetime itself).
 
         Returns:
-            DataFrame with absolute datetime columns added
+            List of segment dicts with absolute datetime keys added
         """
+        if isinstance(segments, (str, Path)):
+            segments = cls.read_transcript_csv(segments).to_dict('records')
+
         # We need the recording start absolute datetime, so get this as provided or from the provided basename
         base_datetime = None
         if isinstance(file_basename, datetime):
@@ -43,39 +158,61 @@ class VideoTranscriptToLabStreamingLayer:
 
             # Parse the base datetime from video filename
             try:
-                base_datetime = parse_video_filename(file_basename)
+                base_datetime = _cached_parse_video_filename(file_basename)
             except ValueError as e:
                 raise ValueError(f"Could not parse datetime from filename '{file_basename}': {e}")
 
         assert base_datetime is not None
-        # Convert relative timestamps to absolute datetimes
-        for a_segment in segments:
-            a_segment['absolute_start'] = base_datetime + timedelta(seconds=a_segment['start'])
-            a_segment['absolute_end'] = base_datetime + timedelta(seconds=a_segment['end']) 
+        # Convert relative timestamps to absolute datetimes (vectorized, rounded to the microsecond resolution of `datetime`)
+        n_segments: int = len(segments)
+        starts = np.fromiter((a_segment['start'] for a_segment in segments), dtype=np.float64, count=n_segments)
+        ends = np.fromiter((a_segment['end'] for a_segment in segments), dtype=np.float64, count=n_segments)
+        base_timestamp = pd.Timestamp(base_datetime)
+        abs_starts = (base_timestamp + pd.to_timedelta(starts, unit='s')).round('us').to_pydatetime()
+        abs_ends = (base_timestamp + pd.to_timedelta(ends, unit='s')).round('us').to_pydatetime()
+        # POSIX timestamps are just the base timestamp shifted by the offsets, so compute the conversion once rather than per segment
+        abs_start_timestamps = (base_datetime.timestamp() + starts).tolist()
+        for a_segment, abs_start, abs_end, abs_start_ts in zip(segments, abs_starts, abs_ends, abs_start_timestamps):
+            a_segment['absolute_start'] = abs_start
+            a_segment['absolute_end'] = abs_end
+            a_segment['absolute_start_ts'] = abs_start_ts
 
         return segments
 
     @classmethod
-    def create_lsl_stream_data(cls, df: pd.DataFrame, stream_name: str = "transcript", source_id: str = "whisper", stream_save_filename: Optional[Path]=None) -> dict:
+    def create_lsl_stream_data_from_dataframe(cls, df: pd.DataFrame, **kwargs) -> dict:
+        """ Same as `create_lsl_stream_data`, for a transcript DataFrame (e.g. from `read_transcript_csv`) with absolute timestamp columns. """
+        return cls.create_lsl_stream_data(df.to_dict('records'), **kwargs)
+
+
+    @classmethod
+    def create_lsl_stream_data(cls, segments: List[dict], stream_name: str = "transcript", source_id: str = "whisper", stream_save_filename: Optional[Path]=None, build_raw: Optional[bool]=None, created_at: Optional[datetime]=None) -> dict:
         """
-        Create LSL-compatible stream data structure from transcript DataFrame.
+        Create LSL-compatible stream data structure from transcript segments.
 
         Args:
-            df: DataFrame with transcript data and absolute timestamps
+            segments: list of transcript segment dicts with absolute timestamps (as returned by `add_absolute_timestamps`). For a DataFrame use `create_lsl_stream_data_from_dataframe`.
             stream_name: Name for the LSL stream
             source_id: Source identifier for the stream
+            stream_save_filename: if provided, the MNE Raw is saved to this FIF file
+            build_raw: whether to build the MNE Raw. Defaults to only building it when `stream_save_filename` is provided.
+            created_at: creation time recorded in the stream info (and used for its session id). Defaults to now; batch callers pass one shared value.
 
         Returns:
-            Dictionary containing LSL stream metadata and data
+            Dictionary containing LSL stream metadata and data, and the MNE Raw that was saved (None when `stream_save_filename` is None)
             
             
         Usage:
             lsl_stream_output_path = output_dir / f"{csv_path.stem}.lsl.json"
             lsl_stream_output = VideoTranscriptToLabStreamingLayer.create_lsl_stream_data(file_contents['segments'], stream_save_filename=lsl_stream_output_path)
         """
-        start_times = []
-        end_times = []
+        if isinstance(segments, pd.DataFrame):
+            return cls.create_lsl_stream_data_from_dataframe(segments, stream_name=stream_name, source_id=source_id, stream_save_filename=stream_save_filename, build_raw=build_raw, created_at=created_at)
+
         # Create LSL stream info
+        now: datetime = created_at or datetime.now()
+        now_iso: str = now.isoformat()
+        now_sid: str = now.strftime('%Y%m%d_%H%M%S')
         stream_info = {
             "name": stream_name,
             "type": "Markers",
@@ -83,116 +220,107 @@ class VideoTranscriptToLabStreamingLayer:
             "nominal_srate": 0,  # Irregular sampling
             "channel_format": "string",
             "source_id": source_id,
-            "created_at": datetime.now().isoformat(),
-            "session_id": f"{source_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            "created_at": now_iso,
+            "session_id": f"{source_id}_{now_sid}"
         }
 
         ## BEGIN BODY
-        # Extract messages and timestamps
-        messages = []
-        timestamps = []
-        samples = []
-        if isinstance(df, pd.DataFrame):
-            for _, row in df.iterrows():
-                # Each sample contains the text and timing info
-                sample = {
-                    "timestamp": row['absolute_start'].timestamp(),
-                    "data": {
-                        "text": row['text'],
-                        "duration": row['end'] - row['start'],
-                        "start_offset": row['start'],
-                        "end_offset": row['end'],
-                        "confidence": getattr(row, 'confidence', None)  # if available
-                    }
-                }
-                samples.append(sample)
-                start_times.append(df['absolute_start'])
-                end_times.append(df['absolute_end'])
-                # MNE Version:
-                message = row['text'] if row['text'] else ''
-                timestamp = row['absolute_start'].timestamp() # row['start']
-                messages.append(message)
-                timestamps.append(timestamp)
-
-        elif isinstance(df, list):
-            ## a list of sample dicts
-            for row in df:
-                # Each sample contains the text and timing info
-                sample = {
-                    "timestamp": row['absolute_start'].timestamp(),
-                    "data": {
-                        "text": row['text'],
-                        "duration": row['end'] - row['start'],
-                        "start_offset": row['start'],
-                        "end_offset": row['end'],
-                        "confidence": getattr(row, 'confidence', None)  # if available
-                    }
-                }
-                samples.append(sample)
-                start_times.append(row['absolute_start'])
-                end_times.append(row['absolute_end'])
-                # MNE Version:
-                message = row['text'] if row['text'] else ''
-                timestamp = row['absolute_start'].timestamp() # row['start']
-                messages.append(message)
-                timestamps.append(timestamp)
-
-
+        # pull all the needed fields out as plain tuples in a single pass (like `itertuples(index=False, name=None)`), then transpose into columns
+        n_segments: int = len(segments)
+        column_names = ('absolute_start', 'absolute_end', 'text', 'start', 'end')
+        columns = list(zip(*map(itemgetter(*column_names), segments))) if segments else [()] * len(column_names)
+        cols = dict(zip(column_names, columns))
+        cols['start'] = np.asarray(cols['start'], dtype=np.float64)
+        cols['end'] = np.asarray(cols['end'], dtype=np.float64)
+        has_confidence: bool = (n_segments > 0) and ('confidence' in segments[0])  # checked once rather than per row
+        cols['confidence'] = ([row.get('confidence') for row in segments] if has_confidence else [None] * n_segments)
+        if (n_segments > 0) and ('absolute_start_ts' in segments[0]):
+            cols['absolute_start_ts'] = np.fromiter((row['absolute_start_ts'] for row in segments), dtype=np.float64, count=n_segments)
 
+        # Extract messages and timestamps
+        if 'absolute_start_ts' in cols:
+            timestamps = cols['absolute_start_ts'] # precomputed by `add_absolute_timestamps`
         else:
-            raise TypeError(f'unexpected type: {type(df)}')
+            timestamps = np.fromiter((a_start.timestamp() for a_start in cols['absolute_start']), dtype=np.float64, count=len(cols['absolute_start']))
+        durations = cols['end'] - cols['start']
+        n_samples: int = len(timestamps)
+        # MNE Version:
+        messages = [(t if t else '') for t in cols['text']]
 
-        lsl_data = {
+        # min/max reductions over a DatetimeIndex run in C, so no need to rely on the input being time-ordered
+        first_start, last_end = pd.DatetimeIndex(cols['absolute_start']).min(), pd.DatetimeIndex(cols['absolute_end']).max()
+
+        # one list per field (the numeric columns stay as arrays, which `_dumps` serializes directly) rather than a nested dict per sample
+        lsl_data = _LSLStreamData({
             "stream_info": stream_info,
-            "samples": samples,
-            "total_samples": len(samples),
-            "start_time": np.min(start_times).isoformat(),
-            "end_time": np.max(start_times).isoformat()
-            # "start_time": df['absolute_start'].min().isoformat(),
-            # "end_time": df['absolute_end'].max().isoformat()
-        }
+            "timestamps": timestamps,
+            "text": list(cols['text']),
+            "duration": durations,
+            "start_offset": cols['start'],
+            "end_offset": cols['end'],
+            "confidence": list(cols['confidence']),
+            "total_samples": n_samples,
+            "start_time": first_start.isoformat(),
+            "end_time": last_end.isoformat()
+        })
+
+        if build_raw is None:
+            build_raw = (stream_save_filename is not None)
+        raw = None
+        if build_raw:
+            # the MNE Raw is only needed to write the FIF file, so skip building it for callers that only want `lsl_data`
+            raw = cls._build_mne_raw(messages=messages, timestamps=timestamps, stream_name=stream_name)
+        if stream_save_filename is not None:
+            cls.save_raw_fif(raw, stream_save_filename)
+
+        return lsl_data, raw
+    
 
+    @classmethod
+    def _build_mne_raw(cls, messages: List[str], timestamps: Union[List[float], np.ndarray], stream_name: str = "transcript") -> mne.io.RawArray:
+        """ Builds the MNE Raw object (a minimal dummy channel carrying the transcript markers as annotations) that is saved as FIF """
         # ==================================================================================================================================================================================================================================================================================== #
         # MNE VERSION                                                                                                                                                                                                                                                                          #
         # ==================================================================================================================================================================================================================================================================================== #
         ## INPUTS: messages, timestamps, messages
         # Convert timestamps to relative times (from first sample)
-        if timestamps:
-            first_timestamp = timestamps[0]
-            relative_timestamps = [ts - first_timestamp for ts in timestamps]
-        else:
-            relative_timestamps = []
+        ts_arr = np.asarray(timestamps, dtype=np.float64)
+        n_markers: int = len(ts_arr)
+        relative_timestamps = (ts_arr - ts_arr[0]) if n_markers else ts_arr
+        # hand MNE ready-made arrays so it doesn't have to convert Python lists itself
+        descriptions = np.empty(n_markers, dtype=object)
+        descriptions[:] = messages
         # Create annotations (MNE's way of handling markers/events)
         # Set orig_time=None to avoid timing conflicts
         annotations = mne.Annotations(
             onset=relative_timestamps,
-            duration=[0.0] * len(relative_timestamps),  # Instantaneous events
-            description=messages,
+            duration=np.zeros(n_markers, dtype=np.float64),  # Instantaneous events
+            description=descriptions,
             orig_time=None  # This fixes the timing conflict
         )
 
         # Create a minimal info structure for the markers
         info = mne.create_info(
             ch_names=[f'{stream_name}_Markers'],
-            sfreq=1000,  # Dummy sampling rate for the minimal channel
+            sfreq=1.0,  # Dummy sampling rate for the minimal channel (the annotations carry their own onsets in seconds)
             ch_types=['misc']
         )
 
         # Create raw object with minimal dummy data
         # We need at least some data points to create a valid Raw object
-        if len(timestamps) > 0:
+        if n_markers > 0:
             # Create dummy data spanning the recording duration
-            duration = relative_timestamps[-1] if relative_timestamps else 1.0
-            n_samples = int(duration * 1000) + 1000  # Add buffer
-            dummy_data = np.zeros((1, n_samples))
+            duration = relative_timestamps[-1]
+            n_samples = int(np.ceil(duration)) + 1
+            dummy_data = np.zeros((1, n_samples), dtype=np.float32)
         else:
-            dummy_data = np.zeros((1, 1000))  # Minimum 1 second of data
+            dummy_data = np.zeros((1, 1), dtype=np.float32)  # Minimum 1 second of data
 
         raw = mne.io.RawArray(dummy_data, info)
 
         # Set measurement date to match the first timestamp
-        if timestamps:
-            raw.set_meas_date(timestamps[0])
+        if n_markers > 0:
+            raw.set_meas_date(float(ts_arr[0]))
 
         raw.set_annotations(annotations)
 
@@ -200,45 +328,41 @@ class VideoTranscriptToLabStreamingLayer:
         raw.info['description'] = 'VideoTranscription LSL Stream Recording'
         raw.info['experimenter'] = 'PhoVideoTranscriptToLabStreamingLayer'
 
+        return raw
 
-        if stream_save_filename is not None:
-            xdf_filename = stream_save_filename
-            if isinstance(xdf_filename, Path):
-                xdf_filename = xdf_filename.as_posix()
-
-            # Determine output filename and format
-            if xdf_filename.endswith('.xdf'):
-                # Save as FIF (MNE's native format)
-                fif_filename = xdf_filename.replace('.xdf', '.fif')
-                raw.save(fif_filename, overwrite=True)
-                actual_filename = fif_filename
-                file_type = "FIF"
-            else:
-                # Use the original filename
-                raw.save(xdf_filename, overwrite=True)
-                actual_filename = xdf_filename
-                file_type = "FIF"
-
-            # Create LSL stream
-            # cls.save_lsl_stream(lsl_data, output_path=stream_save_filename)
-            
-        return lsl_data, raw
-    
 
-    # @classmethod
-    # def save_lsl_stream(cls, stream_data: dict, output_path: Union[str, Path]) -> None:
-    #     """Save LSL stream data to JSON file."""
-    #     output_path = Path(output_path)
-    #     with open(output_path, 'w', encoding='utf-8') as f:
-    #         json.dump(stream_data, f, indent=2, ensure_ascii=False)
+    @classmethod
+    def save_raw_fif(cls, raw: mne.io.RawArray, stream_save_filename: Union[str, Path]) -> str:
+        """ Saves the MNE Raw built by `create_lsl_stream_data` as FIF (a '.xdf' filename is swapped to '.fif'). Returns the written filename. """
+        xdf_filename = stream_save_filename
+        if isinstance(xdf_filename, Path):
+            xdf_filename = xdf_filename.as_posix()
+
+        # Determine output filename and format
+        if xdf_filename.endswith('.xdf'):
+            # Save as FIF (MNE's native format)
+            actual_filename = xdf_filename.replace('.xdf', '.fif')
+        else:
+            # Use the original filename
+            actual_filename = xdf_filename
+        raw.save(actual_filename, overwrite=True)
+        return actual_filename
+
+
+    @classmethod
+    def save_lsl_stream(cls, stream_data: dict, output_path: Union[str, Path]) -> None:
+        """Save LSL stream data to JSON file."""
+        output_path = Path(output_path)
+        output_path.write_bytes(_dumps(stream_data))
                 
 
     @classmethod
-    def MAIN_process_all_transcripts(cls, recordings_dir: Path, output_extensions = ['.json']):
+    def MAIN_process_all_transcripts(cls, recordings_dir: Path, output_extensions = ['.json'], max_workers: Optional[int] = None):
         """ Main function - parses all exported transcripts in a directory and produces new LabStreamingLayer (LSL) XDF/FIF streams that are saved to the 'LSL_Converted' subdirectory (which is created if needed)
 
         lsl_stream_output_path, found_valid_output_files, read_valid_output_files_dict = VideoTranscriptToLabStreamingLayer.MAIN_process_all_transcripts(recordings_dir = Path(r"M:\ScreenRecordings\EyeTrackerVR_Recordings").resolve())
 
+        Files are converted in parallel across `max_workers` processes (defaults to `os.cpu_count()`). With `max_workers=1` they are converted in-process, with the FIF writes overlapped on a small thread pool.
         """
         # from whisper.utils import read_csv
 
@@ -252,6 +376,8 @@ class VideoTranscriptToLabStreamingLayer:
         output_dir: Path = recordings_dir.joinpath('transcriptions').resolve()
         lsl_converted_streams_output_dir: Path = output_dir.joinpath('LSL_Converted')
         lsl_converted_streams_output_dir.mkdir(exist_ok=True)
+        log_lines: List[str] = [] # per-file status lines, written to stdout in a single call once all files are processed
+        batch_created_at: datetime = datetime.now() # one creation time (and so one session id epoch) shared by every stream of this batch
 
         # output_dir = Path("./transcriptions")
 
@@ -259,9 +385,9 @@ class VideoTranscriptToLabStreamingLayer:
         
         # output_extensions = ['.csv']
 
-        found_output_files: List[Path] = []
-        for ext in output_extensions:
-            found_output_files.extend(output_dir.glob(f"*{ext}"))
+        # scan the directory once and filter by extension (rather than one glob per extension)
+        output_extensions_set = set(output_extensions)
+        found_output_files: List[Path] = [p for p in output_dir.iterdir() if (p.suffix in output_extensions_set) and p.is_file()]
 
 
         # found_output_files: List[Path] = find_extant_output_files(output_dir=output_dir, base_name=base_name, output_formats=output_formats)
@@ -271,57 +397,78 @@ class VideoTranscriptToLabStreamingLayer:
         read_valid_output_files_dict = {}
         output_lsl_fif_files = []
 
-        for a_file in found_output_files:
-            if a_file.exists() and a_file.is_file():
-                # file_contents = json.load(a_file)
-                with open(a_file, "r", encoding="utf-8") as js:
-                    file_contents = json.load(js) # (result, js, indent=2, ensure_ascii=False)
-                if file_contents:
-                    is_ready_for_LSL_stream_export: bool = False
-                    if len(file_contents['segments']) > 0:
-                        try:
-                            file_contents['segments'] = cls.add_absolute_timestamps(segments=file_contents['segments'], file_basename=a_file.stem)
-                            print(f"\nSuccess! '{a_file.as_posix()}'\n\tProcessed {len(file_contents['segments'])} transcript segments")
-                            is_ready_for_LSL_stream_export = True
-                        except Exception as e:
-                            print(f"Failed to parse to LabStreamingLayer for file: '{a_file.as_posix()}' Error: {e}")
-                            is_ready_for_LSL_stream_export = False
-                            pass
-
-                        if is_ready_for_LSL_stream_export:            
-                            try:
-                                # lsl_stream_output_path = lsl_converted_streams_output_dir / f"{a_file.stem}.lsl.json"
-                                lsl_stream_output_path = lsl_converted_streams_output_dir / f"{a_file.stem}.lsl.fif"
-                                lsl_stream_output, raw_lsl_stream_output = cls.create_lsl_stream_data(file_contents['segments'], stream_save_filename=lsl_stream_output_path)                
-                                print(f"\tSuccess exporting to LSL Stream! '{lsl_stream_output_path.as_posix()}'")
-                                output_lsl_fif_files.append(lsl_stream_output_path)
-                            except Exception as e:
-                                print(f"\tFailed to export final LabStreamingLayer stream to '{lsl_stream_output_path.as_posix()}' for source file: '{a_file.as_posix()}' Error: {e}")
-                                raise
-
-                    # print(f'file_contents: {file_contents}')    
-
-                # _a_read_text: str = a_file.read_text()
-                # if _a_read_text:
-
-                #     found_valid_output_files.append(a_file)
-                #     read_valid_output_files_dict[a_file.name] = _a_read_text
-                #     ## actually include the file
-                #     try:
-                #         df, lsl_data = process_transcript_to_lsl(csv_path=a_file, output_dir=output_dir, video_filename=a_file.name)
-                #         print(f"\nSuccess! Processed {len(df)} transcript segments")
-                #     except Exception as e:
-                #         print(f"Failed to parse to LabStreamingLayer for file: '{a_file.as_posix()}' Error: {e}")
-                #         pass
+        # Each transcript is independent, so convert them in parallel worker processes
+        n_workers: int = max_workers or os.cpu_count() or 1
+        chunksize: int = max(1, len(found_output_files) // n_workers)
+        try:
+            if found_output_files and (n_workers > 1):
+                with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                    for lsl_stream_output_path, a_file_log_lines, _ in executor.map(partial(_process_one, lsl_converted_streams_output_dir=lsl_converted_streams_output_dir, created_at=batch_created_at), found_output_files, chunksize=chunksize):
+                        log_lines.extend(a_file_log_lines)
+                        if lsl_stream_output_path is not None:
+                            output_lsl_fif_files.append(lsl_stream_output_path)
+            elif found_output_files:
+                # single process: overlap each FIF write with building the next file's stream
+                save_futures: List[Future] = []
+                with ThreadPoolExecutor(max_workers=4) as save_executor:
+                    for a_file in found_output_files:
+                        lsl_stream_output_path, a_file_log_lines, save_future = _process_one(a_file, lsl_converted_streams_output_dir=lsl_converted_streams_output_dir, save_executor=save_executor, created_at=batch_created_at)
+                        log_lines.extend(a_file_log_lines)
+                        if lsl_stream_output_path is not None:
+                            output_lsl_fif_files.append(lsl_stream_output_path)
+                        if save_future is not None:
+                            save_futures.append(save_future)
+                # leaving the `with` block waits for the pending writes
+                for save_future in save_futures:
+                    save_future.result() # re-raise any error from a background write
+        finally:
+            if log_lines:
+                sys.stdout.write('\n'.join(log_lines) + '\n')
 
         return output_lsl_fif_files, found_valid_output_files, read_valid_output_files_dict
 
 
 
+def _process_one(a_file: Path, lsl_converted_streams_output_dir: Path, save_executor: Optional[Executor] = None, created_at: Optional[datetime] = None) -> Tuple[Optional[Path], List[str], Optional[Future]]:
+    """ Converts a single exported transcript into an LSL FIF stream. Module-level so `MAIN_process_all_transcripts` can dispatch it to worker processes.
+
+    When `save_executor` is provided the FIF write is submitted to it (so the caller can build the next stream meanwhile) instead of being done inline.
+
+    Returns the stream path (None if the file was skipped), the status lines to report for it, and the pending FIF write (if `save_executor` was used).
+    """
+    log_lines: List[str] = []
+    if not (a_file.exists() and a_file.is_file()):
+        return None, log_lines, None
+    if not _has_segments(a_file):
+        return None, log_lines, None
+
+    file_contents = _loads(a_file.read_bytes())
+    if (not file_contents) or (len(file_contents['segments']) == 0):
+        return None, log_lines, None
+
+    try:
+        segments = VideoTranscriptToLabStreamingLayer.add_absolute_timestamps(segments=file_contents['segments'], file_basename=a_file.stem)
+        log_lines.append(f"\nSuccess! '{a_file.as_posix()}'\n\tProcessed {len(segments)} transcript segments")
+    except Exception as e:
+        log_lines.append(f"Failed to parse to LabStreamingLayer for file: '{a_file.as_posix()}' Error: {e}")
+        return None, log_lines, None
+
+    lsl_stream_output_path = lsl_converted_streams_output_dir / f"{a_file.stem}.lsl.fif"
+    save_future: Optional[Future] = None
+    try:
+        if save_executor is None:
+            VideoTranscriptToLabStreamingLayer.create_lsl_stream_data(segments, stream_save_filename=lsl_stream_output_path, created_at=created_at)
+        else:
+            _, raw = VideoTranscriptToLabStreamingLayer.create_lsl_stream_data(segments, build_raw=True, created_at=created_at)
+            save_future = save_executor.submit(VideoTranscriptToLabStreamingLayer.save_raw_fif, raw, lsl_stream_output_path)
+    except Exception as e:
+        raise RuntimeError(f"Failed to export final LabStreamingLayer stream to '{lsl_stream_output_path.as_posix()}' for source file: '{a_file.as_posix()}' Error: {e}") from e
+    log_lines.append(f"\tSuccess exporting to LSL Stream! '{lsl_stream_output_path.as_posix()}'")
+    return lsl_stream_output_path, log_lines, save_future
+
 
 # Example usage and CLI interface
 if __name__ == "__main__":
-    import sys
     
     # if len(sys.argv) < 2:
     #     print("Usage: python transcript_to_lsl.py <recordings_path>")
@@ -3,26 +3,45 @@
 Verify that all dependencies for LiveWhisperLoggerApp are properly installed
 """
 
+import os
 import sys
 from pathlib import Path
 
+
+class _Log:
+    """Collects report lines so the whole report is written to stdout in a single call"""
+    def __init__(self):
+        self.buf = []
+
+    def info(self, msg: str = ""):
+        self.buf.append(msg)
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            sys.stdout.flush()
+            self.buf.clear()
+
+_log = _Log()
+
+
 def check_python_version():
     """Check Python version compatibility"""
-    print("Checking Python version...")
+    _log.info("Checking Python version...")
     version = sys.version_info
-    print(f"Python version: {version.major}.{version.minor}.{version.micro}")
+    _log.info(f"Python version: {version.major}.{version.minor}.{version.micro}")
     
     if version.major != 3 or version.minor != 10:
-        print("⚠️  WARNING: This application is designed for Python 3.10")
-        print("   Other versions may work but are not officially supported")
+        _log.info("⚠️  WARNING: This application is designed for Python 3.10")
+        _log.info("   Other versions may work but are not officially supported")
     else:
-        print("✅ Python version is compatible")
+        _log.info("✅ Python version is compatible")
     
     return True
 
 def check_required_imports():
     """Check if all required packages can be imported"""
-    print("\nChecking required packages...")
+    _log.info("\nChecking required packages...")
     
     required_packages = [
         ("tkinter", "GUI framework"),
@@ -51,55 +70,60 @@ def check_required_imports():
     
     # Check required packages
     for package, description in required_packages:
+        name = package.ljust(15)
         try:
             __import__(package)
-            print(f"✅ {package:15} - {description}")
+            _log.info(f"✅ {name} - {description}")
         except ImportError as e:
-            print(f"❌ {package:15} - {description} (MISSING: {e})")
+            _log.info(f"❌ {name} - {description} (MISSING: {e})")
             all_good = False
     
-    print("\nChecking optional packages...")
+    _log.info("\nChecking optional packages...")
     
     # Check optional packages
     optional_available = 0
     for package, description in optional_packages:
+        name = package.ljust(15)
         try:
             __import__(package)
-            print(f"✅ {package:15} - {description}")
+            _log.info(f"✅ {name} - {description}")
             optional_available += 1
         except ImportError as e:
-            print(f"⚠️  {package:15} - {description} (optional, not available)")
+            _log.info(f"⚠️  {name} - {description} (optional, not available)")
     
-    print(f"\nOptional packages available: {optional_available}/{len(optional_packages)}")
+    _log.info(f"\nOptional packages available: {optional_available}/{len(optional_packages)}")
     
     return all_good
 
 def check_whisper_models():
-    """Check if Whisper models can be loaded"""
-    print("\nChecking Whisper model availability...")
+    """Check if Whisper models are available (without loading any weights)"""
+    _log.info("\nChecking Whisper model availability...")
     
     try:
-        from faster_whisper import WhisperModel
-        print("✅ faster-whisper is available")
+        import ctranslate2
+        from faster_whisper.utils import download_model
+        _log.info("✅ faster-whisper is available")
+        _log.info(f"   CUDA devices visible to CTranslate2: {ctranslate2.get_cuda_device_count()}")
         
-        # Try to load a small model
+        # Look for a cached small model and validate its files rather than instantiating it
         try:
-            print("Testing model loading (this may take a moment)...")
-            model = WhisperModel("tiny", device="cpu", compute_type="int8")
-            print("✅ Whisper model loading successful")
-            del model  # Clean up
+            model_dir = download_model("tiny", local_files_only=True)
+            if not ctranslate2.contains_model(model_dir):
+                raise ValueError(f"no CTranslate2 model found in '{model_dir}'")
+            model_size = os.stat(os.path.join(model_dir, "model.bin")).st_size
+            _log.info(f"✅ Whisper model files found: {model_dir} ({model_size / 1e6:.1f} MB)")
             return True
         except Exception as e:
-            print(f"⚠️  Whisper model loading failed: {e}")
+            _log.info(f"⚠️  Whisper model not available locally (it will be downloaded on first use): {e}")
             return False
             
     except ImportError:
-        print("❌ faster-whisper not available - live transcription will not work")
+        _log.info("❌ faster-whisper not available - live transcription will not work")
         return False
 
 def check_audio_devices():
     """Check available audio devices"""
-    print("\nChecking audio devices...")
+    _log.info("\nChecking audio devices...")
     
     try:
         import sounddevice as sd
@@ -110,25 +134,25 @@ def check_audio_devices():
             if device['max_input_channels'] > 0:
                 input_devices.append((i, device['name']))
         
-        print(f"✅ Found {len(input_devices)} audio input devices:")
+        _log.info(f"✅ Found {len(input_devices)} audio input devices:")
         for device_id, device_name in input_devices[:5]:  # Show first 5
-            print(f"   {device_id}: {device_name}")
+            _log.info(f"   {device_id}: {device_name}")
         
         if len(input_devices) > 5:
-            print(f"   ... and {len(input_devices) - 5} more")
+            _log.info(f"   ... and {len(input_devices) - 5} more")
         
         return len(input_devices) > 0
         
     except ImportError:
-        print("❌ sounddevice not available - audio capture will not work")
+        _log.info("❌ sounddevice not available - audio capture will not work")
         return False
     except Exception as e:
-        print(f"⚠️  Error checking audio devices: {e}")
+        _log.info(f"⚠️  Error checking audio devices: {e}")
         return False
 
 def check_lsl_functionality():
     """Check LSL functionality"""
-    print("\nChecking LSL functionality...")
+    _log.info("\nChecking LSL functionality...")
     
     try:
         import pylsl
@@ -144,48 +168,55 @@ def check_lsl_functionality():
         )
         
         outlet = pylsl.StreamOutlet(info)
-        print("✅ LSL outlet creation successful")
+        _log.info("✅ LSL outlet creation successful")
         
         # Test sending a sample
         outlet.push_sample(['test_message'])
-        print("✅ LSL sample transmission successful")
+        _log.info("✅ LSL sample transmission successful")
         
         del outlet
         return True
         
     except ImportError:
-        print("❌ pylsl not available - LSL functionality will not work")
+        _log.info("❌ pylsl not available - LSL functionality will not work")
         return False
     except Exception as e:
-        print(f"⚠️  LSL functionality test failed: {e}")
+        _log.info(f"⚠️  LSL functionality test failed: {e}")
         return False
 
 def check_file_permissions():
     """Check file system permissions"""
-    print("\nChecking file system permissions...")
+    _log.info("\nChecking file system permissions...")
     
     try:
         # Check if we can create files in the current directory
-        test_file = Path("test_permissions.tmp")
-        test_file.write_text("test")
-        test_file.unlink()
-        print("✅ File creation permissions OK")
+        if not os.access(Path.cwd(), os.W_OK):
+            raise PermissionError(f"current directory is not writable: {Path.cwd()}")
+        _log.info("✅ File creation permissions OK")
         
-        # Check if default output directory can be created
+        # Check if default output directory can be created (only touching the filesystem when it doesn't exist yet)
         from whisper_timestamped.pho_launch_live_transcription import _default_xdf_folder
-        _default_xdf_folder.mkdir(parents=True, exist_ok=True)
-        print(f"✅ Default output directory accessible: {_default_xdf_folder}")
+        if not _default_xdf_folder.exists():
+            _default_xdf_folder.mkdir(parents=True, exist_ok=True)
+        _log.info(f"✅ Default output directory accessible: {_default_xdf_folder}")
         
         return True
         
     except Exception as e:
-        print(f"❌ File system permission error: {e}")
+        _log.info(f"❌ File system permission error: {e}")
         return False
 
 def main():
-    """Run all verification checks"""
-    print("LiveWhisperLoggerApp Setup Verification")
-    print("=" * 50)
+    """Run all verification checks, writing the buffered report once at the end"""
+    try:
+        return _run_checks()
+    finally:
+        _log.flush()
+
+def _run_checks():
+    """Run each check, collecting the report into `_log`"""
+    _log.info("LiveWhisperLoggerApp Setup Verification")
+    _log.info("=" * 50)
     
     checks = [
         ("Python Version", check_python_version),
@@ -202,12 +233,12 @@ def main():
         try:
             results[check_name] = check_func()
         except Exception as e:
-            print(f"❌ {check_name} check failed with error: {e}")
+            _log.info(f"❌ {check_name} check failed with error: {e}")
             results[check_name] = False
     
-    print("\n" + "=" * 50)
-    print("VERIFICATION SUMMARY")
-    print("=" * 50)
+    _log.info("\n" + "=" * 50)
+    _log.info("VERIFICATION SUMMARY")
+    _log.info("=" * 50)
     
     all_critical_passed = True
     critical_checks = ["Python Version", "Required Packages", "LSL Functionality", "File Permissions"]
@@ -215,32 +246,32 @@ def main():
     for check_name, passed in results.items():
         status = "✅ PASS" if passed else "❌ FAIL"
         criticality = "CRITICAL" if check_name in critical_checks else "OPTIONAL"
-        print(f"{status} {check_name:20} ({criticality})")
+        _log.info(f"{status} {check_name:20} ({criticality})")
         
         if check_name in critical_checks and not passed:
             all_critical_passed = False
     
-    print("\n" + "=" * 50)
+    _log.info("\n" + "=" * 50)
     
     if all_critical_passed:
-        print("🎉 SETUP VERIFICATION SUCCESSFUL!")
-        print("The LiveWhisperLoggerApp should work with basic functionality.")
+        _log.info("🎉 SETUP VERIFICATION SUCCESSFUL!")
+        _log.info("The LiveWhisperLoggerApp should work with basic functionality.")
         
         optional_features = ["Whisper Models", "Audio Devices"]
         optional_passed = sum(results.get(check, False) for check in optional_features)
         
         if optional_passed == len(optional_features):
-            print("🚀 All optional features are also available!")
+            _log.info("🚀 All optional features are also available!")
         else:
-            print(f"⚠️  {len(optional_features) - optional_passed} optional features are not available.")
-            print("   The app will work but some features may be limited.")
+            _log.info(f"⚠️  {len(optional_features) - optional_passed} optional features are not available.")
+            _log.info("   The app will work but some features may be limited.")
     else:
-        print("❌ SETUP VERIFICATION FAILED!")
-        print("Critical dependencies are missing. Please install required packages.")
-        print("\nTo install missing packages, try:")
-        print("pip install -e .")
-        print("or")
-        print("pip install -e \".[live,full]\"")
+        _log.info("❌ SETUP VERIFICATION FAILED!")
+        _log.info("Critical dependencies are missing. Please install required packages.")
+        _log.info("\nTo install missing packages, try:")
+        _log.info("pip install -e .")
+        _log.info("or")
+        _log.info("pip install -e \".[live,full]\"")
     
     return all_critical_passed
 
@@ -3,6 +3,8 @@ import unittest
 
 from test_transcribe import *
 import test_transcribe
+from test_live_mel import *
+from test_transcript_to_lsl import *
 
 if __name__ == '__main__':
 
@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+try:
+    from faster_whisper.feature_extractor import FeatureExtractor
+except ImportError:
+    FeatureExtractor = None
+
+from whisper_timestamped import live_mel
+from whisper_timestamped.live_mel import CpuFeatureExtractor
+
+
+@unittest.skipIf(FeatureExtractor is None, "faster-whisper is not installed")
+class TestCpuFeatureExtractor(unittest.TestCase):
+    """`CpuFeatureExtractor` must give the same log-mel features as the faster-whisper extractor it replaces."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # a few lengths, including ones that are not a whole number of hops
+        self.waveforms = [
+            (0.1 * rng.standard_normal(n)).astype(np.float32)
+            for n in (16000, 16000 * 5 + 123, 16000 * 15)
+        ]
+
+    def assertSameFeatures(self, n_mels=80):
+        reference = FeatureExtractor(feature_size=n_mels)
+        extractor = CpuFeatureExtractor(FeatureExtractor(feature_size=n_mels))
+        for waveform in self.waveforms:
+            expected = reference(waveform)
+            features = extractor(waveform)
+            self.assertEqual(features.shape, expected.shape)
+            self.assertEqual(features.dtype, np.float32)
+            np.testing.assert_allclose(features, expected, rtol=0, atol=1e-4)
+
+    @unittest.skipIf(live_mel.njit is None, "numba is not installed")
+    def test_numba(self):
+        self.assertSameFeatures()
+
+    def test_numpy(self):
+        with mock.patch.object(live_mel, "_windowed_frames", live_mel._windowed_frames_numpy), \
+                mock.patch.object(live_mel, "_power", live_mel._power_numpy):
+            self.assertSameFeatures()
+
+    def test_128_mels(self):
+        # large-v3 models
+        self.assertSameFeatures(n_mels=128)
@@ -0,0 +1,46 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# the scripts import their helpers as top-level modules
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(_ROOT, "scripts"), os.path.join(_ROOT, "whisper_timestamped")]
+
+from transcript_to_lsl import VideoTranscriptToLabStreamingLayer
+
+
+class TestReadTranscriptCsv(unittest.TestCase):
+
+    ROWS = 'Hello world,0.0,1.5\n"Well, then",1.5,3.25\n'
+
+    def write_csv(self, content):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def check_segments(self, segments):
+        self.assertEqual([s["text"] for s in segments], ["Hello world", "Well, then"])
+        self.assertEqual([float(s["start"]) for s in segments], [0.0, 1.5])
+        self.assertEqual([float(s["end"]) for s in segments], [1.5, 3.25])
+
+    def test_headerless(self):
+        # as written by the whisper_timestamped CLI
+        path = self.write_csv(self.ROWS)
+        self.check_segments(VideoTranscriptToLabStreamingLayer.read_transcript_csv(path).to_dict("records"))
+
+    def test_header(self):
+        # as written by process_recordings
+        path = self.write_csv("text,start,end\n" + self.ROWS)
+        self.check_segments(VideoTranscriptToLabStreamingLayer.read_transcript_csv(path).to_dict("records"))
+
+    def test_add_absolute_timestamps_headerless(self):
+        path = self.write_csv(self.ROWS)
+        base = datetime(2025, 1, 2, 3, 4, 5)
+        segments = VideoTranscriptToLabStreamingLayer.add_absolute_timestamps(path, base)
+        self.check_segments(segments)
+        self.assertEqual([s["absolute_start"] for s in segments], [base, base + timedelta(seconds=1.5)])
+        self.assertEqual([s["absolute_end"] for s in segments], [base + timedelta(seconds=1.5), base + timedelta(seconds=3.25)])
@@ -1,51 +1,93 @@
 import argparse
+import contextlib
 import json
-import queue
+import os
+import string
 import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Deque, List, Optional, Tuple
+from typing import Deque, List, Optional, Set, Tuple, Union
 
 import numpy as np
 
+# The heavy dependencies (torch, faster_whisper, numba, sounddevice/soundfile, pylsl) are imported where they are first
+# needed, so `--help` and argument errors return without paying for them.
 try:
-    import sounddevice as sd
-    import soundfile as sf
-except Exception as e:  # pragma: no cover - optional at import time
-    sd = None
-    sf = None
+    import orjson
+except ImportError:
+    orjson = None
 
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except Exception:
-    TORCH_AVAILABLE = False
 
-from faster_whisper import WhisperModel
+@dataclass(slots=True)
+class LiveWord:
+    """One emitted word. Slotted instead of a dict per word; serializes to the same `{"text", "start", "end", "probability"}` object (natively with orjson)."""
+    text: str
+    start: float
+    end: float
+    probability: Optional[float] = None
+
+
+def _json_default(obj):
+    """`default=` hook for the stdlib JSON fallback"""
+    if isinstance(obj, LiveWord):
+        return {"text": obj.text, "start": obj.start, "end": obj.end, "probability": obj.probability}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _import_torch():
+    """torch if it is installed, else None."""
+    try:
+        import torch
+        return torch
+    except Exception:
+        return None
+
+
+def _detect_cuda() -> bool:
+    torch = _import_torch()
+    return (torch is not None) and torch.cuda.is_available()
+
+
+def default_compute_type(device: Optional[str] = None) -> str:
+    """CTranslate2 compute type for real-time decoding on `device` ("cuda"/"cpu", auto-detected when None).
+
+    int8 weights run on the int8 tensor cores (GPU) / VNNI units (CPU) that CTranslate2 dispatches to.
+    """
+    if device is None:
+        device = "cuda" if _detect_cuda() else "cpu"
+    return "int8_float16" if device == "cuda" else "int8"
 
-try:
-    from pylsl import StreamInfo, StreamOutlet
-    LSL_AVAILABLE = True
-except Exception:
-    LSL_AVAILABLE = False
+
+def _inference_mode():
+    """`torch.inference_mode()` when torch is installed, else a no-op context."""
+    torch = _import_torch()
+    return torch.inference_mode() if torch is not None else contextlib.nullcontext()
 
 
 @dataclass
 class LiveConfig:
     model: str = "small"
     device: Optional[str] = None  # "cuda"|"cpu"|None(auto)
-    compute_type: Optional[str] = None  # "float16"|"int8"|None(auto)
+    compute_type: Optional[str] = None  # "int8_float16"|"float16"|"int8"|None(auto)
+    feature_extractor_device: Optional[str] = None  # where the log-mel features are computed: "cuda"|"cpu"|None(same as `device`)
     language: Optional[str] = None
     beam_size: int = 1
+    batch_size: int = 8  # most speech regions decoded together (a step with more runs several encoder batches)
     vad_filter: bool = True
     chunk_length_s: float = 15.0
     step_s: float = 2.0
+    # capacity of the preallocated capture ring (None: max(2 windows, 60 s)); raised to at least two windows, since the
+    # transcriber reads up to a window behind the newest sample and the WAV writer trails it
+    ring_buffer_seconds: Optional[float] = None
     sample_rate: int = 16000
     channels: int = 1
-    dtype: str = "float32"
+    dtype: str = "float32"  # capture sample format: "float32"|"int16" (int16 halves the bytes moved per captured block)
+    blocksize: int = 480  # 30 ms at 16 kHz, a whole number of Whisper's 160-sample (10 ms) mel hops
+    audio_latency: Union[str, float] = "low"  # PortAudio latency hint: "low"|"high" or seconds
     output_dir: Path = Path("./live_transcripts")
     session_name: Optional[str] = None
     write_audio_wav: bool = True
@@ -55,80 +97,284 @@ class LiveConfig:
     no_speech_threshold: float = 0.6
     logprob_threshold: float = -1.0
     temperature: float = 0.0
+    # LocalAgreement-2: decode a still-open utterance every step and commit the words two consecutive decodes agree on,
+    # instead of holding the whole utterance back until it ends
+    use_local_agreement: bool = False
+    # adapt the step to the measured decode time (slower steps when decoding falls behind, faster ones when it keeps up easily)
+    adaptive_step: bool = False
+    # decodes of a full silent window run by `start()` before capturing, so kernel selection and buffer allocation are done up front
+    warmup_passes: int = 1
+
+
+# a trailing speech region ending closer than this to the newest sample is treated as still being spoken
+OPEN_REGION_TAIL_S: float = 0.5
+# audio whose peak-to-peak amplitude stays under this (about -50 dBFS either side of any DC offset) is silence without
+# running the VAD model on it
+SILENCE_PEAK_TO_PEAK: float = 2 * 10 ** (-50 / 20)
+# when speech fills the whole window, words ending within this much of its end are left for the next step to decode
+OVERLAP_HOLD_S: float = 1.0
+# how much recently committed text is passed as the prompt for the next decode
+PROMPT_TAIL_CHARS: int = 200
+# the WAV writer waits for this many samples (32 KB of int16 PCM) before writing
+WAV_WRITE_BATCH_SAMPLES: int = 16384
+# new output whose first words repeat (up to) this many trailing committed words has them dropped
+DEDUP_NGRAM: int = 4
+# how far past the last committed word a repeated word may start and still be treated as a duplicate
+DEDUP_TIME_SLACK_S: float = 0.5
+# buffered JSONL output is flushed to disk at least this often
+JSONL_FLUSH_INTERVAL_S: float = 5.0
+# adaptive step: the step is re-targeted to 1.25x the smoothed decode time every this many decodes, within these bounds
+ADAPTIVE_STEP_EVERY: int = 5
+ADAPTIVE_STEP_MIN_S: float = 0.5
+ADAPTIVE_STEP_MAX_S: float = 8.0
+
+
+def _ring_write(buf: np.ndarray, wp: int, data: np.ndarray):
+    """Copies `data` into the ring `buf` starting at index `wp`, wrapping around its end."""
+    split = min(data.shape[0], buf.shape[0] - wp)
+    buf[wp : wp + split] = data[:split]
+    buf[: data.shape[0] - split] = data[split:]
+
+
+def _ring_read(buf: np.ndarray, start: int, out: np.ndarray):
+    """Fills `out` from the ring `buf` starting at index `start`, wrapping around its end."""
+    split = min(out.shape[0], buf.shape[0] - start)
+    out[:split] = buf[start : start + split]
+    out[split:] = buf[: out.shape[0] - split]
+
+
+_ring_kernels_jit: Optional[bool] = None  # whether `_ring_write`/`_ring_read` are Numba-compiled (None until first checked)
+
+
+def _jit_ring_kernels() -> bool:
+    """Swaps in Numba-compiled `_ring_write`/`_ring_read` the first time a ring is made (when Numba is installed)."""
+    global _ring_write, _ring_read, _ring_kernels_jit
+    if _ring_kernels_jit is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _ring_kernels_jit = False
+        else:
+            # Compiled, the per-block wrap-around handling skips the interpreter and numpy slicing dispatch entirely
+            _ring_write = njit(cache=True, boundscheck=False)(_ring_write)
+            _ring_read = njit(cache=True, boundscheck=False)(_ring_read)
+            _ring_kernels_jit = True
+    return _ring_kernels_jit
+
+
+def _normalize_word(text: str) -> str:
+    return text.strip().strip(string.punctuation).lower()
 
 
 class RingBuffer:
+    """Single-producer/single-consumer ring of the most recent audio samples.
+
+    Lock-free: only the producer advances `write_seq` (the total number of samples ever appended), and only after the new
+    samples are in place, so a reader that snapshots `write_seq` first always sees complete data. Storing a Python int is
+    atomic under the GIL. The reader must stay within `capacity` samples of the producer, which is why the ring is sized to
+    several inference windows.
+    """
+
     def __init__(self, capacity_samples: int, dtype: np.dtype = np.float32):
         self.capacity = int(capacity_samples)
         self.buffer = np.zeros(self.capacity, dtype=dtype)
-        self.write_pos = 0
-        self.size = 0
-        self.lock = threading.Lock()
+        self.write_seq = 0
+        self._warm_up_kernels()
+
+    def _warm_up_kernels(self):
+        if _jit_ring_kernels():
+            # Compile (or load from cache) now, for both contiguous and strided (multi-channel column) blocks, so the first audio callback doesn't stall
+            _ring_write(self.buffer, 0, np.zeros(0, dtype=self.buffer.dtype))
+            _ring_write(self.buffer, 0, np.zeros((2, 2), dtype=self.buffer.dtype)[:, 0])
+            _ring_read(self.buffer, 0, np.zeros(0, dtype=self.buffer.dtype))
+
+    @property
+    def size(self) -> int:
+        return min(self.write_seq, self.capacity)
 
     def append(self, data: np.ndarray):
-        with self.lock:
-            n = len(data)
-            if n >= self.capacity:
-                # keep only the last capacity samples
-                self.buffer[:] = data[-self.capacity:]
-                self.write_pos = 0
-                self.size = self.capacity
-                return
-            end = self.write_pos + n
-            if end <= self.capacity:
-                self.buffer[self.write_pos:end] = data
-            else:
-                split = self.capacity - self.write_pos
-                self.buffer[self.write_pos:] = data[:split]
-                self.buffer[: end - self.capacity] = data[split:]
-            self.write_pos = (self.write_pos + n) % self.capacity
-            self.size = min(self.capacity, self.size + n)
-
-    def get_last(self, n_samples: int) -> np.ndarray:
-        with self.lock:
-            n = min(n_samples, self.size)
-            if n == 0:
-                return np.zeros(0, dtype=self.buffer.dtype)
-            start = (self.write_pos - n) % self.capacity
-            if start + n <= self.capacity:
-                return self.buffer[start : start + n].copy()
+        n = len(data)
+        # keep only the last capacity samples
+        kept = data[-self.capacity:] if n > self.capacity else data
+        _ring_write(self.buffer, (self.write_seq + n - len(kept)) % self.capacity, kept)
+        self.write_seq += n  # publish
+
+    def get_last(self, n_samples: int, out: np.ndarray, end_seq: Optional[int] = None) -> int:
+        """Copies the (up to) `n_samples` samples ending at sample `end_seq` (defaults to the newest) into the caller-owned `out`, returning how many were copied."""
+        if end_seq is None:
+            end_seq = self.write_seq
+        n = min(n_samples, len(out), end_seq, self.capacity - (self.write_seq - end_seq))  # older samples have been overwritten
+        if n <= 0:
+            return 0
+        _ring_read(self.buffer, (end_seq - n) % self.capacity, out[:n])
+        return n
+
+
+class TorchFeatureExtractor:
+    """Drop-in for faster-whisper's `FeatureExtractor` that computes the log-mel spectrogram on a torch device (e.g. the GPU).
+
+    Same math as the numpy implementation it wraps (reflect-padded STFT, power spectrum, mel filterbank, clamped log10); the
+    filterbank and window are uploaded once. Every other attribute is delegated to the wrapped extractor.
+    """
+
+    def __init__(self, base, device: str = "cuda"):
+        import torch
+
+        self.base = base
+        self.device = device
+        self.window = torch.hann_window(base.n_fft, device=device)
+        self.mel_filters = torch.from_numpy(np.asarray(base.mel_filters, dtype=np.float32)).to(device)
+        # Page-locked staging buffer for the waveform (grown on demand), so the host-to-device copy is a true async DMA
+        self._pinned = None
+        self._pinned_np = None
+
+    def __getattr__(self, name):
+        return getattr(self.base, name)
+
+    def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length: Optional[int] = None) -> np.ndarray:
+        import torch
+
+        if chunk_length is not None:
+            self.base.n_samples = chunk_length * self.base.sampling_rate
+            self.base.nb_max_frames = self.base.n_samples // self.base.hop_length
+        with torch.inference_mode():
+            waveform = np.asarray(waveform, dtype=np.float32)
+            if torch.device(self.device).type == "cuda":
+                n = len(waveform)
+                if (self._pinned is None) or (self._pinned.numel() < n):
+                    self._pinned = torch.empty(n, dtype=torch.float32, pin_memory=True)
+                    self._pinned_np = self._pinned.numpy()  # shares the pinned memory
+                # The previous call's copy out of this buffer has completed: its result was synchronized by `.cpu()` below
+                self._pinned_np[:n] = waveform
+                audio = self._pinned[:n].to(self.device, non_blocking=True)
             else:
-                split = self.capacity - start
-                return np.concatenate((self.buffer[start:], self.buffer[: n - split])).copy()
+                audio = torch.from_numpy(waveform).to(self.device)
+            if padding:
+                audio = torch.nn.functional.pad(audio, (0, padding))
+            stft = torch.stft(audio, self.base.n_fft, self.base.hop_length, window=self.window, return_complex=True)
+            magnitudes = stft[..., :-1].abs() ** 2
+            log_spec = torch.clamp(self.mel_filters @ magnitudes, min=1e-10).log10()
+            log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+            log_spec = (log_spec + 4.0) / 4.0
+            return log_spec.cpu().numpy()
+
+
+class _MicCapture:
+    """Microphone capture into `self._ring`, waking `self._step_ready` every `self._step_samples` captured samples.
+
+    Shared by `LiveTranscriber` and `live_process.LiveTranscriberProcess` (which captures for a transcriber in a child process).
+    """
+
+    def _audio_callback(self, indata, frames, time_info, status):  # called by sounddevice thread
+        if status:
+            # Overflows are tolerated; the ring keeps whatever was delivered
+            pass
+        # The ring append is a plain memcpy, so do it right here (no queue hop or intermediate copy)
+        self._ring.append(indata[:, 0] if indata.ndim == 2 else indata)
+        if self._ring.write_seq - self._step_seq >= self._step_samples:
+            self._step_seq = self._ring.write_seq
+            self._step_ready.set()
+
+    def _open_input_stream(self, sd):
+        return sd.InputStream(
+            samplerate=self.cfg.sample_rate,
+            channels=self.cfg.channels,
+            dtype=self.cfg.dtype,
+            device=self.cfg.mic_device,
+            blocksize=self.cfg.blocksize,
+            # On Linux, running with real-time priority (os.sched_setscheduler(0, os.SCHED_FIFO, ...) as root) brings this below 10 ms
+            latency=self.cfg.audio_latency,
+            callback=self._audio_callback,
+        )
+
+
+def ring_capacity_samples(cfg: LiveConfig) -> int:
+    """Size of the capture ring for `cfg` (see `LiveConfig.ring_buffer_seconds`)."""
+    ring_seconds = cfg.ring_buffer_seconds or max(cfg.chunk_length_s * 2, 60)
+    return int(cfg.sample_rate * max(ring_seconds, cfg.chunk_length_s * 2))
 
 
-class LiveTranscriber:
-    def __init__(self, cfg: LiveConfig):
+class LiveTranscriber(_MicCapture):
+    def __init__(self, cfg: LiveConfig, model=None, ring: Optional[RingBuffer] = None):
+        """`model` reuses an already loaded `WhisperModel` (e.g. the `.model` of a previous session's transcriber, when
+        `cfg.model`/`device`/`compute_type` haven't changed) instead of loading the weights again. `ring` is an existing
+        capture ring (of `cfg.dtype` samples) to transcribe from, filled by someone else, e.g. another process."""
+        from faster_whisper import BatchedInferencePipeline, WhisperModel
+        from faster_whisper.vad import VadOptions, get_speech_timestamps, get_vad_model
+
         self.cfg = cfg
         # Auto device/compute_type selection
         if self.cfg.device is None:
-            self.cfg.device = "cuda" if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
+            self.cfg.device = "cuda" if _detect_cuda() else "cpu"
         if self.cfg.compute_type is None:
-            self.cfg.compute_type = "float16" if self.cfg.device == "cuda" else "int8"
-
-        self.model = WhisperModel(
-            self.cfg.model,
-            device=self.cfg.device,
-            compute_type=self.cfg.compute_type,
-        )
+            self.cfg.compute_type = default_compute_type(self.cfg.device)
+
+        if model is None:
+            model = WhisperModel(
+                self.cfg.model,
+                device=self.cfg.device,
+                compute_type=self.cfg.compute_type,
+                cpu_threads=max(1, (os.cpu_count() or 2) // 2),  # leave the other half for audio capture and VAD
+            )
+        self.model = model
+        base_extractor = getattr(self.model.feature_extractor, "base", self.model.feature_extractor)  # unwrapped when reused
+        feature_device = self.cfg.feature_extractor_device or self.cfg.device
+        if feature_device == "cuda" and _detect_cuda():
+            # Compute the log-mel features with cuFFT/cuBLAS instead of with numpy on the CPU (also useful with a CPU model, to free those cores)
+            self.model.feature_extractor = TorchFeatureExtractor(base_extractor, device="cuda")
+        elif feature_device == "cpu":
+            from whisper_timestamped.live_mel import CpuFeatureExtractor
+
+            # BLAS-batched DFT with Numba-fused framing/power passes instead of faster-whisper's numpy STFT
+            self.model.feature_extractor = CpuFeatureExtractor(base_extractor)
+        else:
+            self.model.feature_extractor = base_extractor
+        # Batched, VAD-segmented inference over only the audio that hasn't been decoded yet
+        self.batched_model = BatchedInferencePipeline(model=self.model)
+        self._vad_options = VadOptions(max_speech_duration_s=self.cfg.chunk_length_s, min_silence_duration_ms=160)
+        self._get_speech_timestamps = get_speech_timestamps
+        if self.cfg.vad_filter:
+            get_vad_model()  # load the Silero ONNX session (CPU) now rather than on the first step
+        self._last_decoded_sample: int = 0
+        self._prompt_text: str = ""  # tail of the committed transcript, carried into the next decode as context
 
         self.recording_start_time = datetime.now()
         self._stop_event = threading.Event()
-        self._audio_q: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=50)
-        self._ring = RingBuffer(
-            capacity_samples=int(self.cfg.sample_rate * max(self.cfg.chunk_length_s * 2, 60)),
-            dtype=np.float32,
-        )
+        # Set by the audio callback every `step_s` worth of new samples, waking the transcriber loop
+        self._step_ready = threading.Event()
+        self._step_samples = max(1, int(self.cfg.step_s * self.cfg.sample_rate))
+        self._step_seq = 0
+        self._decode_time_ema: Optional[float] = None  # smoothed wall-clock seconds per decode (for `adaptive_step`)
+        self._decodes_since_adapt = 0
+        if self.cfg.dtype not in ("float32", "int16"):
+            raise ValueError(f"unsupported capture dtype {self.cfg.dtype!r} (expected 'float32' or 'int16')")
+        # The ring holds samples in the capture format; int16 is only converted to float32 when a window is read for decoding
+        self._ring = ring if ring is not None else RingBuffer(capacity_samples=ring_capacity_samples(self.cfg), dtype=np.dtype(self.cfg.dtype))
+        self._pcm16_capture = self._ring.buffer.dtype == np.int16
         self._wav_file = None
-        self._samples_written = 0
-        self._samples_lock = threading.Lock()
+        # Reused scratch buffers for the float -> int16 WAV conversion (grown on demand)
+        self._f32_scratch = np.empty(0, dtype=np.float32)
+        self._i16_scratch = np.empty(0, dtype=np.int16)
+        # Reused buffers the ring is read into: one inference window for the transcriber, a couple of WAV write batches for the writer
+        self._window_scratch = np.empty(int(self.cfg.chunk_length_s * self.cfg.sample_rate), dtype=np.float32)
+        self._window_pcm16_scratch = np.empty(len(self._window_scratch) if self._pcm16_capture else 0, dtype=np.int16)
+        self._wav_scratch = np.empty(2 * WAV_WRITE_BATCH_SAMPLES, dtype=self._ring.buffer.dtype)
 
         # Dedup state
         self._last_emitted_time: float = 0.0  # seconds since start
+        self._committed_words: Deque[str] = deque(maxlen=32)  # normalized text of the most recently committed words
+        self._committed_hashes: Set[int] = set()  # hashes of the trailing 1..DEDUP_NGRAM-word n-grams of `_committed_words`
+        # LocalAgreement-2: normalized words of the previous decode of the open utterance that are not committed yet
+        self._prev_hypothesis: List[str] = []
 
         # LSL
-        self._lsl_outlet: Optional[StreamOutlet] = None
-        if self.cfg.lsl and LSL_AVAILABLE:
+        self._lsl_outlet = None  # pylsl.StreamOutlet
+        if self.cfg.lsl:
+            try:
+                from pylsl import StreamInfo, StreamOutlet
+            except Exception:
+                StreamOutlet = None
+        if self.cfg.lsl and (StreamOutlet is not None):
             info = StreamInfo(
                 name="transcript",
                 type="Markers",
@@ -139,49 +385,88 @@ class LiveTranscriber:
             )
             self._lsl_outlet = StreamOutlet(info)
 
-        # Output paths
-        self.cfg.output_dir.mkdir(parents=True, exist_ok=True)
+        self._stream = None
+        self._jsonl_fp = None  # opened by `start_workers()`, so a transcriber that is only loaded leaves no empty file
+        self._set_session_paths()
+
+    def _set_session_paths(self):
+        """Output paths for the session named by `cfg.session_name` (the current time if None)."""
         session = self.cfg.session_name or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.basepath = self.cfg.output_dir / session
         self.jsonl_path = self.basepath.with_suffix(".jsonl")
         self.wav_path = self.basepath.with_suffix(".wav")
 
-    def _audio_callback(self, indata, frames, time_info, status):  # called by sounddevice thread
-        if status:
-            # Drop if queue full to avoid backpressure
-            pass
-        mono = indata[:, 0] if indata.ndim == 2 else indata
-        try:
-            self._audio_q.put_nowait(mono.copy())
-        except queue.Full:
-            # Drop the block; ring buffer continues via writer thread
-            pass
+    def _open_jsonl(self):
+        self.cfg.output_dir.mkdir(parents=True, exist_ok=True)
+        # Kept open for the whole session (rather than reopened per emit) and flushed periodically by the transcriber loop
+        self._jsonl_fp = open(self.jsonl_path, "ab", buffering=8192)
+        self._jsonl_last_flush = time.monotonic()
+
+    def _reset_session_state(self):
+        """Forgets the previous session's audio and transcript (for `resume()`); the model, VAD and buffers are kept."""
+        self._ring.write_seq = 0
+        self._step_seq = 0
+        self._last_decoded_sample = 0
+        self._prompt_text = ""
+        self._last_emitted_time = 0.0
+        self._committed_words.clear()
+        self._committed_hashes = set()
+        self._prev_hypothesis = []
+
+    def _to_pcm16(self, data: np.ndarray) -> np.ndarray:
+        """Converts float samples in [-1, 1] to int16 PCM with in-place numpy ufuncs, so soundfile gets int16 it can write as-is."""
+        n = len(data)
+        if len(self._i16_scratch) < n:
+            self._f32_scratch = np.empty(n, dtype=np.float32)
+            self._i16_scratch = np.empty(n, dtype=np.int16)
+        f32 = self._f32_scratch[:n]
+        np.multiply(data, 32767.0, out=f32)
+        np.clip(f32, -32768.0, 32767.0, out=f32)
+        np.rint(f32, out=f32)
+        i16 = self._i16_scratch[:n]
+        np.copyto(i16, f32, casting="unsafe")
+        return i16
+
+    def _write_wav_since(self, wav_seq: int, min_samples: int = 0) -> int:
+        """Writes the ring samples captured after sample `wav_seq` to the WAV file once at least `min_samples` are pending, returning the new position."""
+        end_seq = self._ring.write_seq
+        if end_seq - wav_seq < max(min_samples, 1):
+            return wav_seq
+        while wav_seq < end_seq:
+            chunk_end = min(end_seq, wav_seq + len(self._wav_scratch))
+            n = self._ring.get_last(chunk_end - wav_seq, self._wav_scratch, end_seq=chunk_end)
+            chunk = self._wav_scratch[:n]
+            self._wav_file.buffer_write(chunk if self._pcm16_capture else self._to_pcm16(chunk), dtype="int16")
+            wav_seq = chunk_end
+        return end_seq
 
     def _audio_writer(self):
-        if self.cfg.write_audio_wav and sf is not None:
-            self._wav_file = sf.SoundFile(
-                self.wav_path.as_posix(), mode="w", samplerate=self.cfg.sample_rate, channels=1, subtype="PCM_16"
-            )
-        block_samples = 0
-        while not self._stop_event.is_set():
-            try:
-                data = self._audio_q.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            self._ring.append(data.astype(np.float32, copy=False))
-            if self._wav_file is not None:
-                self._wav_file.write(data)
-            block_samples += len(data)
-            with self._samples_lock:
-                self._samples_written += len(data)
-
-        if self._wav_file is not None:
+        """Streams the captured audio from the ring to the WAV file, off the realtime audio thread."""
+        if not self.cfg.write_audio_wav:
+            return
+        try:
+            import soundfile as sf
+        except Exception:
+            return
+        self._wav_file = sf.SoundFile(
+            self.wav_path.as_posix(), mode="w", samplerate=self.cfg.sample_rate, channels=1, subtype="PCM_16"
+        )
+        try:
+            wav_seq = 0
+            while not self._stop_event.wait(0.1):
+                # Batch up ~32 KB of PCM per write rather than issuing one small write per pass
+                wav_seq = self._write_wav_since(wav_seq, min_samples=WAV_WRITE_BATCH_SAMPLES)
+            self._write_wav_since(wav_seq)  # the tail captured since the last write
+        finally:
             self._wav_file.close()
 
     def _emit(self, segments: List[dict]):
-        with open(self.jsonl_path, "a", encoding="utf-8") as f:
-            for seg in segments:
-                f.write(json.dumps(seg, ensure_ascii=False) + "\n")
+        jsonl_fp = self._jsonl_fp
+        if jsonl_fp is not None:
+            if orjson is not None:
+                jsonl_fp.writelines([orjson.dumps(seg, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY) for seg in segments])
+            else:
+                jsonl_fp.write("".join(json.dumps(seg, ensure_ascii=False, default=_json_default) + "\n" for seg in segments).encode("utf-8"))
         if self._lsl_outlet is not None:
             for seg in segments:
                 try:
@@ -189,141 +474,298 @@ class LiveTranscriber:
                 except Exception:
                     pass
 
+    def _commit_words(self, words: List["LiveWord"]):
+        self._committed_words.extend(_normalize_word(w.text) for w in words)
+        tail = list(self._committed_words)[-DEDUP_NGRAM:]
+        self._committed_hashes = {hash(tuple(tail[-k:])) for k in range(1, len(tail) + 1)}
+
+    def _committed_overlap(self, words: List["LiveWord"]) -> int:
+        """Length of the longest prefix of `words` that repeats the tail of the committed transcript.
+
+        Matched on hashed normalized n-grams (so slightly revised timestamps between decodes don't matter) and only within
+        the already-committed time range (so a word that merely repeats isn't dropped later on).
+        """
+        for k in range(min(DEDUP_NGRAM, len(words)), 0, -1):
+            if words[k - 1].start > self._last_emitted_time + DEDUP_TIME_SLACK_S:
+                continue
+            if hash(tuple(_normalize_word(w.text) for w in words[:k])) in self._committed_hashes:
+                return k
+        return 0
+
+    def _build_emission(self, new_words: List["LiveWord"]) -> Optional[dict]:
+        """Commits `new_words` (minus whatever repeats the end of what was already committed), returning their emission."""
+        new_words = new_words[self._committed_overlap(new_words):]
+        if not new_words:
+            return None
+        emission = {
+            "text": " ".join([w.text for w in new_words]).strip(),
+            "start": new_words[0].start,
+            "end": new_words[-1].end,
+            "absolute_start": self._relative_to_absolute(new_words[0].start),
+            "absolute_end": self._relative_to_absolute(new_words[-1].end),
+            "words": new_words,
+        }
+        self._last_emitted_time = max(self._last_emitted_time, max(w.end for w in new_words))
+        self._commit_words(new_words)
+        return emission
+
+    def _agreed_prefix(self, hypothesis: List["LiveWord"]) -> int:
+        """LocalAgreement-2: number of leading words of `hypothesis` that match the previous decode of the same audio."""
+        current = [_normalize_word(w.text) for w in hypothesis]
+        k = 0
+        for prev_word, word in zip(self._prev_hypothesis, current):
+            if prev_word != word:
+                break
+            k += 1
+        self._prev_hypothesis = current[k:]
+        return k
+
+    @property
+    def step_s(self) -> float:
+        """Current step between inferences (differs from `cfg.step_s` once `adaptive_step` has adjusted it)."""
+        return self._step_samples / self.cfg.sample_rate
+
+    def set_step_s(self, step_s: float):
+        # a single int store, picked up by the audio callback and the inference loop on their next pass
+        self._step_samples = max(1, int(step_s * self.cfg.sample_rate))
+
+    def _record_decode_time(self, seconds: float):
+        self._decode_time_ema = seconds if self._decode_time_ema is None else (0.9 * self._decode_time_ema + 0.1 * seconds)
+        if not self.cfg.adaptive_step:
+            return
+        self._decodes_since_adapt += 1
+        if self._decodes_since_adapt < ADAPTIVE_STEP_EVERY:
+            return
+        self._decodes_since_adapt = 0
+        new_step_s = min(max(self._decode_time_ema * 1.25, ADAPTIVE_STEP_MIN_S), ADAPTIVE_STEP_MAX_S)
+        if self._decode_time_ema > self.step_s:
+            print(f"decoding takes {self._decode_time_ema:.2f}s per step, longer than the {self.step_s:.2f}s step; raising the step to {new_step_s:.2f}s", file=sys.stderr)
+        self.set_step_s(new_step_s)
+
+    def _flush_jsonl_if_due(self):
+        jsonl_fp = self._jsonl_fp
+        if (jsonl_fp is not None) and (time.monotonic() - self._jsonl_last_flush >= JSONL_FLUSH_INTERVAL_S):
+            jsonl_fp.flush()
+            self._jsonl_last_flush = time.monotonic()
+
+    def _close_jsonl(self):
+        if self._jsonl_fp is not None:
+            jsonl_fp, self._jsonl_fp = self._jsonl_fp, None
+            jsonl_fp.close()
+
+    @property
+    def recording_start_time(self) -> datetime:
+        return self._recording_start_time
+
+    @recording_start_time.setter
+    def recording_start_time(self, value: datetime):
+        self._recording_start_time = value
+        # cached so converting an offset is one float add and a format, without a timedelta
+        self._start_epoch = value.timestamp()
+        self._start_tz = value.tzinfo
+
     def _relative_to_absolute(self, rel_sec: float) -> str:
-        return (self.recording_start_time + timedelta(seconds=rel_sec)).isoformat()
+        return datetime.fromtimestamp(self._start_epoch + rel_sec, self._start_tz).isoformat()
+
+    def _speech_regions(self, audio: np.ndarray) -> List[dict]:
+        """Speech regions of `audio` as `{"start", "end"}` sample offsets (the whole audio when VAD is disabled)."""
+        if not self.cfg.vad_filter:
+            return [{"start": 0, "end": len(audio)}]
+        if (len(audio) == 0) or (np.ptp(audio) < SILENCE_PEAK_TO_PEAK):
+            return []
+        return self._get_speech_timestamps(audio, vad_options=self._vad_options, sampling_rate=self.cfg.sample_rate)
+
+    def _transcribe_regions(self, audio: np.ndarray, regions: List[dict]) -> list:
+        """Decodes the speech `regions` of `audio` as one batch. Segment times are relative to `audio`."""
+        sample_rate = self.cfg.sample_rate
+        clips = [{"start": r["start"] / sample_rate, "end": r["end"] / sample_rate} for r in regions]
+        segments, info = self.batched_model.transcribe(
+            audio,
+            language=self.cfg.language,
+            beam_size=self.cfg.beam_size,
+            temperature=self.cfg.temperature,
+            word_timestamps=self.cfg.word_timestamps,
+            no_speech_threshold=self.cfg.no_speech_threshold,
+            log_prob_threshold=self.cfg.logprob_threshold,
+            initial_prompt=(self._prompt_text or None),
+            vad_filter=False,  # the regions were already found by `_speech_regions`
+            clip_timestamps=clips,
+            batch_size=max(1, min(len(clips), self.cfg.batch_size)),
+        )
+        return list(segments)
 
     def _transcriber_loop(self):
+        try:
+            # No autograd bookkeeping for any torch ops on this thread (e.g. the GPU feature extractor)
+            with _inference_mode():
+                self._transcriber_loop_body()
+        finally:
+            # Closed here rather than in `pause()`, so the segments of a decode still running when it gave up waiting are kept
+            self._close_jsonl()
+
+    def _transcriber_loop_body(self):
         sample_rate = self.cfg.sample_rate
         window = int(self.cfg.chunk_length_s * sample_rate)
-        step = max(1, int(self.cfg.step_s * sample_rate))
-        last_run_samples = 0
-        # Pace the loop based on step_s
-        next_time = time.time()
+        open_region_tail = int(OPEN_REGION_TAIL_S * sample_rate)
         while not self._stop_event.is_set():
-            now = time.time()
-            if now < next_time:
-                time.sleep(min(0.02, next_time - now))
+            # Sleep until the audio callback reports another step of audio (the timeout just keeps the JSONL flushes going)
+            step_ready = self._step_ready.wait(timeout=0.5)
+            self._flush_jsonl_if_due()
+            if not step_ready:
                 continue
-            next_time = now + self.cfg.step_s
+            self._step_ready.clear()
 
             # Snapshot samples written to compute absolute offset
-            with self._samples_lock:
-                samples_written = self._samples_written
-            audio = self._ring.get_last(window)
-            if len(audio) < window // 2:  # wait for enough context
+            samples_written = self._ring.write_seq
+            n_pending = samples_written - self._last_decoded_sample
+            if n_pending < self._step_samples:
+                continue
+            decode_started = time.monotonic()
+            # Only the audio that hasn't been decoded yet (bounded by the window), so nothing is encoded twice
+            if self._pcm16_capture:
+                n = self._ring.get_last(min(n_pending, window), self._window_pcm16_scratch, end_seq=samples_written)
+                audio = np.multiply(self._window_pcm16_scratch[:n], 1.0 / 32768.0, out=self._window_scratch[:n], dtype=np.float32)
+            else:
+                n = self._ring.get_last(min(n_pending, window), self._window_scratch, end_seq=samples_written)
+                audio = self._window_scratch[:n]
+            audio_start_sample = samples_written - len(audio)
+
+            regions = self._speech_regions(audio)
+            commit_limit = float("inf")  # absolute seconds; words ending after this are left for the next step
+            hypothesis_from = float("inf")  # absolute seconds; words starting after this only count once two decodes agree on them
+            if not self.cfg.vad_filter:
+                # Without VAD the decoded audio always runs into the newest samples, which may cut a word: only commit words
+                # clear of the end, and decode the rest again (resuming after the last committed word) next step
+                commit_limit = samples_written / sample_rate - OVERLAP_HOLD_S
+                self._last_decoded_sample = samples_written
+            elif regions and (len(audio) - regions[-1]["end"] < open_region_tail):
+                if len(audio) >= window:
+                    # Still speaking but the window is full: decode it, but only commit words clear of the cut
+                    commit_limit = samples_written / sample_rate - OVERLAP_HOLD_S
+                    self._last_decoded_sample = samples_written
+                elif self.cfg.use_local_agreement:
+                    # The last region is still being spoken: decode it anyway and commit only its agreed prefix
+                    hypothesis_from = (audio_start_sample + regions[-1]["start"]) / sample_rate
+                    self._last_decoded_sample = audio_start_sample + regions[-1]["start"]
+                else:
+                    # The last region runs into the newest audio, i.e. is still being spoken: hold it back until it ends
+                    held = regions.pop()
+                    self._last_decoded_sample = audio_start_sample + held["start"]
+            else:
+                self._last_decoded_sample = samples_written
+            if hypothesis_from == float("inf"):
+                self._prev_hypothesis = []  # whatever was open is decoded to completion this step
+            if not regions:
                 continue
-            # Compute absolute offset of the start of this window
-            window_start_abs_sec = max(0.0, (samples_written - len(audio)) / sample_rate)
+            # Absolute offset of the start of the decoded audio
+            window_start_abs_sec = audio_start_sample / sample_rate
 
-            # Run inference on the window tail
             # We want word timestamps for robust dedup
             try:
-                segments, info = self.model.transcribe(
-                    audio,
-                    language=self.cfg.language,
-                    beam_size=self.cfg.beam_size,
-                    vad_filter=self.cfg.vad_filter,
-                    temperature=self.cfg.temperature,
-                    word_timestamps=self.cfg.word_timestamps,
-                    no_speech_threshold=self.cfg.no_speech_threshold,
-                    condition_on_previous_text=True,
-                )
-            except TypeError as e:
-                # Fallback for older faster-whisper versions that don't support some kwargs
-                try:
-                    segments, info = self.model.transcribe(
-                        audio,
-                        language=self.cfg.language,
-                        beam_size=self.cfg.beam_size,
-                        vad_filter=self.cfg.vad_filter,
-                        temperature=self.cfg.temperature,
-                        word_timestamps=self.cfg.word_timestamps,
-                    )
-                except Exception:
-                    continue
+                segments = self._transcribe_regions(audio, regions)
             except Exception:
                 continue
 
             new_emissions: List[dict] = []
+            hypothesis: List[LiveWord] = []
             for seg in segments:  # seg is faster_whisper.transcribe.Segment
                 # faster-whisper segment times are relative to provided audio
                 seg_start = window_start_abs_sec + max(0.0, float(seg.start))
                 seg_end = window_start_abs_sec + max(0.0, float(seg.end))
 
                 new_words = []
-                max_new_end = self._last_emitted_time
                 if getattr(seg, "words", None):
                     for w in seg.words:
-                        w_start = window_start_abs_sec + float(w.start)
                         w_end = window_start_abs_sec + float(w.end)
-                        if w_end <= self._last_emitted_time + 0.02:
-                            continue
-                        new_words.append(
-                            {
-                                "text": w.word,
-                                "start": w_start,
-                                "end": w_end,
-                                "probability": getattr(w, "probability", None),
-                            }
-                        )
-                        if w_end > max_new_end:
-                            max_new_end = w_end
-                else:
+                        if w_end > commit_limit:
+                            break
+                        word = LiveWord(w.word, window_start_abs_sec + float(w.start), w_end, getattr(w, "probability", None))
+                        (hypothesis if word.start >= hypothesis_from else new_words).append(word)
+                elif seg_end <= commit_limit:
                     # Fallback to segment-level if no words available
-                    if seg_end <= self._last_emitted_time + 0.02:
-                        continue
-                    new_words.append({"text": seg.text.strip(), "start": seg_start, "end": seg_end})
-                    max_new_end = max(max_new_end, seg_end)
-
-                if not new_words:
-                    continue
-
-                text = " ".join([w["text"] for w in new_words]).strip()
-                abs_start = self._relative_to_absolute(new_words[0]["start"])
-                abs_end = self._relative_to_absolute(new_words[-1]["end"])
-                emission = {
-                    "text": text,
-                    "start": new_words[0]["start"],
-                    "end": new_words[-1]["end"],
-                    "absolute_start": abs_start,
-                    "absolute_end": abs_end,
-                    "words": new_words,
-                }
-                new_emissions.append(emission)
-                self._last_emitted_time = max_new_end
-
+                    (hypothesis if seg_start >= hypothesis_from else new_words).append(LiveWord(seg.text.strip(), seg_start, seg_end))
+
+                emission = self._build_emission(new_words)
+                if emission is not None:
+                    new_emissions.append(emission)
+
+            if hypothesis:
+                confirmed = hypothesis[: self._agreed_prefix(hypothesis)]
+                if confirmed:
+                    # Resume right after the last confirmed word; the rest of the utterance is decoded again next step
+                    self._last_decoded_sample = max(self._last_decoded_sample, int(confirmed[-1].end * sample_rate))
+                    emission = self._build_emission(confirmed)
+                    if emission is not None:
+                        new_emissions.append(emission)
+            if commit_limit != float("inf"):
+                # Resume right after the last committed word, so the words cut by the window edge are decoded whole next time
+                self._last_decoded_sample = max(audio_start_sample, min(samples_written, int(self._last_emitted_time * sample_rate)))
             if new_emissions:
+                self._prompt_text = (self._prompt_text + " " + " ".join(e["text"] for e in new_emissions))[-PROMPT_TAIL_CHARS:]
                 self._emit(new_emissions)
+            self._record_decode_time(time.monotonic() - decode_started)
 
     def start(self):
-        if sd is None:
-            raise RuntimeError("sounddevice/soundfile not available. Please install extras.")
+        try:
+            import sounddevice as sd
+            import soundfile  # noqa: F401  (needed by the WAV writer)
+        except Exception as e:
+            raise RuntimeError("sounddevice/soundfile not available. Please install extras.") from e
+
+        self.warm_up()
+        self._start_capture(sd)
 
-        # Start audio capture
+    def resume(self):
+        """Starts a new session (named by `cfg.session_name`) on a paused (or only warmed-up) transcriber, reusing its model."""
+        try:
+            import sounddevice as sd
+        except Exception as e:
+            raise RuntimeError("sounddevice not available. Please install extras.") from e
+
+        # The previous session's threads must be done with the ring and the files before they are reset
+        for thread in (getattr(self, "_transcribe_thread", None), getattr(self, "_writer_thread", None)):
+            if thread is not None:
+                thread.join()
+        self._reset_session_state()
+        self._set_session_paths()
+        self._start_capture(sd)
+
+    def _start_capture(self, sd):
         self._stop_event.clear()
+        self._stream = self._open_input_stream(sd)
+        self.recording_start_time = datetime.now()  # sample 0 is captured from here on (after the warm-up)
+        self._stream.start()
+        self.start_workers()
+
+    def warm_up(self):
+        """Decodes silence so the first real step doesn't stall on CUDA kernel selection, allocator pools or language detection.
+
+        A whole window is used so every buffer on the decode path is allocated at its largest size.
+        """
+        warmup_audio = np.zeros(len(self._window_scratch), dtype=np.float32)
+        with _inference_mode():
+            for _ in range(max(0, self.cfg.warmup_passes)):
+                self._transcribe_regions(warmup_audio, [{"start": 0, "end": len(warmup_audio)}])
+
+    def start_workers(self):
+        """Starts the WAV writer and the inference loop on the ring (audio must be captured into it from `recording_start_time` on)."""
+        if self._jsonl_fp is None:
+            self._open_jsonl()
         self._writer_thread = threading.Thread(target=self._audio_writer, daemon=True)
         self._writer_thread.start()
-
-        self._stream = sd.InputStream(
-            samplerate=self.cfg.sample_rate,
-            channels=self.cfg.channels,
-            dtype=self.cfg.dtype,
-            device=self.cfg.mic_device,
-            blocksize=int(self.cfg.sample_rate * 0.05),  # ~50ms blocks
-            callback=self._audio_callback,
-        )
-        self._stream.start()
-
-        # Start inference loop
         self._transcribe_thread = threading.Thread(target=self._transcriber_loop, daemon=True)
         self._transcribe_thread.start()
 
-    def stop(self):
+    def pause(self):
+        """Stops capturing and transcribing, keeping the model for `resume()`. The session's output files are closed by the
+        worker threads once they finish (a decode that is still running completes and is written first)."""
         self._stop_event.set()
+        self._step_ready.set()  # wake the transcriber loop so it sees the stop
         try:
-            if hasattr(self, "_stream"):
-                self._stream.stop()
-                self._stream.close()
+            if self._stream is not None:
+                stream, self._stream = self._stream, None
+                stream.stop()
+                stream.close()
         except Exception:
             pass
         if hasattr(self, "_transcribe_thread"):
@@ -331,24 +773,42 @@ class LiveTranscriber:
         if hasattr(self, "_writer_thread"):
             self._writer_thread.join(timeout=2.0)
 
+    def stop(self):
+        self.pause()
+        if hasattr(self, "_transcribe_thread"):
+            self._transcribe_thread.join()  # the last decode's segments are written (and the JSONL closed) before returning
+
+
+def _parse_latency(value: str):
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
 
 def cli(argv: Optional[List[str]] = None):
     p = argparse.ArgumentParser(description="Near real-time microphone transcription with faster-whisper")
     p.add_argument("--model", default="small", help="Model size or path (e.g., tiny, base, small, medium, large-v3)")
     p.add_argument("--device", default=None, help="cuda or cpu (auto if omitted)")
-    p.add_argument("--compute-type", dest="compute_type", default=None, help="float16, int8, int8_float16, etc. (auto if omitted)")
+    p.add_argument("--compute-type", dest="compute_type", default=None, help="int8_float16, float16, int8, etc. (auto if omitted: int8_float16 on cuda, int8 on cpu; use float16 if int8 quality regresses)")
+    p.add_argument("--feature-device", dest="feature_extractor_device", default=None, help="cuda or cpu: where log-mel features are computed (same as --device if omitted)")
     p.add_argument("--language", default=None, help="Hint language code (auto-detect if omitted)")
     p.add_argument("--beam-size", dest="beam_size", type=int, default=1)
+    p.add_argument("--batch-size", dest="batch_size", type=int, default=8, help="Most speech regions decoded in one batch")
     p.add_argument("--no-vad", dest="no_vad", action="store_true", help="Disable internal VAD filter")
     p.add_argument("--chunk-length", dest="chunk_length_s", type=float, default=15.0, help="Inference window seconds")
     p.add_argument("--step", dest="step_s", type=float, default=2.0, help="Step seconds between inferences")
     p.add_argument("--sr", dest="sample_rate", type=int, default=16000)
+    p.add_argument("--blocksize", dest="blocksize", type=int, default=480, help="Audio frames per capture block (default 480 = 30 ms at 16 kHz, aligned to Whisper's 10 ms hop)")
+    p.add_argument("--audio-latency", dest="audio_latency", default="low", help="PortAudio input latency: low, high, or seconds")
     p.add_argument("--output-dir", dest="output_dir", default="./live_transcripts")
     p.add_argument("--session", dest="session_name", default=None)
     p.add_argument("--no-wav", dest="no_wav", action="store_true", help="Do not save WAV recording")
     p.add_argument("--lsl", dest="lsl", action="store_true", help="Emit LSL Markers stream of segments")
     p.add_argument("--mic-device", dest="mic_device", default=None, help="Input device name or index")
     p.add_argument("--no-word-timestamps", dest="no_word_timestamps", action="store_true", help="Disable word-level timestamps (enabled by default)")
+    p.add_argument("--adaptive-step", dest="adaptive_step", action="store_true", help="Adapt the step to the measured decode time")
+    p.add_argument("--local-agreement", dest="use_local_agreement", action="store_true", help="Commit words of a still-open utterance once two consecutive decodes agree on them (lower latency for long utterances)")
     p.add_argument("--temperature", dest="temperature", type=float, default=0.0)
     p.add_argument("--no-speech-threshold", dest="no_speech_threshold", type=float, default=0.6)
     p.add_argument("--logprob-threshold", dest="logprob_threshold", type=float, default=-1.0)
@@ -359,12 +819,16 @@ def cli(argv: Optional[List[str]] = None):
         model=args.model,
         device=args.device,
         compute_type=args.compute_type,
+        feature_extractor_device=args.feature_extractor_device,
         language=args.language,
         beam_size=args.beam_size,
+        batch_size=args.batch_size,
         vad_filter=not args.no_vad,
         chunk_length_s=args.chunk_length_s,
         step_s=args.step_s,
         sample_rate=args.sample_rate,
+        blocksize=args.blocksize,
+        audio_latency=_parse_latency(args.audio_latency),
         output_dir=Path(args.output_dir),
         session_name=args.session_name,
         write_audio_wav=not args.no_wav,
@@ -374,6 +838,8 @@ def cli(argv: Optional[List[str]] = None):
         temperature=args.temperature,
         no_speech_threshold=args.no_speech_threshold,
         logprob_threshold=args.logprob_threshold,
+        use_local_agreement=args.use_local_agreement,
+        adaptive_step=args.adaptive_step,
     )
 
     lt = LiveTranscriber(cfg)
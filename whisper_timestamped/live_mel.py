@@ -0,0 +1,93 @@
+"""Log-mel spectrogram for CPU-only live transcription.
+
+`CpuFeatureExtractor` is a drop-in for faster-whisper's numpy `FeatureExtractor`: same reflect-padded STFT, power spectrum,
+mel filterbank and clamped log10. Whisper's `n_fft` (400) isn't a power of two, so instead of a per-frame FFT the DFT is
+done for all frames at once as a single float32 matrix product against a precomputed basis (multi-threaded BLAS), and the
+elementwise passes around it (framing + windowing, power + log) are fused into Numba-compiled loops when Numba is available.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _windowed_frames(padded: np.ndarray, window: np.ndarray, hop_length: int, n_frames: int) -> np.ndarray:
+    """(n_frames, n_fft) matrix of the windowed frames of the center-padded signal."""
+    n_fft = window.shape[0]
+    frames = np.empty((n_frames, n_fft), dtype=np.float32)
+    for t in prange(n_frames):
+        start = t * hop_length
+        for i in range(n_fft):
+            frames[t, i] = padded[start + i] * window[i]
+    return frames
+
+
+def _power(spec: np.ndarray, n_freqs: int) -> np.ndarray:
+    """(n_freqs, n_frames) power spectrum from the (n_frames, 2 * n_freqs) [real | imaginary] DFT output."""
+    n_frames = spec.shape[0]
+    power = np.empty((n_freqs, n_frames), dtype=np.float32)
+    for t in prange(n_frames):
+        for k in range(n_freqs):
+            re = spec[t, k]
+            im = spec[t, n_freqs + k]
+            power[k, t] = re * re + im * im
+    return power
+
+
+def _windowed_frames_numpy(padded: np.ndarray, window: np.ndarray, hop_length: int, n_frames: int) -> np.ndarray:
+    n_fft = window.shape[0]
+    return np.lib.stride_tricks.sliding_window_view(padded, n_fft)[::hop_length][:n_frames] * window
+
+
+def _power_numpy(spec: np.ndarray, n_freqs: int) -> np.ndarray:
+    return (np.square(spec[:, :n_freqs]) + np.square(spec[:, n_freqs:])).T
+
+
+if njit is not None:
+    _windowed_frames = njit(parallel=True, fastmath=True, cache=True)(_windowed_frames)
+    _power = njit(parallel=True, fastmath=True, cache=True)(_power)
+else:
+    _windowed_frames = _windowed_frames_numpy
+    _power = _power_numpy
+
+
+class CpuFeatureExtractor:
+    """Drop-in for faster-whisper's `FeatureExtractor` (see the module docstring).
+
+    The window and the stacked [cos | sin] real-DFT basis for the extractor's `n_fft` are built once; every other attribute
+    is delegated to the wrapped extractor.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        n_fft = base.n_fft
+        self.n_freqs = n_fft // 2 + 1
+        self.window = np.hanning(n_fft + 1)[:-1].astype(np.float32)
+        phase = 2.0 * np.pi * np.outer(np.arange(n_fft), np.arange(self.n_freqs)) / n_fft
+        self.dft_basis = np.ascontiguousarray(np.hstack((np.cos(phase), -np.sin(phase))), dtype=np.float32)  # (n_fft, 2 * n_freqs)
+        self.mel_filters = np.ascontiguousarray(base.mel_filters, dtype=np.float32)
+
+    def __getattr__(self, name):
+        return getattr(self.base, name)
+
+    def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length=None) -> np.ndarray:
+        if chunk_length is not None:
+            self.base.n_samples = chunk_length * self.base.sampling_rate
+            self.base.nb_max_frames = self.base.n_samples // self.base.hop_length
+        waveform = np.asarray(waveform, dtype=np.float32)
+        if padding:
+            waveform = np.pad(waveform, (0, padding))
+        padded = np.pad(waveform, self.base.n_fft // 2, mode="reflect")
+        # one frame per hop, minus the last one (as in Whisper)
+        n_frames = len(waveform) // self.base.hop_length
+        frames = _windowed_frames(padded, self.window, self.base.hop_length, n_frames)
+        power = _power(frames @ self.dft_basis, self.n_freqs)
+        log_spec = self.mel_filters @ power
+        np.maximum(log_spec, 1e-10, out=log_spec)
+        np.log10(log_spec, out=log_spec)
+        np.maximum(log_spec, log_spec.max() - 8.0, out=log_spec)
+        log_spec += 4.0
+        log_spec /= 4.0
+        return log_spec
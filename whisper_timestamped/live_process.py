@@ -0,0 +1,180 @@
+"""Live transcription with the model in a child process.
+
+`LiveTranscriberProcess` captures the microphone in the calling process into a shared-memory ring, while a
+`LiveTranscriber` in a child process (model, VAD, decoding, JSONL/WAV output) transcribes from that ring. Decoding then
+never competes with the caller's Python threads (e.g. a Tk mainloop) for the GIL, and the CUDA context stays out of the
+caller's process. Emitted segments are sent back over a queue and passed to `_emit`, which can be overridden as with
+`LiveTranscriber._emit`.
+"""
+import dataclasses
+import multiprocessing as mp
+import threading
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import List
+
+import numpy as np
+
+from whisper_timestamped.live import LiveConfig, LiveTranscriber, RingBuffer, _MicCapture, ring_capacity_samples
+
+# the shared block starts with the ring's `write_seq` (int64), padded to a cache line, followed by the samples
+_HEADER_BYTES = 64
+
+
+class SharedRingBuffer(RingBuffer):
+    """`RingBuffer` whose samples and `write_seq` live in a `SharedMemory` block, so one process can append while another reads.
+
+    Same single-producer/single-consumer protocol: the producer publishes `write_seq` (an aligned 8-byte store) only after
+    the samples are in place.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity_samples: int, dtype: np.dtype):
+        self.capacity = int(capacity_samples)
+        self._shm = shm  # the views below must not outlive the mapping
+        self.buffer = np.ndarray((self.capacity,), dtype=dtype, buffer=shm.buf, offset=_HEADER_BYTES)
+        self._write_seq = np.ndarray((1,), dtype=np.int64, buffer=shm.buf)
+        self._warm_up_kernels()
+
+    @staticmethod
+    def nbytes(capacity_samples: int, dtype: np.dtype) -> int:
+        return _HEADER_BYTES + int(capacity_samples) * np.dtype(dtype).itemsize
+
+    @property
+    def write_seq(self) -> int:
+        return int(self._write_seq[0])
+
+    @write_seq.setter
+    def write_seq(self, value: int):
+        self._write_seq[0] = value
+
+
+def _worker_main(cfg: LiveConfig, shm_name: str, capacity: int, start_epoch, step_ready, stop_event, ready_event, started_event, segments_queue):
+    """Child process: transcribes from the shared ring until `stop_event`, sending each emit's segments to `segments_queue`
+    (then `None` once done)."""
+    shm = shared_memory.SharedMemory(name=shm_name)  # (registered with the parent's resource tracker, which unlinks it)
+    try:
+        transcriber = LiveTranscriber(cfg, ring=SharedRingBuffer(shm, capacity, np.dtype(cfg.dtype)))
+        # The capture side lives in the parent: it wakes the inference loop and stops it through these shared events
+        transcriber._step_ready = step_ready
+        transcriber._stop_event = stop_event
+        emit_to_file = transcriber._emit
+
+        def emit(segments: List[dict]):
+            emit_to_file(segments)
+            segments_queue.put(segments)
+
+        transcriber._emit = emit
+        transcriber.warm_up()
+        ready_event.set()
+        while not started_event.wait(0.5):
+            if stop_event.is_set():
+                break
+        if not stop_event.is_set():
+            transcriber.recording_start_time = datetime.fromtimestamp(start_epoch.value)
+            transcriber.start_workers()
+            stop_event.wait()
+        transcriber.stop()
+        del transcriber  # drop its views of the shared block before closing it
+    finally:
+        segments_queue.put(None)
+        try:
+            shm.close()
+        except BufferError:
+            pass  # a view is still alive; the mapping goes away with the process
+
+
+class LiveTranscriberProcess(_MicCapture):
+    """Same interface as `LiveTranscriber` (`start()`, `stop()`, `_emit`, `jsonl_path`, `wav_path`), with the transcriber in a
+    child process (see the module docstring).
+
+    The child is started (and starts loading the model) on construction; `start()` waits for it to be warmed up before
+    opening the microphone.
+    """
+
+    def __init__(self, cfg: LiveConfig):
+        if cfg.session_name is None:
+            # named here so the output paths are known in this process too
+            cfg = dataclasses.replace(cfg, session_name=datetime.now().strftime("%Y%m%d_%H%M%S"))
+        self.cfg = cfg
+        self.basepath = cfg.output_dir / cfg.session_name
+        self.jsonl_path = self.basepath.with_suffix(".jsonl")
+        self.wav_path = self.basepath.with_suffix(".wav")
+
+        capacity = ring_capacity_samples(cfg)
+        dtype = np.dtype(cfg.dtype)
+        self._shm = shared_memory.SharedMemory(create=True, size=SharedRingBuffer.nbytes(capacity, dtype))
+        self._ring = SharedRingBuffer(self._shm, capacity, dtype)
+        self._ring.write_seq = 0
+        self._step_samples = max(1, int(cfg.step_s * cfg.sample_rate))
+        self._step_seq = 0
+
+        ctx = mp.get_context("spawn")  # a fresh interpreter, without copies of this process's GUI/CUDA state
+        self._start_epoch = ctx.Value("d", 0.0, lock=False)
+        self._step_ready = ctx.Event()
+        self._stop_event = ctx.Event()
+        self._ready_event = ctx.Event()
+        self._started_event = ctx.Event()
+        self._segments = ctx.Queue()
+        self._closed = False
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(cfg, self._shm.name, capacity, self._start_epoch, self._step_ready, self._stop_event, self._ready_event, self._started_event, self._segments),
+            daemon=True,
+        )
+        self._process.start()
+
+    def _emit(self, segments: List[dict]):
+        # The child has already written them to the JSONL file (and its own LSL outlet, if enabled)
+        pass
+
+    def _segment_reader(self):
+        while True:
+            segments = self._segments.get()
+            if segments is None:
+                return
+            self._emit(segments)
+
+    def start(self):
+        try:
+            import sounddevice as sd
+        except Exception as e:
+            raise RuntimeError("sounddevice not available. Please install extras.") from e
+
+        # Wait for the child to load the model and warm up
+        while not self._ready_event.wait(0.5):
+            if not self._process.is_alive():
+                self.stop()
+                raise RuntimeError(f"transcription worker process exited (code {self._process.exitcode}) before it was ready")
+
+        self._reader_thread = threading.Thread(target=self._segment_reader, daemon=True)
+        self._reader_thread.start()
+        self._stream = self._open_input_stream(sd)
+        self.recording_start_time = datetime.now()  # sample 0 is captured from here on (after the warm-up)
+        self._start_epoch.value = self.recording_start_time.timestamp()
+        self._started_event.set()
+        self._stream.start()
+
+    def stop(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._stop_event.set()
+        self._step_ready.set()  # wake the child's inference loop so it sees the stop
+        try:
+            if hasattr(self, "_stream"):
+                self._stream.stop()
+                self._stream.close()
+        except Exception:
+            pass
+        self._process.join(timeout=5.0)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._segments.put(None)  # in case the child died without sending it
+        if hasattr(self, "_reader_thread"):
+            self._reader_thread.join(timeout=2.0)
+        self._ring = None  # drop the views of the shared block before releasing it
+        try:
+            self._shm.close()
+        except BufferError:
+            pass
+        self._shm.unlink()
@@ -1,33 +1,24 @@
 from typing import Dict, List, Tuple, Optional, Callable, Union, Any
-from copy import deepcopy
-from RealtimeSTT import AudioToTextRecorder
-import pyautogui
-import pylsl
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
-import pyxdf
-from datetime import datetime, timedelta
-import os
+from tkinter import ttk, messagebox
+from datetime import datetime
+import dataclasses
+import functools
+import queue
 import threading
 import time
-import numpy as np
-import json
-import pickle
-import mne
 from pathlib import Path
-import pystray
-from PIL import Image, ImageDraw
-import keyboard
-import pyautogui
-import socket
-import sys
 import logging
 
-from phopylslhelper.general_helpers import unwrap_single_element_listlike_if_needed, readable_dt_str, from_readable_dt_str, localize_datetime_to_timezone, tz_UTC, tz_Eastern, _default_tz
-from phopylslhelper.easy_time_sync import EasyTimeSyncParsingMixin
+# pylsl loads liblsl on import; keep the module importable without it (the outlet setup reports it instead)
+try:
+    import pylsl
+except ImportError:
+    pylsl = None
 
 # Import the live transcription components
-from whisper_timestamped.live import LiveTranscriber, LiveConfig
+from whisper_timestamped.live import LiveTranscriber, LiveConfig, default_compute_type
+from whisper_timestamped.live_process import LiveTranscriberProcess
 try:
     import sounddevice as sd
     AUDIO_AVAILABLE = True
@@ -35,10 +26,25 @@ except ImportError:
     AUDIO_AVAILABLE = False
     sd = None
 
-import os  # add at top if not present
-program_lock_port = int(os.environ.get("LIVE_WHISPER_LOCK_PORT", 13371))
+EMIT_DRAIN_BATCH = 32  # max queued emits handled per pass of the LSL drain thread
+GUI_DRAIN_INTERVAL_MS = 50  # how often transcribed text is moved from the queue into the log display
+AUDIO_DEVICE_CACHE_TTL_S = 5.0  # how long a `sd.query_devices()` result is reused before re-enumerating
 
 logger = logging.getLogger(__name__)
+
+
+def _safe_gui(fn):
+    """Decorator for methods that only touch Tk widgets: skipped once the app is shutting down, and a `tk.TclError` from
+    widgets that are being destroyed is ignored."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if self._shutting_down:
+            return None
+        try:
+            return fn(self, *args, **kwargs)
+        except tk.TclError:
+            return None  # GUI is being destroyed
+    return wrapper
 logging.basicConfig(level=logging.INFO)
 
 
@@ -63,7 +69,7 @@ class LiveWhisperTranscriptionAppMixin:
 
     """
     @property
-    def outlet_LiveWhisperTranscriptionAppMixin(self) -> Optional[pylsl.StreamOutlet]:
+    def outlet_LiveWhisperTranscriptionAppMixin(self) -> Optional["pylsl.StreamOutlet"]:
         """The outlet_LiveWhisperTranscriptionAppMixin property."""
         return self.outlets['WhisperLiveLogger']
     @outlet_LiveWhisperTranscriptionAppMixin.setter
@@ -77,11 +83,34 @@ class LiveWhisperTranscriptionAppMixin:
         self.whisper_live_transcript_path = None
         self.transcription_active = False
         self.transcription_config = None
+        self._audio_device_cache = (None, 0.0)  # (input devices, time.monotonic() when queried)
+        self._device_list_prev = None  # combobox values last assigned by `refresh_audio_devices`
+        self._device_indices = [None]  # sounddevice index of each combobox entry (None for "Default")
+        # Emitted segments are handed off here so the transcriber thread never blocks on LSL or Tk
+        self._emit_queue = queue.SimpleQueue()  # (segments, time.time()) items, `None` stops the drain thread
+        self._gui_queue = queue.SimpleQueue()  # (text, time.time()) items for the log display
+        self._emit_drain_thread = None
+        self._shown_step_s = None  # step currently shown in the status label
+        # (model key, WhisperModel) of the last session, reused by the next one as long as the key still matches
+        self._whisper_model_cache = (None, None)
+        # Run the model in a child process (fed through shared memory) so decoding doesn't compete with the Tk thread for the GIL
+        self.transcription_in_subprocess = False
+        # Load (and warm up) the model on a background thread at setup, so the first start doesn't wait for it
+        self.preload_transcription_model = True
+        self._preload_thread = None
+        # Makes the preload's "are these still the current settings?" check and its publishing of the transcriber one step
+        # with respect to `save_settings` swapping the config
+        self._transcription_config_lock = threading.Lock()
+        # Fully populated outlet `StreamInfo`s by (hostname, version), so reconnecting doesn't rebuild the XML description
+        self._lsl_stream_info_cache = {}
 
 
     def setup_LiveWhisperTranscriptionAppMixin(self):
         # Setup transcription configuration
         self.setup_transcription_config()
+        if self.preload_transcription_model and AUDIO_AVAILABLE and (not self.transcription_in_subprocess):
+            self._preload_thread = threading.Thread(target=self._preload_live_transcriber, daemon=True)
+            self._preload_thread.start()
 
 
     def setup_gui_LiveWhisperTranscriptionAppMixin(self, main_frame: ttk.Frame, row: int=2):
@@ -119,7 +148,7 @@ class LiveWhisperTranscriptionAppMixin:
         self.refresh_audio_devices()
 
         # Refresh devices button
-        ttk.Button(transcription_frame, text="Refresh", command=self.refresh_audio_devices).grid(row=1, column=3, padx=5, pady=(5, 0))
+        ttk.Button(transcription_frame, text="Refresh", command=lambda: self.refresh_audio_devices(force=True)).grid(row=1, column=3, padx=5, pady=(5, 0))
         return transcription_frame
 
 
@@ -137,7 +166,32 @@ class LiveWhisperTranscriptionAppMixin:
         """
         assert self.outlets is not None
         try:
+            if pylsl is None:
+                raise RuntimeError("pylsl is not installed")
+
+            # Create outlet
+            self.outlets['WhisperLiveLogger'] = pylsl.StreamOutlet(self._build_stream_info_LiveWhisperTranscriptionAppMixin(hostname='TODO', version='1.0'))
+            print("WhisperLiveLogger LSL outlet created successfully")
+
+            # # Update LSL status label safely (wrap in a `@_safe_gui` method)
+            # self.lsl_status_label.config(text="LSL Status: Connected", foreground="green")
+
+            # # Setup inlet for recording our own stream (with delay to allow outlet to be discovered)
+            # self.root.after(1000, self.setup_recording_inlet)
+
+        except Exception as e:
+            print(f"Error creating WhisperLiveLogger LSL outlet: {e}")
+            self.outlets['WhisperLiveLogger'] = None
+            # self.lsl_status_label.config(text=f"LSL Status: Error - {str(e)}", foreground="red")  # (in a `@_safe_gui` method)
             
+            raise
+
+    def _build_stream_info_LiveWhisperTranscriptionAppMixin(self, hostname: str, version: str) -> "pylsl.StreamInfo":
+        """The outlet's `StreamInfo` with its metadata and time-sync fields, built once per (hostname, version) and reused
+        (`StreamOutlet` copies the info, so sharing it between outlets is safe)."""
+        key = (hostname, version)
+        info = self._lsl_stream_info_cache.get(key)
+        if info is None:
             # Create stream info
             info = pylsl.StreamInfo(
                 name='WhisperLiveLogger',
@@ -150,38 +204,14 @@ class LiveWhisperTranscriptionAppMixin:
 
             # Add some metadata
             info.desc().append_child_value("manufacturer", "PhoWhisperTimestampedLive")
-            info.desc().append_child_value("version", "1.0")
+            info.desc().append_child_value("version", version)
             info.desc().append_child_value("description", "Live transcribed audio")
-            info.desc().append_child_value('hostname', 'TODO')
+            info.desc().append_child_value('hostname', hostname)
 
             ## add a custom timestamp field to the stream info:
             info = self.EasyTimeSyncParsingMixin_add_lsl_outlet_info(info=info)
-
-
-            # Create outlet
-            self.outlets['WhisperLiveLogger'] = pylsl.StreamOutlet(info)
-            print("WhisperLiveLogger LSL outlet created successfully")
-
-            # # Update LSL status label safely
-            # try:
-            #     if not self._shutting_down:
-            #         self.lsl_status_label.config(text="LSL Status: Connected", foreground="green")
-            # except tk.TclError:
-            #     pass  # GUI is being destroyed
-
-            # # Setup inlet for recording our own stream (with delay to allow outlet to be discovered)
-            # self.root.after(1000, self.setup_recording_inlet)
-
-        except Exception as e:
-            print(f"Error creating WhisperLiveLogger LSL outlet: {e}")
-            self.outlets['WhisperLiveLogger'] = None
-            # try:
-            #     if not self._shutting_down:
-            #         self.lsl_status_label.config(text=f"LSL Status: Error - {str(e)}", foreground="red")
-            # except tk.TclError:
-            #     pass  # GUI is being destroyed
-            
-            raise
+            self._lsl_stream_info_cache[key] = info
+        return info
 
     # ---------------------------------------------------------------------------- #
     #                           Live Transcription Methods                         #
@@ -194,17 +224,19 @@ class LiveWhisperTranscriptionAppMixin:
 
         """
         self.transcription_config = LiveConfig(
-            model="medium",  # Good balance of speed and accuracy
+            model="small.en",  # with int8 weights, fast enough for real-time on CPU; pick "medium.en" if accuracy matters more
             device=None,  # Auto-detect
-            compute_type=None,  # Auto-detect
+            compute_type=default_compute_type(),  # int8_float16 with CUDA, int8 on CPU
+            feature_extractor_device=None,  # log-mel features on the model's device ("cuda" uses the GPU STFT even for a CPU model)
             language='en',  # Auto-detect
             beam_size=1,
             vad_filter=True,
             chunk_length_s=15.0,
             step_s=2.0,
+            ring_buffer_seconds=2 * 15.0,  # two windows of int16 samples (~1 MB), preallocated once; the audio callback only copies into it
             sample_rate=16000,
             channels=1,
-            dtype="float32",
+            dtype="int16",  # native capture format; converted to float32 only when a window is decoded
             output_dir=whisper_live_transcripts_dir,
             session_name=None,
             write_audio_wav=True,
@@ -213,10 +245,66 @@ class LiveWhisperTranscriptionAppMixin:
             word_timestamps=True,
             no_speech_threshold=0.6,
             logprob_threshold=-1.0,
-            temperature=0.0
+            temperature=0.0,
+            use_local_agreement=True,  # commit long utterances as they stabilize instead of when they end
+            adaptive_step=True,  # back off the step when decoding can't keep up (shown next to the status)
+            warmup_passes=3,  # done by the background preload, or else inside `LiveTranscriber.start()` (before `transcription_active` is set)
         )
 
 
+    def _preload_live_transcriber(self):
+        """Background thread: creates and warms up the transcriber for the current settings, leaving it paused for the first
+        `start_live_transcription()` to resume"""
+        try:
+            transcriber = self._create_live_transcriber()
+            transcriber.warm_up()
+        except Exception as e:
+            logger.warning(f"preloading the transcription model failed (it will be loaded on start instead): {e}")
+            return
+        with self._transcription_config_lock:
+            if transcriber.cfg is not self.transcription_config:
+                # The settings were changed while it loaded: the next start builds one with the new settings instead (and
+                # `_create_live_transcriber` releases these weights first unless they are still the right ones)
+                logger.info(f"\t discarded the preloaded live transcriber (settings changed while loading).")
+                return
+            self.live_transcriber = transcriber
+        logger.info(f"\t preloaded live transcriber instance.")
+
+
+    def _create_live_transcriber(self) -> LiveTranscriber:
+        """In-process transcriber for `transcription_config`, reusing the previous session's model if its weights are still the
+        right ones, with `_emit` hooked up to the LSL/log display drain"""
+        cached_key, cached_model = self._whisper_model_cache
+        reused_model = cached_model if (cached_key == self._transcription_model_key()) else None
+        self._whisper_model_cache = (None, None)  # release a stale model before loading the new one
+        transcriber = LiveTranscriber(self.transcription_config, model=reused_model)
+        # keyed by the config the model was loaded for (with device/compute_type now resolved), which may no longer be the
+        # current one if the settings were saved while the preload was loading it
+        self._whisper_model_cache = (self._transcription_model_key(transcriber.cfg), transcriber.model)
+        logger.info(f"\t created live transcriber instance ({'reused' if reused_model is not None else 'loaded'} model).")
+        self._install_emit_hook(transcriber)
+        return transcriber
+
+
+    def _install_emit_hook(self, transcriber):
+        """Override the transcriber's _emit method: file logging stays on the transcriber thread (a buffered append), the LSL
+        push and the log display are handed off to `_lsl_drain_loop` / `_gui_drain`"""
+        original_emit = transcriber._emit
+        def custom_emit(segments):
+            original_emit(segments)
+            self._emit_queue.put((segments, time.time()))
+
+        transcriber._emit = custom_emit
+
+
+    def _transcription_model_key(self, cfg: Optional[LiveConfig]=None) -> Tuple:
+        """The config fields (of `cfg`, the current config by default) that require loading the model weights again when they
+        change (the others are per-session knobs)."""
+        if cfg is None:
+            cfg = self.transcription_config
+        return (cfg.model, cfg.device, cfg.compute_type)
+
+
     @property
     def whisper_live_transcripts_dir(self) -> Path:
         """The whisper_live_transcripts_dir property."""
@@ -226,17 +314,23 @@ class LiveWhisperTranscriptionAppMixin:
         self.transcription_config.output_dir = value
 
 
-    def get_audio_devices(self):
-        """Get list of available audio input devices"""
+    def get_audio_devices(self, force: bool = False):
+        """Get list of available audio input devices
+
+        The result of the (slow, host-API enumerating) `sd.query_devices()` call is cached for `AUDIO_DEVICE_CACHE_TTL_S`
+        seconds; pass `force=True` to re-query.
+        """
         if not AUDIO_AVAILABLE:
             return []
 
+        cached_devices, cached_at = getattr(self, '_audio_device_cache', (None, 0.0))
+        if (not force) and (cached_devices is not None) and ((time.monotonic() - cached_at) < AUDIO_DEVICE_CACHE_TTL_S):
+            return cached_devices
+
         try:
             devices = sd.query_devices()
-            input_devices = []
-            for i, device in enumerate(devices):
-                if device['max_input_channels'] > 0:
-                    input_devices.append((i, device['name']))
+            input_devices = [(i, device['name']) for i, device in enumerate(devices) if device['max_input_channels'] > 0]
+            self._audio_device_cache = (input_devices, time.monotonic())
             return input_devices
         except Exception as e:
             print(f"Error getting audio devices: {e}")
@@ -255,6 +349,11 @@ class LiveWhisperTranscriptionAppMixin:
             return
 
         try:
+            if self._preload_thread is not None:
+                # Started before the preload finished: wait for it rather than loading a second copy of the model
+                self._preload_thread.join()
+                self._preload_thread = None
+
             # Setup configuration if not already done
             if not self.transcription_config:
                 self.setup_transcription_config()
@@ -263,84 +362,77 @@ class LiveWhisperTranscriptionAppMixin:
             session_name = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.transcription_config.session_name = session_name
 
-            # Set selected audio device
-            selected_device = self.audio_device_var.get()
-            if selected_device != "Default":
-                # Extract device index from the selection
-                device_index = int(selected_device.split(":")[0])
-                self.transcription_config.mic_device = device_index
-
-            # Create transcriber instance
-            self.live_transcriber = LiveTranscriber(self.transcription_config)
-            logger.info(f"\t created live transcriber instance.")
-
-            # Override the _emit method to send to our LSL stream
-            original_emit = self.live_transcriber._emit
-            def custom_emit(segments):
-                # Send to our LSL outlet
-                logger.info(f".custom_emit(segments={segments})  hit")
-                for seg in segments:
-                    text = seg.get("text", "").strip()
-                    if text:
-                        self.send_lsl_message(text)
-                        # Update GUI display
-                        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        self.update_log_display(f"[TRANSCRIBED] {text}", timestamp)
-
-                # Also call original emit for file logging
-                original_emit(segments)
-
-            self.live_transcriber._emit = custom_emit
-
-            # Start transcription
-            self.live_transcriber.start()
-            logger.info(f"\t started live transcription.")
+            # Set selected audio device (None for "Default", or when nothing valid is selected)
+            selected_index = self.audio_device_combo.current()
+            self.transcription_config.mic_device = self._device_indices[selected_index] if (0 <= selected_index < len(self._device_indices)) else None
+
+            resumed = isinstance(self.live_transcriber, LiveTranscriber) and (self.live_transcriber.cfg is self.transcription_config)
+            if resumed:
+                # Preloaded, or paused by the previous stop, with these same settings: resume it (model loaded and warmed up,
+                # `_emit` already overridden) as a new session
+                self.live_transcriber.resume()
+                logger.info(f"\t resumed live transcriber instance.")
+            elif self.transcription_in_subprocess:
+                # The model is loaded in the worker process (each session), so there is nothing to reuse here
+                self._whisper_model_cache = (None, None)
+                self.live_transcriber = LiveTranscriberProcess(self.transcription_config)
+                self._install_emit_hook(self.live_transcriber)
+                logger.info(f"\t created live transcriber worker process.")
+            else:
+                self.live_transcriber = self._create_live_transcriber()
+
+            self._emit_drain_thread = threading.Thread(target=self._lsl_drain_loop, daemon=True)
+            self._emit_drain_thread.start()
+            self.root.after(GUI_DRAIN_INTERVAL_MS, self._gui_drain)
+
+            if not resumed:
+                # Start transcription
+                self.live_transcriber.start()
+                logger.info(f"\t started live transcription.")
             
             self.transcription_active = True
 
             # Update GUI
-            try:
-                if not self._shutting_down:
-                    self.transcription_status_label.config(text="Transcribing...", foreground="green")
-                    self.start_transcription_button.config(state="disabled")
-                    self.stop_transcription_button.config(state="normal")
-                    self.transcription_settings_button.config(state="disabled")
-            except tk.TclError:
-                pass
+            self._set_transcribing_state(True)
 
             self.update_log_display("Live transcription started", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
             print(f"Live transcription started with session: {session_name}")
 
         except Exception as e:
             logger.error(f".start_live_transcription()  error: {e}")
+            if self._emit_drain_thread is not None:
+                self._emit_queue.put(None)
+                self._emit_drain_thread = None
             messagebox.showerror("Error", f"Failed to start live transcription: {str(e)}")
             print(f"Error starting transcription: {e}")
             import traceback
             traceback.print_exc()
 
 
-    def stop_live_transcription(self):
-        """Stop live audio transcription"""
-        logger.info(f".stop_live_transcription()  hit")
+    def stop_live_transcription(self, shutting_down: bool=False):
+        """Stop live audio transcription. With `shutting_down` (app exit), waits for the last decode to be written to the
+        transcript rather than keeping the transcriber paused for the next start."""
+        logger.info(f".stop_live_transcription(shutting_down={shutting_down})  hit")
         if not self.transcription_active:
             return
 
         try:
-            if self.live_transcriber:
+            if isinstance(self.live_transcriber, LiveTranscriber) and (not shutting_down):
+                self.live_transcriber.pause()  # keeps the model loaded (and warmed up) for the next start
+            elif self.live_transcriber:
                 self.live_transcriber.stop()
                 self.live_transcriber = None
 
+            if self._emit_drain_thread is not None:
+                self._emit_queue.put(None)
+                self._emit_drain_thread.join(timeout=2.0)
+                self._emit_drain_thread = None
+
             self.transcription_active = False
+            self._gui_drain()  # show whatever was transcribed last (doesn't reschedule now that we're inactive)
 
             # Update GUI
-            try:
-                if not self._shutting_down:
-                    self.transcription_status_label.config(text="Not Transcribing", foreground="red")
-                    self.start_transcription_button.config(state="normal")
-                    self.stop_transcription_button.config(state="disabled")
-                    self.transcription_settings_button.config(state="normal")
-            except tk.TclError:
-                pass
+            self._set_transcribing_state(False)
 
             self.update_log_display("Live transcription stopped", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
             print("Live transcription stopped")
@@ -349,6 +441,87 @@ class LiveWhisperTranscriptionAppMixin:
             print(f"Error stopping transcription: {e}")
 
 
+    @_safe_gui
+    def _set_transcribing_state(self, active: bool):
+        """Updates the status label and buttons for transcription being started (`active`) or stopped"""
+        self.transcription_status_label.config(text=("Transcribing..." if active else "Not Transcribing"), foreground=("green" if active else "red"))
+        self._shown_step_s = None
+        self.start_transcription_button.config(state=("disabled" if active else "normal"))
+        self.stop_transcription_button.config(state=("normal" if active else "disabled"))
+        self.transcription_settings_button.config(state=("disabled" if active else "normal"))
+
+
+    def _lsl_drain_loop(self):
+        """Drain thread: sends queued transcriptions over LSL (up to `EMIT_DRAIN_BATCH` emits per pass) and forwards them
+        to `_gui_queue` for the log display. Exits on the `None` sentinel put by `stop_live_transcription`."""
+        while True:
+            batch = [self._emit_queue.get()]
+            while (len(batch) < EMIT_DRAIN_BATCH) and (batch[-1] is not None):
+                try:
+                    batch.append(self._emit_queue.get_nowait())
+                except queue.Empty:
+                    break
+            texts = []
+            for item in batch:
+                if item is None:
+                    break
+                segments, ts = item
+                for seg in segments:
+                    text = seg.get("text", "").strip()
+                    if text:
+                        texts.append(text)
+                        self._gui_queue.put((text, ts))
+            # One LSL push for the whole batch rather than one per segment
+            if texts:
+                self.send_lsl_messages(texts)
+            if batch[-1] is None:
+                return
+
+
+    def send_lsl_messages(self, messages: List[str]):
+        """Send several messages via LSL as a single chunk (all stamped with the current LSL time)"""
+        try:
+            outlet = self.outlet_LiveWhisperTranscriptionAppMixin
+        except (AttributeError, KeyError):
+            outlet = None
+        if outlet is None:
+            print("LSL outlet not available")
+            return
+        try:
+            outlet.push_chunk(messages, pylsl.local_clock())
+            print(f"LSL messages sent: {len(messages)}")
+        except Exception as e:
+            print(f"Error sending LSL messages: {e}")
+
+
+    def _gui_drain(self):
+        """Tk-thread poller: moves queued transcriptions into the log display, rescheduling itself while transcribing."""
+        # Segments of the same emit share a timestamp, so format each distinct second only once
+        last_sec, timestamp = None, None
+        while True:
+            try:
+                text, ts = self._gui_queue.get_nowait()
+            except queue.Empty:
+                break
+            sec = int(ts)
+            if sec != last_sec:
+                last_sec, timestamp = sec, datetime.fromtimestamp(sec).isoformat(sep=' ', timespec='seconds')
+            self.update_log_display(f"[TRANSCRIBED] {text}", timestamp)
+
+        if self.transcription_active and (not self._shutting_down):
+            self._show_step_s()
+            self.root.after(GUI_DRAIN_INTERVAL_MS, self._gui_drain)
+
+
+    @_safe_gui
+    def _show_step_s(self):
+        """Shows the transcriber's current (possibly adapted) step next to the status, when it changed"""
+        step_s = getattr(self.live_transcriber, 'step_s', None)  # (not reported by the worker-process transcriber)
+        if (step_s is not None) and (step_s != self._shown_step_s):
+            self._shown_step_s = step_s
+            self.transcription_status_label.config(text=f"Transcribing... (step {step_s:.1f}s)")
+
+
     def auto_start_live_transcription(self):
         """ tries to start live transcription on startup """
         try:
@@ -366,14 +539,14 @@ class LiveWhisperTranscriptionAppMixin:
 
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Transcription Settings")
-        settings_window.geometry("400x500")
+        settings_window.geometry("400x700")
         settings_window.transient(self.root)
         settings_window.grab_set()
 
         # Center the window
         settings_window.update_idletasks()
         x = (settings_window.winfo_screenwidth() // 2) - (400 // 2)
-        y = (settings_window.winfo_screenheight() // 2) - (500 // 2)
+        y = (settings_window.winfo_screenheight() // 2) - (700 // 2)
         settings_window.geometry(f"+{x}+{y}")
 
         main_frame = ttk.Frame(settings_window, padding="10")
@@ -383,7 +556,7 @@ class LiveWhisperTranscriptionAppMixin:
         ttk.Label(main_frame, text="Whisper Model:").pack(anchor=tk.W, pady=(0, 5))
         model_var = tk.StringVar(value=self.transcription_config.model)
         model_combo = ttk.Combobox(main_frame, textvariable=model_var,
-                                  values=["tiny", "base", "small", "medium", "large-v3"],
+                                  values=["tiny", "tiny.en", "base", "base.en", "small", "small.en", "medium", "medium.en", "large-v3"],
                                   state="readonly")
         model_combo.pack(fill=tk.X, pady=(0, 10))
 
@@ -400,6 +573,20 @@ class LiveWhisperTranscriptionAppMixin:
                                    values=["auto", "cpu", "cuda"], state="readonly")
         device_combo.pack(fill=tk.X, pady=(0, 10))
 
+        # Feature extraction device
+        ttk.Label(main_frame, text="Feature Extraction Device:").pack(anchor=tk.W, pady=(0, 5))
+        feature_device_var = tk.StringVar(value=self.transcription_config.feature_extractor_device or "auto")
+        feature_device_combo = ttk.Combobox(main_frame, textvariable=feature_device_var,
+                                           values=["auto", "cpu", "cuda"], state="readonly")
+        feature_device_combo.pack(fill=tk.X, pady=(0, 10))
+
+        # Compute type
+        ttk.Label(main_frame, text="Compute Type:").pack(anchor=tk.W, pady=(0, 5))
+        compute_type_var = tk.StringVar(value=self.transcription_config.compute_type or "auto")
+        compute_type_combo = ttk.Combobox(main_frame, textvariable=compute_type_var,
+                                         values=["auto", "int8_float16", "int8", "float16", "float32"], state="readonly")
+        compute_type_combo.pack(fill=tk.X, pady=(0, 10))
+
         # VAD filter
         vad_var = tk.BooleanVar(value=self.transcription_config.vad_filter)
         ttk.Checkbutton(main_frame, text="Enable Voice Activity Detection (VAD)",
@@ -419,38 +606,67 @@ class LiveWhisperTranscriptionAppMixin:
                                textvariable=step_var, format="%.1f")
         step_spin.pack(fill=tk.X, pady=(0, 10))
 
+        # Capture sample format
+        ttk.Label(main_frame, text="Capture Sample Format:").pack(anchor=tk.W, pady=(0, 5))
+        dtype_var = tk.StringVar(value=self.transcription_config.dtype)
+        dtype_combo = ttk.Combobox(main_frame, textvariable=dtype_var,
+                                  values=["int16", "float32"], state="readonly")
+        dtype_combo.pack(fill=tk.X, pady=(0, 10))
+
         # Save audio
         save_audio_var = tk.BooleanVar(value=self.transcription_config.write_audio_wav)
         ttk.Checkbutton(main_frame, text="Save audio to WAV file",
                        variable=save_audio_var).pack(anchor=tk.W, pady=(0, 10))
 
+        # Worker process
+        subprocess_var = tk.BooleanVar(value=self.transcription_in_subprocess)
+        ttk.Checkbutton(main_frame, text="Run the model in a separate process",
+                       variable=subprocess_var).pack(anchor=tk.W, pady=(0, 10))
+
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(20, 0))
 
         def save_settings():
-            self.transcription_config.model = model_var.get()
-            self.transcription_config.language = language_var.get() or None
-            self.transcription_config.device = device_var.get() if device_var.get() != "auto" else None
-            self.transcription_config.vad_filter = vad_var.get()
-            self.transcription_config.chunk_length_s = chunk_var.get()
-            self.transcription_config.step_s = step_var.get()
-            self.transcription_config.write_audio_wav = save_audio_var.get()
+            model_key_before = self._transcription_model_key()
+            # Swap in a new config in one step rather than mutating the current one field by field
+            new_config = dataclasses.replace(
+                self.transcription_config,
+                model=model_var.get(),
+                language=language_var.get() or None,
+                device=device_var.get() if device_var.get() != "auto" else None,
+                feature_extractor_device=feature_device_var.get() if feature_device_var.get() != "auto" else None,
+                compute_type=compute_type_var.get() if compute_type_var.get() != "auto" else None,
+                vad_filter=vad_var.get(),
+                chunk_length_s=chunk_var.get(),
+                step_s=step_var.get(),
+                ring_buffer_seconds=2 * chunk_var.get(),
+                dtype=dtype_var.get(),
+                write_audio_wav=save_audio_var.get(),
+            )
+            with self._transcription_config_lock:
+                self.transcription_config = new_config
+                if not self.transcription_active:
+                    self.live_transcriber = None  # a paused transcriber has the old settings; the next start builds one with these
+            self.transcription_in_subprocess = subprocess_var.get()
+            if self._transcription_model_key() != model_key_before:
+                self._whisper_model_cache = (None, None)  # drop the loaded weights now; the next start loads the new model
             settings_window.destroy()
 
         ttk.Button(button_frame, text="Save", command=save_settings).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="Cancel", command=settings_window.destroy).pack(side=tk.RIGHT)
 
 
-    def refresh_audio_devices(self):
-        """Refresh the list of available audio devices"""
-        devices = self.get_audio_devices()
-        device_list = ["Default"]
-
-        for device_id, device_name in devices:
-            device_list.append(f"{device_id}: {device_name}")
+    def refresh_audio_devices(self, force: bool = False):
+        """Refresh the list of available audio devices (`force=True` bypasses the device cache)"""
+        devices = self.get_audio_devices(force=force)
+        device_list = ["Default"] + [f"{device_id}: {device_name}" for device_id, device_name in devices]
 
-        self.audio_device_combo['values'] = device_list
+        # Only touch the widget (which redraws it) when the devices actually changed
+        if device_list != self._device_list_prev:
+            self.audio_device_combo['values'] = device_list
+            self._device_list_prev = device_list
+            self._device_indices = [None] + [device_id for device_id, _ in devices]
 
         # Set to default if current selection is not in the list
         if self.audio_device_var.get() not in device_list:
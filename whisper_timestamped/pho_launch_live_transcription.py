@@ -1,27 +1,32 @@
-from copy import deepcopy
-from RealtimeSTT import AudioToTextRecorder
-import pyautogui
 import pylsl
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import pylsl
-import pyxdf
 from datetime import datetime, timedelta
 import os
 import threading
 import time
 import numpy as np
 import json
-import pickle
-import mne
 from pathlib import Path
-import pystray
-from PIL import Image, ImageDraw
-import keyboard
-import pyautogui
-import socket
 import sys
+import tempfile
 import logging
+import traceback
+import multiprocessing
+import queue
+import concurrent.futures
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if sys.platform == 'win32':
+    import msvcrt
+    fcntl = None
+else:
+    import fcntl
+    msvcrt = None
 
 from phopylslhelper.general_helpers import unwrap_single_element_listlike_if_needed, readable_dt_str, from_readable_dt_str, localize_datetime_to_timezone, tz_UTC, tz_Eastern, _default_tz
 from phopylslhelper.easy_time_sync import EasyTimeSyncParsingMixin
@@ -37,11 +42,22 @@ from whisper_timestamped.mixins.live_whisper_transcription import LiveWhisperTra
 #     sd = None
 
 import os  # add at top if not present
-program_lock_port = int(os.environ.get("LIVE_WHISPER_LOCK_PORT", 13371))
+program_lock_path = Path(os.environ.get("LIVE_WHISPER_LOCK_PATH", Path(tempfile.gettempdir()).joinpath('live_whisper.lock')))
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+RECORDING_PULL_MAX_SAMPLES = 1024  # most marker samples taken from the recording inlet per pull
+RECORDING_PULL_TIMEOUT_S = 0.2  # longest a pull waits for new markers (also bounds how late a stop is noticed)
+BACKUP_QUEUE_MAXSIZE = 64  # pending backup chunks before `recording_worker` waits on the backup writer
+BACKUP_WRITE_BUFFER_BYTES = 4 * 1024 * 1024
+CSV_WRITE_BUFFER_BYTES = 1024 * 1024
+RECORDED_TIMESTAMPS_INITIAL_CAPACITY = 1024  # timestamps the recording buffer holds before it first grows (it doubles)
+LOCAL_OFFSET_BUCKET_S = 900  # UTC offset changes (DST) fall on quarter-hour boundaries
+SAVE_POLL_INTERVAL_MS = 100  # how often the Tk loop checks whether a stopped recording has been saved
+TRAY_POLL_INTERVAL_MS = 100  # how often the Tk loop checks for system tray menu actions
+LOG_DISPLAY_FLUSH_INTERVAL_MS = 33  # log lines added within this interval are inserted into the display together (~30 Hz)
+
 
 _default_xdf_folder = Path(r'E:/Dropbox (Personal)/Databases/UnparsedData/PhoLogToLabStreamingLayer_logs').resolve()
 # _default_xdf_folder = Path('/media/halechr/MAX/cloud/University of Michigan Dropbox/Pho Hale/Personal/LabRecordedTextLog').resolve() ## Lab computer
@@ -52,27 +68,125 @@ whisper_lsl_converted_transcripts_dir: Path = whisper_transcripts_dir.joinpath('
 whisper_live_transcripts_dir: Path = Path("E:/Dropbox (Personal)/Databases/UnparsedData/PhoLogToLabStreamingLayer_logs/live_transcripts").resolve()
 
 
+_now_str_cache = [None, '']  # [int(time.time()) of the last call, its formatted string]
+
+
+def _now_str() -> str:
+    """The current local time as "%Y-%m-%d %H:%M:%S" for the log display, formatted once per second of wall-clock time."""
+    sec = int(time.time())
+    if sec != _now_str_cache[0]:
+        _now_str_cache[:] = [sec, datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S")]
+    return _now_str_cache[1]
+
+
+def _format_local_timestamps(timestamps) -> list:
+    """Format POSIX timestamps as local "%Y-%m-%d %H:%M:%S.mmm" strings, identical to
+    `datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]` but converted and formatted as a whole array: the UTC
+    offset is only looked up once per `LOCAL_OFFSET_BUCKET_S` span that has timestamps in it."""
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    seconds = np.floor(timestamps)
+    # (the fraction rounded to microseconds on its own, as `fromtimestamp` does)
+    us = seconds.astype(np.int64) * 1_000_000 + np.round((timestamps - seconds) * 1e6).astype(np.int64)
+    buckets, bucket_index = np.unique(seconds.astype(np.int64) // LOCAL_OFFSET_BUCKET_S, return_inverse=True)
+    offsets_us = np.array([time.localtime(b * LOCAL_OFFSET_BUCKET_S).tm_gmtoff for b in buckets.tolist()], dtype=np.int64) * 1_000_000
+    local_times = (us + offsets_us[bucket_index]).astype('datetime64[us]')
+    return [s.replace('T', ' ') for s in np.datetime_as_string(local_times, unit='ms').tolist()]
+
+
+def _csv_quote(text: str) -> str:
+    """`text` as a CSV field, quoted the way `csv.writer` (`QUOTE_MINIMAL`) does."""
+    if ('"' in text) or (',' in text) or ('\n' in text) or ('\r' in text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _backup_line(sample, timestamp) -> bytes:
+    """One line of a `.backup.jsonl` file: the marker as a `[sample, timestamp]` JSON array."""
+    if orjson is not None:
+        return orjson.dumps([sample, timestamp], option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps([sample, timestamp]) + '\n').encode('utf-8')
+
+
+def _try_lock_file(fh) -> bool:
+    """Takes a non-blocking exclusive lock on the open lock file `fh`, returning False if another process holds it."""
+    try:
+        if msvcrt is not None:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _acquire_lock_file(lock_path):
+    """Opens and locks the singleton lock file at `lock_path`, returning the open file (to be kept open for as long as the
+    lock is held), or None if another process holds it. Needs no Tk, so `main()` can call it before creating the root."""
+    try:
+        fh = open(lock_path, 'a+')
+    except OSError as e:
+        print(f"Failed to open singleton lock file: {e}")
+        return None
+    if not _try_lock_file(fh):
+        fh.close()
+        print(f"Failed to acquire singleton lock: lock file is held by another instance: {lock_path}")
+        return None
+    return fh
+
+
+def _unlock_file(fh):
+    if msvcrt is not None:
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _run_system_tray(icon_image, action_queue, stop_event):
+    """Child process: runs the system tray icon's message loop (away from Tk's), sending the chosen menu actions
+    ('show' / 'quit') to `action_queue`, until `stop_event` is set"""
+    import pystray
+
+    menu = pystray.Menu(
+        pystray.MenuItem("Show App", lambda: action_queue.put('show'), default=True),  # the default item also handles double-clicks
+        pystray.MenuItem("Exit", lambda: action_queue.put('quit'))
+    )
+
+    def setup(icon):
+        # runs on its own thread once the message loop is up
+        icon.visible = True
+        stop_event.wait()
+        icon.stop()  # removes the icon from the tray (a terminated process would leave a dead one behind on Windows)
+
+    pystray.Icon("logger_app", icon_image, "LSL Live Transcription", menu).run(setup=setup)
+
+
 ####################################################################
 ## The desired object-oriented class-based manager for the live app
 # TODO: not fully implemented, copied from another similar app but haven't made it work yet.
 class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsingMixin):
     # Class variable to track if an instance is already running
     _instance_running = False
-    _lock_port = program_lock_port  # Port to use for singleton check
+    _lock_path = program_lock_path  # Lock file to use for singleton check
+    _theme_icon_filename = None  # Icon filename for the detected system theme (detected once per process)
+    _tray_icon_image = None  # Decoded and resized system tray icon
 
     @classmethod
     def is_instance_running(cls):
         """Check if another instance is already running"""
         try:
-            # Try to bind to a specific port
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            test_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            test_socket.bind(('localhost', cls._lock_port))
-            test_socket.close()
-            return False
+            lock_file = open(cls._lock_path, 'a+')
         except OSError:
-            # Port is already in use, another instance is running
-            return True
+            return False
+        try:
+            if not _try_lock_file(lock_file):
+                # Lock is already held, another instance is running
+                return True
+            _unlock_file(lock_file)
+            return False
+        finally:
+            lock_file.close()
 
     @classmethod
     def mark_instance_running(cls):
@@ -95,10 +209,26 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
         # Recording state
         self.recording = False
-        self.recording_thread = None
+        self.recording_thread = None  # long-lived `recording_worker`, started with the first recording
+        self._recording_active = threading.Event()  # set while `recording_worker` should pull from the inlet
+        self._recording_idle = threading.Event()  # set while it isn't pulling (so a stopped recording's data is final)
+        self._recording_idle.set()
         self.inlet = None
-        self.recorded_data = []
+        self.recorded_samples = []  # marker samples (parallel to `recorded_timestamps`)
+        self.recorded_timestamps = []  # their LSL timestamps (kept in a float64 buffer, see the property)
         self.recording_start_time = None
+        self._xdf_folder_validated = False  # set once `user_select_xdf_folder_if_needed` has found (or made) a usable folder
+
+        # Backup files are written by `_backup_writer_loop`, so the recording thread never blocks on disk I/O
+        self._backup_queue = queue.Queue(maxsize=BACKUP_QUEUE_MAXSIZE)
+        self._backup_writer_thread = threading.Thread(target=self._backup_writer_loop, daemon=True)
+        self._backup_writer_thread.start()
+        # Stopped recordings are saved here, off the Tk thread (one at a time, in order)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='recording_save')
+        # Messages are pushed to the LSL outlet by `_lsl_send_loop`, so a stalled outlet can't block the Tk thread
+        self._lsl_send_queue = queue.Queue()
+        self._lsl_send_thread = threading.Thread(target=self._lsl_send_loop, daemon=True)
+        self._lsl_send_thread.start()
 
         self.init_EasyTimeSyncParsingMixin()
 
@@ -110,27 +240,32 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         self.hotkey_popover = None
         self.is_minimized = False
 
-        # Singleton lock socket
-        self._lock_socket = None
+        # Singleton lock file (kept open, and so locked, while the app runs)
+        self._lock_file = None
 
         # Shutdown flag to prevent GUI updates during shutdown
         self._shutting_down = False
 
-        # Timestamp tracking for text entry
+        # Log lines waiting for the next `_flush_log_display`
+        self._pending_log_lines = []
+        self._log_flush_scheduled = False
+
+        # Timestamp tracking for text entry (`time.monotonic_ns()` of the first keystroke, converted to wall-clock time
+        # through the `(_t0_ns, _t0_dt)` anchor only when the entry is logged)
         self.main_text_timestamp = None
         self.popover_text_timestamp = None
+        self._t0_ns, self._t0_dt = None, None
 
         # EventBoard configuration and outlet
         self.eventboard_config = None
         self.eventboard_outlet = None
         self.eventboard_buttons = {}
-        self.eventboard_toggle_states = {}  # Track toggle states
-        self.eventboard_time_offsets = {}   # Track time offset dropdowns
 
 
         ## capture start timestamps:
         self.capture_stream_start_timestamps() ## `EasyTimeSyncParsingMixin`: capture timestamps for use in LSL streams
         self.capture_recording_start_timestamps() ## capture timestamps for use in LSL streams
+        self._capture_monotonic_anchor()
 
         logger.info(f"\t set stream timestamps.")
 
@@ -140,8 +275,8 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         # Setup transcription configuration
         self.setup_LiveWhisperTranscriptionAppMixin()
 
-        # Check for recovery files
-        self.check_for_recovery()
+        # Check for recovery files (once the main window is up, since it may ask)
+        self.root.after_idle(self.check_for_recovery)
 
         # Then create LSL outlets
         self.setup_lsl_outlet()
@@ -166,7 +301,12 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             print(f"Error setting application icon: {e}")
 
     def get_theme_appropriate_icon(self):
-        """Get the appropriate icon filename based on system theme"""
+        """Get the appropriate icon filename based on system theme (detected on the first call, then cached on the class)"""
+        if LiveWhisperLoggerApp._theme_icon_filename is None:
+            LiveWhisperLoggerApp._theme_icon_filename = self._detect_theme_icon()
+        return LiveWhisperLoggerApp._theme_icon_filename
+
+    def _detect_theme_icon(self):
         try:
             import platform
 
@@ -207,13 +347,16 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         try:
             import tkinter as tk
 
-            # Create a temporary root to test theme
-            temp_root = tk.Tk()
-            temp_root.withdraw()  # Hide the window
+            # Read the app's own root window when it exists, only creating a temporary root to test the theme otherwise
+            root = getattr(self, 'root', None)
+            temp_root = None
+            if root is None:
+                temp_root = root = tk.Tk()
+                temp_root.withdraw()  # Hide the window
 
             try:
                 # Check the default background color
-                bg_color = temp_root.cget('bg')
+                bg_color = root.cget('bg')
 
                 # Simple heuristic: if background is very dark, use light icon
                 if bg_color in ['#2e2e2e', '#3c3c3c', '#404040', 'SystemButtonFace']:
@@ -221,7 +364,8 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
                 else:
                     return "LogToLabStreamingLayerIcon_Light.png"
             finally:
-                temp_root.destroy()
+                if temp_root is not None:
+                    temp_root.destroy()
 
         except Exception as e:
             print(f"Error in simple theme detection: {e}")
@@ -229,49 +373,64 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             return "LogToLabStreamingLayerIcon_Light.png"
 
 
-    def acquire_singleton_lock(self):
-        """Acquire the singleton lock by binding to the port"""
-        try:
-            self._lock_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._lock_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self._lock_socket.bind(('localhost', self._lock_port))
-            self._lock_socket.listen(1)
-            self.mark_instance_running()
-            print("Singleton lock acquired successfully")
-            return True
-        except OSError as e:
-            print(f"Failed to acquire singleton lock: {e}")
-            return False
+    def acquire_singleton_lock(self, lock_file=None):
+        """Acquire the singleton lock by locking the lock file, or adopt `lock_file` if it was already locked by `_acquire_lock_file`"""
+        if lock_file is None:
+            lock_file = _acquire_lock_file(self._lock_path)
+            if lock_file is None:
+                return False
+        self._lock_file = lock_file
+        self.mark_instance_running()
+        print("Singleton lock acquired successfully")
+        return True
 
     def release_singleton_lock(self):
-        """Release the singleton lock and clean up the socket"""
+        """Release the singleton lock and close the lock file"""
         try:
-            if self._lock_socket:
-                self._lock_socket.close()
-                self._lock_socket = None
+            if self._lock_file:
+                _unlock_file(self._lock_file)
+                self._lock_file.close()
+                self._lock_file = None
             self.mark_instance_stopped()
             print("Singleton lock released")
         except Exception as e:
             print(f"Error releasing singleton lock: {e}")
 
     def setup_recording_inlet(self):
-        """Setup inlet to record our own stream"""
+        """Setup inlet to record our own stream (resolved on a background thread, so the GUI isn't blocked for up to the
+        resolve timeout)"""
+        threading.Thread(target=self._resolve_recording_inlet, daemon=True).start()
+
+    def _resolve_recording_inlet(self):
+        """Background thread: looks for our own stream, handing it to `_on_recording_inlet_resolved` on the Tk thread"""
         try:
             # Look for our own stream
             streams = pylsl.resolve_byprop('name', 'WhisperLiveLogger', timeout=2.0)
-            if streams:
-                self.inlet = pylsl.StreamInlet(streams[0])
-                print("Recording inlet created successfully")
-
-                # Auto-start recording after inlet is ready
-                self.root.after(500, self.auto_start_recording)
+        except Exception as e:
+            print(f"Error creating recording inlet: {e}")
+            streams = []
+        if not streams:
+            print("Could not find WhisperLiveLogger stream for recording")
+            return
+        try:
+            self.root.after(0, self._on_recording_inlet_resolved, streams[0])
+        except (tk.TclError, RuntimeError):
+            pass  # GUI is being destroyed
 
-            else:
-                print("Could not find WhisperLiveLogger stream for recording")
-                self.inlet = None
+    def _on_recording_inlet_resolved(self, stream_info):
+        if self._shutting_down:
+            return
+        try:
+            self.inlet = pylsl.StreamInlet(stream_info)
+            print("Recording inlet created successfully")
         except Exception as e:
             print(f"Error creating recording inlet: {e}")
             self.inlet = None
+            return
+
+        # Auto-start recording now that the inlet is ready
+        self.auto_start_recording()
+
     # ---------------------------------------------------------------------------- #
     #                               Recording Methods                              #
     # ---------------------------------------------------------------------------- #
@@ -381,7 +540,7 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
     #                 if text:
     #                     self.send_lsl_message(text)
     #                     # Update GUI display
-    #                     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    #                     timestamp = _now_str()
     #                     self.update_log_display(f"[TRANSCRIBED] {text}", timestamp)
 
     #             # Also call original emit for file logging
@@ -405,7 +564,7 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
     #         except tk.TclError:
     #             pass
 
-    #         self.update_log_display("Live transcription started", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    #         self.update_log_display("Live transcription started", _now_str())
     #         print(f"Live transcription started with session: {session_name}")
 
     #     except Exception as e:
@@ -439,7 +598,7 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
     #         except tk.TclError:
     #             pass
 
-    #         self.update_log_display("Live transcription stopped", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    #         self.update_log_display("Live transcription stopped", _now_str())
     #         print("Live transcription stopped")
 
     #     except Exception as e:
@@ -554,42 +713,64 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             # Create a simple icon (you can replace this with a custom icon file)
             icon_image = self.create_tray_icon()
 
-            # Create system tray menu
-            menu = pystray.Menu(
-                pystray.MenuItem("Show App", self.show_app),
-                pystray.MenuItem("Exit", self.quit_app)
-            )
-
-            # Create system tray icon
-            self.system_tray = pystray.Icon(
-                "logger_app",
-                icon_image,
-                "LSL Live Transcription",
-                menu
-            )
-
-            # Add double-click handler to show app
-            self.system_tray.on_activate = self.show_app ## double-clicking doesn't foreground the app by default. Also clicking the windows close "X" just hides it to taskbar by default which I don't want.
-
-            # Start system tray in a separate thread
-            threading.Thread(target=self.system_tray.run, daemon=True).start()
+            # Run the tray icon in its own process, so its message pump doesn't compete with Tk's; menu actions come back
+            # over a queue and are applied on the Tk thread by `_drain_tray_actions`
+            ctx = multiprocessing.get_context("spawn")
+            self._tray_actions = ctx.Queue()
+            self._tray_stop = ctx.Event()
+            self.system_tray = ctx.Process(target=_run_system_tray, args=(icon_image, self._tray_actions, self._tray_stop), daemon=True)
+            self.system_tray.start()
+            self.root.after(TRAY_POLL_INTERVAL_MS, self._drain_tray_actions)
 
         except Exception as e:
             print(f"Error setting up system tray: {e}")
 
+    def _drain_tray_actions(self):
+        """Tk-thread poller: applies the menu actions chosen in the system tray process"""
+        if self._shutting_down or (self.system_tray is None):
+            return
+        while True:
+            try:
+                action = self._tray_actions.get_nowait()
+            except queue.Empty:
+                break
+            if action == 'show':
+                self.show_app()
+            elif action == 'quit':
+                self.quit_app()
+                return
+        self.root.after(TRAY_POLL_INTERVAL_MS, self._drain_tray_actions)
+
+    def stop_system_tray(self):
+        """Remove the system tray icon and wait for its process to exit (terminating it if it doesn't)"""
+        if self.system_tray is not None:
+            tray_process, self.system_tray = self.system_tray, None
+            self._tray_stop.set()
+            tray_process.join(timeout=2.0)
+            if tray_process.is_alive():
+                tray_process.terminate()
+                tray_process.join(timeout=2.0)
+
 
     def create_tray_icon(self):
         """Create icon for the system tray from PNG file based on system theme"""
         try:
+            from PIL import Image
+
             # Use the same theme detection as the main icon
             icon_filename = self.get_theme_appropriate_icon()
             icon_path = Path("icons") / icon_filename
 
+            if LiveWhisperLoggerApp._tray_icon_image is not None:
+                return LiveWhisperLoggerApp._tray_icon_image
+
             if icon_path.exists():
                 # Load and resize the PNG icon for system tray
                 image = Image.open(str(icon_path))
-                # Resize to appropriate size for system tray (16x16 or 32x32)
-                image = image.resize((16, 16), Image.Resampling.LANCZOS)
+                # Resize to appropriate size for system tray (16x16 or 32x32), in place; at this size bilinear looks the same
+                # as LANCZOS for a fraction of the cost
+                image.thumbnail((16, 16), Image.Resampling.BILINEAR)
+                LiveWhisperLoggerApp._tray_icon_image = image  # decoded once, reused if the tray icon is recreated
                 return image
             else:
                 print(f"Tray icon file not found: {icon_path}, using default")
@@ -600,6 +781,8 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
     def create_default_tray_icon(self):
         """Create a simple default icon for the system tray"""
+        from PIL import Image, ImageDraw
+
         # Create a 16x16 icon with a simple design
         width = 16
         height = 16
@@ -701,22 +884,18 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             self.quick_log_entry.focus_force()
             self.quick_log_entry.select_range(0, tk.END)
 
-    def on_main_text_change(self, event=None):
-        """Track when user first types in main text field"""
+    def on_main_text_change(self, *trace_args):
+        """Track when user first types in main text field, and reset once it is emptied again (trace of `_main_text_var`)"""
         if self.main_text_timestamp is None:
-            self.main_text_timestamp = datetime.now()
+            if self._main_text_var.get():
+                self.main_text_timestamp = time.monotonic_ns()
+        elif not self._main_text_var.get():
+            self.main_text_timestamp = None
 
     def on_popover_text_change(self, event=None):
         """Track when user first types in popover text field"""
         if self.popover_text_timestamp is None:
-            self.popover_text_timestamp = datetime.now()
-
-    def on_main_text_clear(self, event=None):
-        """Reset timestamp when main text field is cleared"""
-        if event and event.keysym in ['BackSpace', 'Delete']:
-            # Check if field is now empty
-            if not self.text_entry.get().strip():
-                self.main_text_timestamp = None
+            self.popover_text_timestamp = time.monotonic_ns()
 
     def on_popover_text_clear(self, event=None):
         """Reset timestamp when popover text field is cleared"""
@@ -727,16 +906,16 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
     def get_main_text_timestamp(self):
         """Get the timestamp when user first started typing in main field"""
-        if self.main_text_timestamp:
-            timestamp = self.main_text_timestamp
+        if self.main_text_timestamp is not None:
+            timestamp = self._monotonic_ns_to_datetime(self.main_text_timestamp)
             self.main_text_timestamp = None  # Reset for next entry
             return timestamp
         return datetime.now()
 
     def get_popover_text_timestamp(self):
         """Get the timestamp when user first started typing in popover field"""
-        if self.popover_text_timestamp:
-            timestamp = self.popover_text_timestamp
+        if self.popover_text_timestamp is not None:
+            timestamp = self._monotonic_ns_to_datetime(self.popover_text_timestamp)
             self.popover_text_timestamp = None  # Reset for next entry
             return timestamp
         return datetime.now()
@@ -753,12 +932,6 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
         except Exception as e:
             print(f"Error centering popover: {e}")
-            # Fallback to screen center
-            screen_width = self.hotkey_popover.winfo_screenwidth()
-            screen_height = self.hotkey_popover.winfo_screenheight()
-            x = (screen_width - 400) // 2
-            y = (screen_height - 150) // 2
-            self.hotkey_popover.geometry(f"+{x}+{y}")
 
     def quick_log_and_close(self):
         """Log the message and close the popover"""
@@ -823,8 +996,7 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
     def quit_app(self):
         """Quit the application completely"""
-        if self.system_tray:
-            self.system_tray.stop()
+        self.stop_system_tray()
         self.on_closing()
 
 
@@ -853,20 +1025,17 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         self.recording_status_label = ttk.Label(recording_frame, text="Not Recording", foreground="red")
         self.recording_status_label.grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
 
-        # Recording buttons
-        self.start_recording_button = ttk.Button(recording_frame, text="Start Recording", command=self.start_recording)
-        self.start_recording_button.grid(row=0, column=1, padx=5)
-
-        self.stop_recording_button = ttk.Button(recording_frame, text="Stop Recording", command=self.stop_recording, state="disabled")
-        self.stop_recording_button.grid(row=0, column=2, padx=5)
-
-        # Add Split Recording button
-        self.split_recording_button = ttk.Button(recording_frame, text="Split Recording", command=self.split_recording, state="disabled")
-        self.split_recording_button.grid(row=0, column=3, padx=5)
-
-        # Add Minimize to Tray button
-        self.minimize_button = ttk.Button(recording_frame, text="Minimize to Tray", command=self.toggle_minimize)
-        self.minimize_button.grid(row=0, column=4, padx=5)
+        # Recording buttons: (attribute, text, command, initial state), laid out left to right
+        recording_buttons = [
+            ('start_recording_button', "Start Recording", self.start_recording, "normal"),
+            ('stop_recording_button', "Stop Recording", self.stop_recording, "disabled"),
+            ('split_recording_button', "Split Recording", self.split_recording, "disabled"),
+            ('minimize_button', "Minimize to Tray", self.toggle_minimize, "normal"),
+        ]
+        for column, (attr_name, text, command, state) in enumerate(recording_buttons, start=1):
+            button = ttk.Button(recording_frame, text=text, command=command, state=state)
+            button.grid(row=0, column=column, padx=5)
+            setattr(self, attr_name, button)
 
         # Live Transcription control frame
         self.setup_gui_LiveWhisperTranscriptionAppMixin(main_frame)
@@ -906,8 +1075,8 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         # # Refresh devices button
         # ttk.Button(transcription_frame, text="Refresh", command=self.refresh_audio_devices).grid(row=1, column=3, padx=5, pady=(5, 0))
 
-        # EventBoard frame
-        self.setup_eventboard_gui(main_frame)
+        # EventBoard frame (only a placeholder, so it is built after the first paint)
+        self.root.after_idle(self.setup_eventboard_gui, main_frame)
 
         # Text input label and entry frame
         input_frame = ttk.Frame(main_frame)
@@ -917,12 +1086,12 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         ttk.Label(input_frame, text="Message:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
 
         # Text input box
-        self.text_entry = tk.Entry(input_frame, width=50)
+        self._main_text_var = tk.StringVar(self.root)
+        self.text_entry = tk.Entry(input_frame, width=50, textvariable=self._main_text_var)
         self.text_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
         self.text_entry.bind('<Return>', lambda event: self.log_message())
-        self.text_entry.bind('<Key>', self.on_main_text_change)  # Track first keystroke
-        self.text_entry.bind('<BackSpace>', self.on_main_text_clear)
-        self.text_entry.bind('<Delete>', self.on_main_text_clear)
+        # Track first keystroke (and clearing) through edits of the text itself, rather than key bindings
+        self._main_text_var.trace_add('write', self.on_main_text_change)
 
         # Log button
         self.log_button = ttk.Button(input_frame, text="Log", command=self.log_message)
@@ -934,6 +1103,9 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         # Scrolled text widget for log history
         self.log_display = scrolledtext.ScrolledText(main_frame, height=15, width=70)
         self.log_display.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        # Tcl command interface and widget path of the log display, for `_flush_log_display` to call directly
+        self._log_display_call = self.log_display.tk.call
+        self._log_display_w = self.log_display._w
 
         # Bottom frame for buttons and info
         bottom_frame = ttk.Frame(main_frame)
@@ -965,16 +1137,21 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
     def user_select_xdf_folder_if_needed(self) -> Path:
         """Ensures the self.xdf_folder is valid, otherwise forces the user to select a valid one. returns the valid folder.
+        Only checked for the first recording of the session; later ones reuse the folder.
         """
+        if self._xdf_folder_validated:
+            return self.xdf_folder
         self.xdf_folder = whisper_live_transcripts_dir
         if (self.xdf_folder is not None) and (self.xdf_folder.exists()) and (self.xdf_folder.is_dir()):
             ## already had valid folder, just return it
+            self._xdf_folder_validated = True
             return self.xdf_folder
         else:        
             self.xdf_folder = Path(filedialog.askdirectory(initialdir=str(self.xdf_folder), title="Select output XDF Folder - PhoLogToLabStreamingLayer_logs")).resolve()
             assert self.xdf_folder.exists(), f"XDF folder does not exist: {self.xdf_folder}"
             assert self.xdf_folder.is_dir(), f"XDF folder is not a directory: {self.xdf_folder}"
-            self.update_log_display(f"XDF folder selected: {self.xdf_folder}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self._xdf_folder_validated = True
+            self.update_log_display(f"XDF folder selected: {self.xdf_folder}", _now_str())
             print(f"XDF folder selected: {self.xdf_folder}")
             return self.xdf_folder
 
@@ -985,9 +1162,20 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         # self.recording_start_datetime = datetime.now(datetime.timezone.utc)
         # self.recording_start_lsl_local_offset = pylsl.local_clock()
         self.capture_recording_start_timestamps()
+        self._capture_monotonic_anchor()
         return (self.recording_start_datetime, self.recording_start_lsl_local_offset)
 
 
+    def _capture_monotonic_anchor(self):
+        """Pairs the current `time.monotonic_ns()` with the wall-clock time, for `_monotonic_ns_to_datetime` (re-anchored at
+        each recording start, so clock adjustments don't accumulate over a long session)"""
+        self._t0_ns, self._t0_dt = time.monotonic_ns(), datetime.now()
+
+
+    def _monotonic_ns_to_datetime(self, ns: int) -> datetime:
+        return self._t0_dt + timedelta(microseconds=(ns - self._t0_ns) // 1000)
+
+
     def _common_initiate_recording(self, allow_prompt_user_for_filename: bool = True):
         """Common code for initiating recording
         called by `self.start_recording()` and `self.auto_start_recording()`, and also by `self.split_recording()`
@@ -1004,11 +1192,8 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         current_timestamp = self.recording_start_datetime.strftime("%Y%m%d_%H%M%S")
         default_filename = f"{current_timestamp}_log.xdf"
 
-        # Ensure the default directory exists
+        # Ensure the default directory exists (validated by `user_select_xdf_folder_if_needed`)
         self.xdf_folder = self.user_select_xdf_folder_if_needed()
-        self.xdf_folder.mkdir(parents=True, exist_ok=True)
-        assert self.xdf_folder.exists(), f"XDF folder does not exist: {self.xdf_folder}"
-        assert self.xdf_folder.is_dir(), f"XDF folder is not a directory: {self.xdf_folder}"
 
         # Set new filename directly
         if allow_prompt_user_for_filename:
@@ -1020,12 +1205,14 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             return
 
         self.recording = True
-        self.recorded_data = [] ## clear recorded data
+        self.recorded_samples = [] ## clear recorded data
+        self.recorded_timestamps = []
 
         self.xdf_filename = filename
+        self._xdf_basename = os.path.basename(filename)  # (shown in the status label and the stop marker)
 
         # Create backup file for crash recovery
-        self.backup_filename = str(Path(filename).with_suffix('.backup.json'))
+        self.backup_filename = str(Path(filename).with_suffix('.backup.jsonl'))
         return self.xdf_filename, (self.recording_start_datetime, self.recording_start_lsl_local_offset)
 
 
@@ -1045,21 +1232,12 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
 
         # Update GUI
-        try:
-            if not self._shutting_down:
-                self.recording_status_label.config(text="Recording...", foreground="green")
-                self.start_recording_button.config(state="disabled")
-                self.stop_recording_button.config(state="normal")
-                self.split_recording_button.config(state="normal")  # Enable split button
-                self.status_info_label.config(text=f"Recording to: {os.path.basename(new_filename)}")
-        except tk.TclError:
-            pass  # GUI is being destroyed
+        self._set_recording_state(True, f"Recording to: {self._xdf_basename}")
 
         # Start recording thread
-        self.recording_thread = threading.Thread(target=self.recording_worker, daemon=True)
-        self.recording_thread.start()
+        self._start_recording_worker()
 
-        self.update_log_display("XDF Recording started", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        self.update_log_display("XDF Recording started", _now_str())
 
 
     def auto_start_recording(self):
@@ -1073,56 +1251,101 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             new_filename, (new_recording_start_datetime, new_recording_start_lsl_local_offset) = self._common_initiate_recording(allow_prompt_user_for_filename=True)
 
             # Update GUI
-            try:
-                if not self._shutting_down:
-                    self.recording_status_label.config(text="Recording...", foreground="green")
-                    self.start_recording_button.config(state="disabled")
-                    self.stop_recording_button.config(state="normal")
-                    self.split_recording_button.config(state="normal")  # Enable split button
-                    self.status_info_label.config(text=f"Auto-recording to: {os.path.basename(self.xdf_filename)}")
-            except tk.TclError:
-                pass  # GUI is being destroyed
+            self._set_recording_state(True, f"Auto-recording to: {self._xdf_basename}")
 
             # Start recording thread
-            self.recording_thread = threading.Thread(target=self.recording_worker, daemon=True)
-            self.recording_thread.start()
-
-            self.update_log_display("XDF Recording auto-started", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            print(f"Auto-started recording to: {self.xdf_filename}")
+            self._start_recording_worker()
 
             # Log the auto-start event both in GUI and via LSL
             auto_start_message = f"RECORDING_AUTO_STARTED: {new_filename}"
             self.send_lsl_message(auto_start_message)  # Send via LSL
-            self.update_log_display("XDF Recording auto-started", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.update_log_display("XDF Recording auto-started", _now_str())
             print(f"Auto-started recording to: {self.xdf_filename}")
 
         except Exception as e:
             print(f"Error auto-starting recording: {e}")
-            self.update_log_display(f"Auto-start failed: {str(e)}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.update_log_display(f"Auto-start failed: {str(e)}", _now_str())
 
 
-    def recording_worker(self):
-        """Background thread for recording LSL data with incremental backup"""
-        sample_count = 0
+    def _set_recording_state(self, running: bool, status_text: str):
+        """Update the recording label, the start/stop/split buttons and the status line for a started or stopped recording"""
+        if self._shutting_down:
+            return
+        label, start_button, stop_button, split_button = self.recording_status_label, self.start_recording_button, self.stop_recording_button, self.split_recording_button
+        try:
+            if running:
+                label.config(text="Recording...", foreground="green")
+                start_button.config(state="disabled")
+                stop_button.config(state="normal")
+                split_button.config(state="normal")
+            else:
+                label.config(text="Not Recording", foreground="red")
+                start_button.config(state="normal")
+                stop_button.config(state="disabled")
+                split_button.config(state="disabled")
+            self.status_info_label.config(text=status_text)
+        except tk.TclError:
+            pass  # GUI is being destroyed
+
+
+    @property
+    def recorded_timestamps(self) -> np.ndarray:
+        """The LSL timestamps of `recorded_samples`, as a view of the filled part of a float64 buffer (8 bytes each, rather
+        than a boxed Python float in a list)"""
+        return self._recorded_timestamps_buf[:self._n_recorded_timestamps]
+
+    @recorded_timestamps.setter
+    def recorded_timestamps(self, timestamps):
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        self._recorded_timestamps_buf = np.empty(max(RECORDED_TIMESTAMPS_INITIAL_CAPACITY, 2 * len(timestamps)), dtype=np.float64)
+        self._recorded_timestamps_buf[:len(timestamps)] = timestamps
+        self._n_recorded_timestamps = len(timestamps)
+
+
+    def _append_recorded_timestamps(self, timestamps):
+        """Append to `recorded_timestamps`, doubling the buffer when it is full"""
+        n, n_new = self._n_recorded_timestamps, len(timestamps)
+        if n + n_new > len(self._recorded_timestamps_buf):
+            grown = np.empty(max(2 * len(self._recorded_timestamps_buf), n + n_new), dtype=np.float64)
+            grown[:n] = self._recorded_timestamps_buf[:n]
+            self._recorded_timestamps_buf = grown
+        self._recorded_timestamps_buf[n:n + n_new] = timestamps
+        self._n_recorded_timestamps = n + n_new
+
+
+    def _start_recording_worker(self):
+        """Let `recording_worker` pull for the current recording (starting its thread the first time)"""
+        self._recording_active.set()
+        if (self.recording_thread is None) or (not self.recording_thread.is_alive()):
+            self.recording_thread = threading.Thread(target=self.recording_worker, daemon=True)
+            self.recording_thread.start()
+
 
-        while self.recording and self.inlet:
+    def recording_worker(self):
+        """Background thread for recording LSL data with incremental backup, kept across recordings (and splits): it pulls
+        while `_recording_active` is set and waits for the next recording otherwise"""
+        while True:
+            self._recording_active.wait()
+            if self._shutting_down:
+                return
+            self._recording_idle.clear()
             try:
-                sample, timestamp = self.inlet.pull_sample(timeout=1.0)
-                if sample:
-                    data_point = {
-                        'sample': sample,
-                        'timestamp': timestamp
-                    }
-                    self.recorded_data.append(data_point)
-                    sample_count += 1
-
-                    # Auto-save every 10 samples to backup file
-                    if sample_count % 10 == 0:
-                        self.save_backup()
+                # (checked after `_recording_idle` is cleared, so `stop_recording` either sees it cleared or no pull happens)
+                while self._recording_active.is_set() and self.inlet:
+                    # Everything that arrived since the last pull in one call (the marker stream is cf_string, so the
+                    # samples come back as lists rather than into a preallocated numpy `dest_obj`)
+                    samples, timestamps = self.inlet.pull_chunk(timeout=RECORDING_PULL_TIMEOUT_S, max_samples=RECORDING_PULL_MAX_SAMPLES)
+                    if timestamps:
+                        self.recorded_samples.extend(samples)
+                        self._append_recorded_timestamps(timestamps)
+                        # Only the new markers are appended to the backup file
+                        self.save_backup(samples, timestamps)
 
             except Exception as e:
                 print(f"Error in recording worker: {e}")
-                break
+                self._recording_active.clear()  # (no more pulls for this recording)
+            finally:
+                self._recording_idle.set()
 
     def stop_recording(self):
         """Stop XDF recording and save file"""
@@ -1132,36 +1355,70 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         self.recording = False
 
         # Log the stop event via LSL before saving
-        stop_message = f"RECORDING_STOPPED: {os.path.basename(self.xdf_filename)}"
+        stop_message = f"RECORDING_STOPPED: {self._xdf_basename}"
         self.send_lsl_message(stop_message)
+        self.flush_lsl_messages()  # (pushed before the recording thread's last pull)
 
-        # Wait for recording thread to finish
-        if self.recording_thread and self.recording_thread.is_alive():
-            self.recording_thread.join(timeout=2.0)
+        # Wait for the recording thread to finish its last pull (it then waits for the next recording)
+        self._recording_active.clear()
+        self._recording_idle.wait(timeout=2.0)
 
 
-        # Save XDF file
-        self.save_xdf_file()
+        # Save XDF file in the background, from a snapshot of the markers (so a split can start the next recording right away)
+        self.close_backup()
+        recorded_samples, recorded_timestamps = list(self.recorded_samples), self.recorded_timestamps.copy()
+        if len(recorded_timestamps) == 0:
+            messagebox.showwarning("Warning", "No data to save")
+            self._io_pool.submit(self._remove_backup_file, self.backup_filename)
+            self._set_recording_state(False, "Ready")
+            return
+
+        future = self._io_pool.submit(self._save_stopped_recording, recorded_samples, recorded_timestamps, self.xdf_filename, self.backup_filename)
+        # (polled from the Tk loop rather than a done callback, since Tk calls from the pool's thread could block on this one)
+        self.root.after(SAVE_POLL_INTERVAL_MS, self._on_recording_saved, future)
+
+        # Update GUI
+        self._set_recording_state(False, "Saving...")
+
+        self.update_log_display("XDF Recording stopped, saving...", _now_str())
 
-        # Clean up backup file
+
+    def _save_stopped_recording(self, recorded_samples, recorded_timestamps, xdf_filename, backup_filename) -> str:
+        """(On `_io_pool`) Write a stopped recording's files, then drop its backup file, which is kept if saving fails"""
+        status_str = self._write_recording_files(recorded_samples, recorded_timestamps, xdf_filename)
+        self._remove_backup_file(backup_filename)
+        return status_str
+
+
+    def _remove_backup_file(self, backup_filename):
+        # (once the writer has closed it, so it isn't recreated afterwards)
+        self.flush_backups()
         try:
-            if hasattr(self, 'backup_filename') and os.path.exists(self.backup_filename):
-                os.remove(self.backup_filename)
+            if os.path.exists(backup_filename):
+                os.remove(backup_filename)
         except Exception as e:
             print(f"Error removing backup file: {e}")
 
-        # Update GUI
+
+    def _on_recording_saved(self, future: concurrent.futures.Future):
+        """(On the Tk thread) Report the result of `_save_stopped_recording`, once it is done"""
+        if not future.done():
+            if not self._shutting_down:
+                self.root.after(SAVE_POLL_INTERVAL_MS, self._on_recording_saved, future)
+            return
         try:
+            status_str = future.result()
+        except Exception as e:
             if not self._shutting_down:
-                self.recording_status_label.config(text="Not Recording", foreground="red")
-                self.start_recording_button.config(state="normal")
-                self.stop_recording_button.config(state="disabled")
-                self.split_recording_button.config(state="disabled")  # Disable split button
+                self._report_save_error(e)
+        else:
+            self.update_log_display(status_str, timestamp=None)
+            self.update_log_display("XDF Recording stopped and saved", _now_str())
+        if (not self.recording) and (not self._shutting_down):
+            try:
                 self.status_info_label.config(text="Ready")
-        except tk.TclError:
-            pass  # GUI is being destroyed
-
-        self.update_log_display("XDF Recording stopped and saved", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            except tk.TclError:
+                pass  # GUI is being destroyed
 
 
     def split_recording(self):
@@ -1178,7 +1435,7 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
         except Exception as e:
             print(f"Error splitting recording: {e}")
-            self.update_log_display(f"Split recording failed: {str(e)}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.update_log_display(f"Split recording failed: {str(e)}", _now_str())
 
 
     def start_new_split_recording(self):
@@ -1193,56 +1450,105 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             new_filename, (new_recording_start_datetime, new_recording_start_lsl_local_offset) = self._common_initiate_recording(allow_prompt_user_for_filename=False)
 
             # Update GUI
-            try:
-                if not self._shutting_down:
-                    self.recording_status_label.config(text="Recording...", foreground="green")
-                    self.start_recording_button.config(state="disabled")
-                    self.stop_recording_button.config(state="normal")
-                    self.split_recording_button.config(state="normal")
-                    self.status_info_label.config(text=f"Split to: {os.path.basename(self.xdf_filename)}")
-            except tk.TclError:
-                pass  # GUI is being destroyed
+            self._set_recording_state(True, f"Split to: {self._xdf_basename}")
 
             # Start recording thread
-            self.recording_thread = threading.Thread(target=self.recording_worker, daemon=True)
-            self.recording_thread.start()
-
-            self.update_log_display(f"Recording split to new file: {new_filename}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            print(f"Split recording to new file: {self.xdf_filename}")
+            self._start_recording_worker()
 
             # Log the split event both in GUI and via LSL
             split_message = f"RECORDING_SPLIT_NEW_FILE: {new_filename}"
             self.send_lsl_message(split_message)  # Send via LSL
-            self.update_log_display(f"Recording split to new file: {new_filename}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.update_log_display(f"Recording split to new file: {new_filename}", _now_str())
             print(f"Split recording to new file: {self.xdf_filename}")
 
         except Exception as e:
             print(f"Error starting new split recording: {e}")
-            self.update_log_display(f"Split restart failed: {str(e)}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.update_log_display(f"Split restart failed: {str(e)}", _now_str())
 
 
     # ---------------------------------------------------------------------------- #
     #                             Backups and Recovery                             #
     # ---------------------------------------------------------------------------- #
-    def save_backup(self):
-        """Save current data to backup file"""
-        try:
-            backup_data = {
-                'recorded_data': self.recorded_data,
-                'recording_start_time': self.recording_start_time,
-                'sample_count': len(self.recorded_data)
-            }
+    def save_backup(self, samples, timestamps):
+        """Queue newly recorded markers to be appended to the backup file by the backup writer thread"""
+        self._backup_queue.put((self.backup_filename, samples, timestamps))
+
+
+    def close_backup(self):
+        """Queue closing the current backup file (after the markers already queued for it)"""
+        self._backup_queue.put((self.backup_filename, None, None))
+
+
+    def _backup_writer_loop(self):
+        """Background thread appending the markers queued by `save_backup` to the backup files, one JSON line per marker"""
+        backup_files = {}  # backup filename -> file open for appending
+        while True:
+            items = [self._backup_queue.get()]
+            # Take everything pending, so a burst of chunks costs one write and flush per file
+            while items[-1] is not None:
+                try:
+                    items.append(self._backup_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_backups(backup_files, items)
+            finally:
+                for _ in items:
+                    self._backup_queue.task_done()
+            if items[-1] is None:
+                for f in backup_files.values():
+                    f.close()
+                return
+
+
+    def _write_backups(self, backup_files, items):
+        pending_lines = {}  # backup filename -> encoded lines not yet written
+        for item in items:
+            if item is None:
+                break
+            backup_filename, samples, timestamps = item
+            if samples is not None:
+                pending_lines.setdefault(backup_filename, []).extend(map(_backup_line, samples, timestamps))
+            else:
+                # `close_backup`: write what is still pending for this file first
+                self._append_backup_lines(backup_files, backup_filename, pending_lines.pop(backup_filename, []))
+                f = backup_files.pop(backup_filename, None)
+                if f is not None:
+                    f.close()
+        for backup_filename, lines in pending_lines.items():
+            self._append_backup_lines(backup_files, backup_filename, lines)
+
 
-            with open(self.backup_filename, 'w') as f:
-                json.dump(backup_data, f, default=str)
+    def _append_backup_lines(self, backup_files, backup_filename, lines):
+        if not lines:
+            return
+        try:
+            f = backup_files.get(backup_filename)
+            if f is None:
+                f = backup_files[backup_filename] = open(backup_filename, 'ab', buffering=BACKUP_WRITE_BUFFER_BYTES)
+            f.write(b''.join(lines))
+            f.flush()  # on disk (well, with the OS) in case the app crashes
 
         except Exception as e:
             print(f"Error saving backup: {e}")
 
 
+    def flush_backups(self):
+        """Block until every queued backup chunk has been written"""
+        self._backup_queue.join()
+
+
     def check_for_recovery(self):
         """Check for backup files and offer recovery on startup"""
-        backup_files = list(_default_xdf_folder.glob('*.backup.json'))
+        # (the backup of a recording that has started in the meantime isn't one to recover)
+        active_backup_filename = os.path.normcase(os.path.abspath(self.backup_filename)) if self.recording else None
+        try:
+            with os.scandir(_default_xdf_folder) as entries:
+                backup_files = [Path(entry.path) for entry in entries
+                                if entry.name.endswith(('.backup.jsonl', '.backup.json')) and entry.is_file()
+                                and (os.path.normcase(entry.path) != active_backup_filename)]
+        except FileNotFoundError:
+            backup_files = []
 
         if backup_files:
             response = messagebox.askyesno(
@@ -1258,8 +1564,20 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
     def recover_from_backup(self, backup_file):
         """Recover data from backup file"""
         try:
-            with open(backup_file, 'r') as f:
-                backup_data = json.load(f)
+            loads = orjson.loads if orjson is not None else json.loads
+            with open(backup_file, 'rb') as f:
+                if backup_file.suffix == '.jsonl':
+                    lines = f.read().splitlines()
+                    backup_data = {'recorded_data': []}
+                    for i, line in enumerate(lines):
+                        try:
+                            backup_data['recorded_data'].append(loads(line))
+                        except ValueError:
+                            if i < len(lines) - 1:
+                                raise
+                            # the last line was cut short by the crash
+                else:
+                    backup_data = loads(f.read())
 
             # Ask user for recovery filename
             original_name = backup_file.stem.replace('.backup', '')
@@ -1272,18 +1590,24 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
             )
 
             if recovery_filename:
-                # Restore data
-                self.recorded_data = backup_data['recorded_data']
-                self.xdf_filename = recovery_filename
+                # Restore data (passed to `save_xdf_file` directly, leaving those of a recording in progress alone)
+                if 'recorded_samples' in backup_data:
+                    recorded_samples = backup_data['recorded_samples']
+                    recorded_timestamps = backup_data['recorded_timestamps']
+                else:
+                    # `.backup.jsonl` lines and backups written by older versions hold (sample, timestamp) pairs or {'sample', 'timestamp'} dicts
+                    pairs = [(d['sample'], d['timestamp']) if isinstance(d, dict) else d for d in backup_data['recorded_data']]
+                    recorded_samples = [sample for sample, _ in pairs]
+                    recorded_timestamps = [timestamp for _, timestamp in pairs]
 
                 # Save as XDF
-                self.save_xdf_file()
+                self.save_xdf_file(recorded_samples, recorded_timestamps, recovery_filename)
 
                 # Remove backup file
                 os.remove(backup_file)
 
                 messagebox.showinfo("Recovery Complete",
-                    f"Recovered {len(self.recorded_data)} samples to {recovery_filename}")
+                    f"Recovered {len(recorded_timestamps)} samples to {recovery_filename}")
 
         except Exception as e:
             messagebox.showerror("Recovery Error", f"Failed to recover from backup: {str(e)}")
@@ -1291,122 +1615,93 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
     # ---------------------------------------------------------------------------- #
     #                              Save/Write Methods                              #
     # ---------------------------------------------------------------------------- #
-    def save_xdf_file(self):
-        """Save recorded data using MNE"""
-        if not self.recorded_data:
+    def save_xdf_file(self, recorded_samples=None, recorded_timestamps=None, xdf_filename=None):
+        """Save recorded data using MNE (by default the current recording's, to `self.xdf_filename`)"""
+        if recorded_timestamps is None:
+            recorded_samples, recorded_timestamps = self.recorded_samples, self.recorded_timestamps
+        if xdf_filename is None:
+            xdf_filename = self.xdf_filename
+
+        if len(recorded_timestamps) == 0:
             messagebox.showwarning("Warning", "No data to save")
             return
 
         try:
-            # Extract messages and timestamps
-            messages = []
-            timestamps = []
-
-            for data_point in self.recorded_data:
-                message = data_point['sample'][0] if data_point['sample'] else ''
-                timestamp = data_point['timestamp']
-                messages.append(message)
-                timestamps.append(timestamp)
-
-            # Convert timestamps to relative times (from first sample)
-            if timestamps:
-                first_timestamp = timestamps[0]
-                relative_timestamps = [ts - first_timestamp for ts in timestamps]
-            else:
-                relative_timestamps = []
-
-            # Create annotations (MNE's way of handling markers/events)
-            # Set orig_time=None to avoid timing conflicts
-            annotations = mne.Annotations(
-                onset=relative_timestamps,
-                duration=[0.0] * len(relative_timestamps),  # Instantaneous events
-                description=messages,
-                orig_time=None  # This fixes the timing conflict
-            )
-
-            # Create a minimal info structure for the markers
-            info = mne.create_info(
-                ch_names=['TextLogger_Markers'],
-                sfreq=1000,  # Dummy sampling rate for the minimal channel
-                ch_types=['misc']
-            )
-
-            # Create raw object with minimal dummy data
-            # We need at least some data points to create a valid Raw object
-            if len(timestamps) > 0:
-                # Create dummy data spanning the recording duration
-                duration = relative_timestamps[-1] if relative_timestamps else 1.0
-                n_samples = int(duration * 1000) + 1000  # Add buffer
-                dummy_data = np.zeros((1, n_samples))
-            else:
-                dummy_data = np.zeros((1, 1000))  # Minimum 1 second of data
+            _status_str = self._write_recording_files(recorded_samples, recorded_timestamps, xdf_filename)
+            self.update_log_display(_status_str, timestamp=None)
+            # messagebox.showinfo("Success", _status_str)
 
-            raw = mne.io.RawArray(dummy_data, info)
+        except Exception as e:
+            self._report_save_error(e)
 
-            # Set measurement date to match the first timestamp
-            if timestamps:
-                raw.set_meas_date(timestamps[0])
 
-            raw.set_annotations(annotations)
+    def _report_save_error(self, e: Exception):
+        messagebox.showerror("Error", f"Failed to save file: {str(e)}")
+        print(f"Detailed error: {e}")
+        traceback.print_exception(type(e), e, e.__traceback__)
 
-            # Add metadata to the raw object
-            raw.info['description'] = 'TextLogger LSL Stream Recording'
-            raw.info['experimenter'] = 'PhoLogToLabStreamingLayer'
 
-            # Determine output filename and format
-            if self.xdf_filename.endswith('.xdf'):
-                # Save as FIF (MNE's native format)
-                fif_filename = self.xdf_filename.replace('.xdf', '.fif')
-                raw.save(fif_filename, overwrite=True)
-                actual_filename = fif_filename
-                file_type = "FIF"
-            else:
-                # Use the original filename
-                raw.save(self.xdf_filename, overwrite=True)
-                actual_filename = self.xdf_filename
-                file_type = "FIF"
+    def _write_recording_files(self, recorded_samples, recorded_timestamps, xdf_filename) -> str:
+        """Write the FIF annotations and the events CSV for the given markers (no GUI calls, so it can run on `_io_pool`),
+        returning the status message"""
+        import mne  # (heavy; only needed when saving)
 
-            # Also save a CSV for easy reading
+        # Extract messages and timestamps
+        timestamps = recorded_timestamps
+        messages = [sample[0] if sample else '' for sample in recorded_samples]
 
+        # Convert timestamps to relative times (from first sample), kept as arrays (MNE takes them as they are)
+        relative_timestamps = np.asarray(timestamps, dtype=np.float64)
+        if len(relative_timestamps) > 0:
+            relative_timestamps = relative_timestamps - relative_timestamps[0]
 
-            if isinstance(actual_filename, str):
-                actual_filename = Path(actual_filename).resolve()
+        # Create annotations (MNE's way of handling markers/events), with the first sample's time as their origin
+        annotations = mne.Annotations(
+            onset=relative_timestamps,
+            duration=np.zeros_like(relative_timestamps),  # Instantaneous events
+            description=messages,
+            orig_time=float(timestamps[0])
+        )
 
-            _default_CSV_folder = actual_filename.parent.joinpath('CSV')
-            _default_CSV_folder.mkdir(parents=True, exist_ok=True)
-            print(f'_default_CSV_folder: "{_default_CSV_folder}"')
+        # Save only the annotations as FIF (MNE's native format; there is no signal, so no Raw to build and write),
+        # named '<recording>-annot.fif' as MNE expects
+        base_filename = Path(xdf_filename)
+        if base_filename.suffix in ('.xdf', '.fif'):
+            base_filename = base_filename.with_suffix('')
+        actual_filename = base_filename.with_name(f'{base_filename.name}-annot.fif').resolve()
+        annotations.save(actual_filename, overwrite=True)
+        file_type = "FIF annotations"
 
-            csv_filename: str = actual_filename.name.replace('.fif', '_events.csv')
-            csv_filepath: Path = _default_CSV_folder.joinpath(csv_filename).resolve()
+        # Also save a CSV for easy reading
+        _default_CSV_folder = actual_filename.parent.joinpath('CSV')
+        _default_CSV_folder.mkdir(parents=True, exist_ok=True)
+        print(f'_default_CSV_folder: "{_default_CSV_folder}"')
 
-            self.save_events_csv(csv_filepath, messages, timestamps)
+        csv_filename: str = f'{base_filename.name}_events.csv'
+        csv_filepath: Path = _default_CSV_folder.joinpath(csv_filename).resolve()
 
-            _status_str: str = (f"{file_type} file saved: '{actual_filename}'\n"
-                f"Events CSV saved: '{csv_filepath}'\n"
-                f"Recorded {len(self.recorded_data)} samples")
-            self.update_log_display(_status_str, timestamp=None)
-            # messagebox.showinfo("Success", _status_str)
+        self.save_events_csv(csv_filepath, messages, timestamps)
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save file: {str(e)}")
-            print(f"Detailed error: {e}")
-            import traceback
-            traceback.print_exc()
+        _status_str: str = (f"{file_type} file saved: '{actual_filename}'\n"
+            f"Events CSV saved: '{csv_filepath}'\n"
+            f"Recorded {len(timestamps)} samples")
+        return _status_str
 
 
     def save_events_csv(self, csv_filename, messages, timestamps):
         """Save events as CSV for easy reading"""
         try:
-            import csv
-
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Timestamp', 'LSL_Time', 'Message'])
-
-                for i, (message, lsl_time) in enumerate(zip(messages, timestamps)):
-                    # Convert LSL timestamp to readable datetime
-                    readable_time = datetime.fromtimestamp(lsl_time).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-                    writer.writerow([readable_time, lsl_time, message])
+            # Formatted directly rather than through `csv.writer`, producing the same output: "\r\n" line endings, and
+            # messages quoted only when they need it (with the LSL timestamps converted to readable datetimes all at once)
+            readable_times = _format_local_timestamps(timestamps)
+            lsl_times = timestamps.tolist() if isinstance(timestamps, np.ndarray) else timestamps
+            with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_BYTES) as csvfile:
+                csvfile.write('Timestamp,LSL_Time,Message\r\n')
+                csvfile.write(''.join([f'{readable_time},{lsl_time!r},{_csv_quote(message)}\r\n'
+                                       for readable_time, lsl_time, message in zip(readable_times, lsl_times, messages)]))
+                # On disk once closed (a single sync for the file; this runs on `_io_pool` when a recording stops)
+                csvfile.flush()
+                os.fsync(csvfile.fileno())
 
         except Exception as e:
             print(f"Error saving CSV: {e}")
@@ -1434,17 +1729,48 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
         self.text_entry.focus()
 
     def send_lsl_message(self, message):
-        """Send message via LSL"""
-        if self.LiveWhisperTranscriptionAppMixin_outlet:
+        """Send message via LSL (queued for `_lsl_send_loop`, stamped with the LSL time of this call)"""
+        self._lsl_send_queue.put((message, pylsl.local_clock()))
+
+
+    def _lsl_send_loop(self):
+        """Background thread pushing the messages queued by `send_lsl_message` (everything pending per pass). Exits on the
+        `None` sentinel put by `on_closing`."""
+        while True:
+            batch = [self._lsl_send_queue.get()]
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._lsl_send_queue.get_nowait())
+                except queue.Empty:
+                    break
             try:
-                # Send message with timestamp
-                self.LiveWhisperTranscriptionAppMixin_outlet.push_sample([message])
-                print(f"LSL message sent: {message}")
-            except Exception as e:
-                print(f"Error sending LSL message: {e}")
-                messagebox.showerror("LSL Error", f"Failed to send LSL message: {str(e)}")
-        else:
-            print("LSL outlet not available")
+                try:
+                    outlet = self.outlet_LiveWhisperTranscriptionAppMixin
+                except (AttributeError, KeyError):
+                    outlet = None
+                for item in batch:
+                    if item is None:
+                        break
+                    message, timestamp = item
+                    if outlet is None:
+                        print("LSL outlet not available")
+                        continue
+                    try:
+                        # Send message with timestamp
+                        outlet.push_sample([message], timestamp)
+                        print(f"LSL message sent: {message}")
+                    except Exception as e:
+                        print(f"Error sending LSL message: {e}")
+            finally:
+                for _ in batch:
+                    self._lsl_send_queue.task_done()
+            if batch[-1] is None:
+                return
+
+
+    def flush_lsl_messages(self):
+        """Block until every queued LSL message has been pushed"""
+        self._lsl_send_queue.join()
 
     def update_log_display(self, message, timestamp=None):
         """Update the log display area"""
@@ -1454,18 +1780,34 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
         if timestamp is None:
             ## get now as the timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = _now_str()
 
+        self._pending_log_lines.append(f"[{timestamp}] {message}\n")
+        if not self._log_flush_scheduled:
+            try:
+                self.root.after(LOG_DISPLAY_FLUSH_INTERVAL_MS, self._flush_log_display)
+                self._log_flush_scheduled = True
+            except tk.TclError:
+                # GUI is being destroyed, ignore the error
+                pass
+
+    def _flush_log_display(self):
+        """Insert the log lines queued by `update_log_display` with a single widget update"""
+        self._log_flush_scheduled = False
+        lines, self._pending_log_lines = self._pending_log_lines, []
+        if (not lines) or self._shutting_down:
+            return
         try:
-            log_entry = f"[{timestamp}] {message}\n"
-            self.log_display.insert(tk.END, log_entry)
-            self.log_display.see(tk.END)  # Auto-scroll to bottom
+            call, w = self._log_display_call, self._log_display_w
+            call(w, 'insert', 'end', ''.join(lines))
+            call(w, 'see', 'end')  # Auto-scroll to bottom
         except tk.TclError:
             # GUI is being destroyed, ignore the error
             pass
 
     def clear_log_display(self):
         """Clear the log display area"""
+        self._pending_log_lines.clear()
         self.log_display.delete(1.0, tk.END)
 
     def on_closing(self):
@@ -1475,29 +1817,40 @@ class LiveWhisperLoggerApp(LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsing
 
         # Stop transcription if active
         if self.transcription_active:
-            self.stop_live_transcription()
+            self.stop_live_transcription(shutting_down=True)
 
         # Stop recording if active
         if self.recording:
             self.stop_recording()
+        self._recording_active.set()  # wakes the idle recording thread, which exits on `_shutting_down`
+        self._io_pool.shutdown(wait=True)  # (finish saving the stopped recordings)
 
-        # Clean up hotkey
-        try:
-            keyboard.remove_hotkey('ctrl+alt+l')
-        except:
-            pass
+        # Clean up hotkey (only ever registered if `keyboard` was imported)
+        keyboard = sys.modules.get('keyboard')
+        if keyboard is not None:
+            try:
+                keyboard.remove_hotkey('ctrl+alt+l')
+            except:
+                pass
 
         # Clean up system tray
-        if self.system_tray:
-            self.system_tray.stop()
+        self.stop_system_tray()
 
-        # Clean up LSL resources
-        if hasattr(self, 'outlet') and self.LiveWhisperTranscriptionAppMixin_outlet:
-            del self.LiveWhisperTranscriptionAppMixin_outlet
-        if hasattr(self, 'inlet') and self.inlet:
-            del self.inlet
-        if hasattr(self, 'eventboard_outlet') and self.eventboard_outlet:
-            del self.eventboard_outlet
+        # Stop the backup writer (after the remaining chunks, closing the backup files)
+        self._backup_queue.put(None)
+        self._backup_writer_thread.join(timeout=5.0)
+
+        # Stop the LSL sender (after the remaining messages)
+        self._lsl_send_queue.put(None)
+        self._lsl_send_thread.join(timeout=2.0)
+
+        # Clean up LSL resources (dropping the references releases them)
+        try:
+            self.outlet_LiveWhisperTranscriptionAppMixin = None  # (kept in `self.outlets`)
+        except (AttributeError, TypeError):
+            pass
+        self.inlet = None
+        self.eventboard_outlet = None
 
         # Release singleton lock
         self.release_singleton_lock()
@@ -1526,23 +1879,20 @@ def process_text(text):
 
 
 def main():
-    # Check if another instance is already running
-    if LiveWhisperLoggerApp.is_instance_running():
+    # Take the singleton lock before creating the (slow to initialize) Tk root, so a second instance exits right away
+    lock_file = _acquire_lock_file(program_lock_path)
+    if lock_file is None:
+        r = tk.Tk()
+        r.withdraw()
         messagebox.showerror("Instance Already Running",
                             "Another instance of LSL Logger is already running.\n"
-                            "Only one instance can run at a time.")
+                            "Only one instance can run at a time.", parent=r)
+        r.destroy()
         sys.exit(1)
 
     root = tk.Tk()
     app = LiveWhisperLoggerApp(root)
-
-    # Try to acquire the singleton lock
-    if not app.acquire_singleton_lock():
-        messagebox.showerror("Startup Error",
-                            "Failed to acquire singleton lock.\n"
-                            "Another instance may be running.")
-        root.destroy()
-        sys.exit(1)
+    app.acquire_singleton_lock(lock_file)
 
     # # Handle window closing - minimize to tray instead of closing
     # def on_closing():
@@ -1,78 +1,166 @@
 import argparse
+import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, List, Optional, Set
 
 try:
     from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler
+    from watchdog.events import PatternMatchingEventHandler
 except Exception as e:  # pragma: no cover
     Observer = None
-    FileSystemEventHandler = object  # type: ignore
+
+    class PatternMatchingEventHandler:  # type: ignore
+        """Stand-in base for `Handler` when it is only fed by inotify"""
+        def __init__(self, **kwargs):
+            pass
+
+try:
+    from inotify_simple import INotify, flags
+except Exception:  # pragma: no cover
+    INotify = None
 
 from process_recordings import process_recordings
 
 
 VIDEO_EXTS = [".mp4", ".avi", ".mov", ".mkv", ".flv", ".wmv", ".m4v"]
+VIDEO_EXTS_SET = frozenset(VIDEO_EXTS)
 
 
-def is_stable(path: Path, min_age_s: float = 10.0) -> bool:
-    try:
-        stat = path.stat()
-    except FileNotFoundError:
-        return False
-    # file must be older than min_age_s and not growing
-    size1 = stat.st_size
-    t0 = time.time()
-    if t0 - stat.st_mtime < min_age_s:
-        return False
-    time.sleep(1.0)
-    try:
-        size2 = path.stat().st_size
-    except FileNotFoundError:
-        return False
-    return size1 == size2
+STABILITY_SWEEP_INTERVAL_S = 1.0  # how often pending files are checked for being old enough and no longer growing
 
 
-class Handler(FileSystemEventHandler):
+class Handler(PatternMatchingEventHandler):
+    """Queues the video files named by watchdog events, and processes each once it is stable: older than `min_age_s` and the
+    same size on two consecutive sweeps of `_sweep_loop` (so the observer's dispatch thread never sleeps on a file). Files
+    that were closed after writing or moved in are complete already, and are processed right away."""
+
     def __init__(self, recordings_dir: Path, output_dir: Optional[Path], min_age_s: float, cool_down_s: float):
+        # only video files reach the `on_*` callbacks (watchdog matches the patterns before dispatching)
+        super().__init__(patterns=[f"*{e}" for e in VIDEO_EXTS], ignore_directories=True, case_sensitive=False)
         self.recordings_dir = recordings_dir
         self.output_dir = output_dir
         self.min_age_s = min_age_s
         self.cool_down_s = cool_down_s
-        self._recent: Set[Path] = set()
+        # keyed by the path string as given in the events (no `Path` to build and hash per event)
+        self._pending: Dict[str, Optional[int]] = {}  # file -> its size at the last sweep (None before the first)
+        self._processed_at: Dict[str, float] = {}  # file -> when it was last queued for processing (time.monotonic())
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # one file at a time, in the order they became stable
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="process_recordings")
+        self._sweep_thread = threading.Thread(target=self._sweep_loop, daemon=True)
+        self._sweep_thread.start()
 
     def on_created(self, event):  # type: ignore[override]
-        if event.is_directory:
-            return
-        p = Path(event.src_path)
-        if p.suffix.lower() not in [e.lower() for e in VIDEO_EXTS]:
-            return
-        self._maybe_process(p)
+        self._maybe_process(event.src_path)
 
     def on_modified(self, event):  # type: ignore[override]
-        if event.is_directory:
-            return
-        p = Path(event.src_path)
-        if p.suffix.lower() not in [e.lower() for e in VIDEO_EXTS]:
-            return
-        self._maybe_process(p)
-
-    def _maybe_process(self, p: Path):
-        if p in self._recent:
-            return
-        if not is_stable(p, self.min_age_s):
-            return
-        self._recent.add(p)
+        self._maybe_process(event.src_path)
+
+    def on_closed(self, event):  # type: ignore[override]
+        self._maybe_process(event.src_path, assume_stable=True)
+
+    def on_moved(self, event):  # type: ignore[override]
+        # e.g. a recorder renaming its finished temporary file (only the source or destination has to match the patterns)
+        dest_path = os.fsdecode(event.dest_path)
+        if os.path.splitext(dest_path)[1].lower() in VIDEO_EXTS_SET:
+            self._maybe_process(dest_path, assume_stable=True)
+
+    def _maybe_process(self, p: str, assume_stable: bool = False):
+        """Queues `p` for the stability sweep, or with `assume_stable` (the file was closed after writing or moved in, so it
+        is complete) submits it for processing right away"""
+        p = os.fsdecode(p)
+        with self._lock:
+            processed_at = self._processed_at.get(p)
+            if (processed_at is not None) and (time.monotonic() - processed_at < self.cool_down_s):
+                return  # prevent reprocessing for cool_down_s seconds
+            if not assume_stable:
+                self._pending.setdefault(p, None)
+                return
+            self._pending.pop(p, None)
+            self._processed_at[p] = time.monotonic()
+        self._executor.submit(self._process, [Path(p)])
+
+    def _sweep_loop(self):
+        while not self._stop.wait(STABILITY_SWEEP_INTERVAL_S):
+            with self._lock:
+                # forget cool-downs that have run out, so `_processed_at` doesn't grow over a long watch
+                cooled_down = time.monotonic() - self.cool_down_s
+                for p in [p for p, processed_at in self._processed_at.items() if processed_at < cooled_down]:
+                    del self._processed_at[p]
+                pending = list(self._pending.items())
+            if not pending:
+                continue
+            stats = self._stat_files_in_dir({os.path.basename(p) for p, _ in pending})
+            now = time.time()
+            stable_paths = []
+            for p, last_size in pending:
+                stat = stats.get(os.path.basename(p))
+                if stat is None:  # gone
+                    with self._lock:
+                        self._pending.pop(p, None)
+                    continue
+                # file must be older than min_age_s and not growing
+                stable = (now - stat.st_mtime >= self.min_age_s) and (stat.st_size == last_size)
+                with self._lock:
+                    if p not in self._pending:
+                        continue  # already submitted by `_maybe_process` (closed or moved in) since the snapshot
+                    if stable:
+                        del self._pending[p]
+                        self._processed_at[p] = time.monotonic()
+                    else:
+                        self._pending[p] = stat.st_size
+                if stable:
+                    stable_paths.append(Path(p))
+            if stable_paths:
+                # the files that became stable together are transcribed in one call (one model load)
+                self._executor.submit(self._process, stable_paths)
+
+    def _stat_files_in_dir(self, names: Set[str]) -> Dict[str, os.stat_result]:
+        """`stat` of those of `names` that are files in `recordings_dir`, from a single `os.scandir` listing (whose entries
+        already carry the size and mtime on Windows, so no extra call per file there)"""
+        stats = {}
+        try:
+            with os.scandir(self.recordings_dir) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        try:
+                            stats[entry.name] = entry.stat()
+                        except FileNotFoundError:
+                            pass
+        except FileNotFoundError:
+            pass
+        return stats
+
+    def _process(self, paths: List[Path]):
         try:
-            process_recordings(recordings_dir=self.recordings_dir, output_dir=self.output_dir, video_extensions=[p.suffix.lower()])
-        finally:
-            # prevent reprocessing for cool_down_s seconds
-            def _remove_later(path: Path, delay: float):
-                time.sleep(delay)
-                self._recent.discard(path)
-            import threading
-            threading.Thread(target=_remove_later, args=(p, self.cool_down_s), daemon=True).start()
+            process_recordings(recordings_dir=self.recordings_dir, output_dir=self.output_dir, video_extensions=sorted({p.suffix.lower() for p in paths}), only_files=paths)
+        except Exception as e:
+            print(f"Error processing {', '.join(p.name for p in paths)}: {e}")
+
+    def close(self):
+        """Stop sweeping, and wait for the files already queued to be processed"""
+        self._stop.set()
+        self._sweep_thread.join()
+        self._executor.shutdown(wait=True)
+
+
+def _watch_inotify(handler: Handler, recordings_dir: Path):
+    """Feeds `handler` the video files in `recordings_dir` that were closed after writing or moved in, straight from inotify
+    (Linux only). Unlike watchdog, this only wakes up once per finished file, not on every write of a file being recorded,
+    and the files are processed without waiting out the stability sweep."""
+    watched_dir = os.fspath(recordings_dir)
+    with INotify() as ino:
+        ino.add_watch(watched_dir, flags.CLOSE_WRITE | flags.MOVED_TO)
+        while True:
+            for event in ino.read(timeout=1000):
+                if (event.mask & flags.ISDIR) or (os.path.splitext(event.name)[1].lower() not in VIDEO_EXTS_SET):
+                    continue
+                handler._maybe_process(os.path.join(watched_dir, event.name), assume_stable=True)
 
 
 def cli(argv=None):
@@ -87,22 +175,30 @@ def cli(argv=None):
     recordings_dir = Path(args.recordings_dir).resolve()
     output_dir = Path(args.output_dir).resolve() if args.output_dir else None
 
-    if Observer is None:
-        raise RuntimeError("watchdog is not installed. Please install with 'pip install ".[watch]" or 'pip install watchdog'.")
+    use_inotify = (INotify is not None) and sys.platform.startswith("linux")
+    if (Observer is None) and not use_inotify:
+        raise RuntimeError("watchdog is not installed. Please install with 'pip install \".[watch]\"' or 'pip install watchdog'.")
 
     handler = Handler(recordings_dir, output_dir, args.min_age_s, args.cool_down_s)
-    observer = Observer()
-    observer.schedule(handler, recordings_dir.as_posix(), recursive=False)
-    observer.start()
+    observer = None
+    if not use_inotify:
+        observer = Observer()
+        observer.schedule(handler, recordings_dir.as_posix(), recursive=False)
+        observer.start()
     print(f"Watching {recordings_dir.as_posix()} for new videos... Press Ctrl+C to stop.")
     try:
-        while True:
-            time.sleep(1.0)
+        if use_inotify:
+            _watch_inotify(handler, recordings_dir)
+        else:
+            while True:
+                time.sleep(1.0)
     except KeyboardInterrupt:
         pass
     finally:
-        observer.stop()
-        observer.join()
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        handler.close()
 
 
 if __name__ == "__main__":